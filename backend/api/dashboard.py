@@ -3,13 +3,17 @@ BMAD Dash - Dashboard API Endpoint
 GET /api/dashboard - Returns project overview with epics and stories
 Story 5.55: Smart Per-Project Cache Layer
 """
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
+import json
 import os
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import quote
 from ..parsers.bmad_parser import BMADParser
+from ..parsers.story_tokenizer import load_story_document
 from ..utils.error_handler import handle_api_errors
 from ..utils.cache import Cache
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,11 @@ _cache = Cache()
 
 from ..services.project_state_cache import ProjectStateCache
 from ..services.smart_cache import SmartCache
+from ..services.state_store import remove_state_files
+from ..services.evidence_collector import EVIDENCE_FIELDS, summarize_evidence
+from ..services.freshness import FRESHNESS_PARTS
+from ..services.commit_index import commit_key, paginate
+from .git_evidence import commit_page_params
 from ..models.project import Project
 import time
 
@@ -30,6 +39,24 @@ def get_dashboard():
     """
     Returns dashboard data including project overview, breadcrumb, quick_glance, and kanban
     Using ProjectStateCache for performance (Story 5.4)
+
+    With ?progressive=1, a cold project returns its skeleton (epics, stories,
+    statuses) immediately and evidence is streamed from
+    /api/dashboard/evidence-stream as it is collected.
+
+    Responses carry a strong ETag derived from the state generation; a request
+    whose If-None-Match matches gets 304 Not Modified without the response
+    being rebuilt (cache_age_ms and smart_cache stats are then the client's copy).
+
+    Story evidence is a summary (counts, status, last timestamps); commit and
+    test lists come from /api/git-evidence and /api/test-evidence. Use
+    ?fields=commits,test_files to add evidence keys, or ?detail=full for the
+    complete evidence of every story.
+
+    With ?swr=1 (default: BMAD_DASHBOARD_SWR), the response is built from the
+    last known state right away and a background revalidation brings it up to
+    date; `freshness` reports which evidence parts may be stale (see
+    services/freshness.py).
     """
     # Extract and validate project_root parameter
     project_root = request.args.get('project_root')
@@ -40,27 +67,343 @@ def get_dashboard():
     if not os.path.exists(project_root):
         raise FileNotFoundError(f"Project not found: {project_root}")
     
-    # Initialize SmartCache for evidence caching (Story 5.55)
-    smart_cache = SmartCache(project_root)
+    # Long-lived state shared by all requests for this project (with its SmartCache, Story 5.55)
+    state_cache = ProjectStateCache.for_project(project_root)
+    progressive = request.args.get('progressive', '').lower() in ('1', 'true', 'yes')
+    evidence_fields = _evidence_projection()
+
+    if _swr_requested():
+        return _get_dashboard_swr(project_root, state_cache, evidence_fields)
     
-    # Initialize cache service with SmartCache
-    cache_file = os.path.join(project_root, "_bmad-output/implementation-artifacts/project-state.json")
-    state_cache = ProjectStateCache(cache_file, smart_cache=smart_cache)
+    # Coalesced with concurrent requests: one bootstrap/sync runs, the others wait for it
+    state_cache.refresh(project_root, progressive)
+
+    with state_cache.lock:
+        return _get_dashboard_locked(project_root, state_cache, evidence_fields)
+
+
+def _swr_requested() -> bool:
+    """?swr=1/0 if given, else Config.DASHBOARD_SWR"""
+    value = request.args.get('swr', '').lower()
+    if not value:
+        return Config.DASHBOARD_SWR
+    return value in ('1', 'true', 'yes')
+
+
+def _get_dashboard_swr(project_root: str, state_cache: ProjectStateCache,
+                       evidence_fields: Optional[Tuple[str, ...]] = ()):
+    """Stale-while-revalidate dashboard: serve the last known state, refresh in the background"""
+    with state_cache.lock:
+        cold = not state_cache.bootstrap_in_progress and not state_cache.load_if_changed().epics
+    if cold:
+        # Nothing to serve yet: skeleton now, evidence streams in
+        state_cache.refresh(project_root, progressive=True)
+
+    with state_cache.lock:
+        if state_cache.bootstrap_in_progress:
+            parts = {part: {"stale": True, "reason": "bootstrapping", "age_ms": None} for part in FRESHNESS_PARTS}
+        else:
+            parts = state_cache.freshness(project_root).check(state_cache.cache_data)
+
+    stale = [part for part in FRESHNESS_PARTS if parts[part]["stale"]]
+    revalidating = state_cache.bootstrap_in_progress
+    if not revalidating:
+        # Always syncs story files too; only stale evidence parts are re-collected
+        revalidating = state_cache.start_revalidation(project_root, stale) or state_cache.revalidating(project_root)
+    freshness = {
+        "mode": "stale-while-revalidate",
+        "revalidating": revalidating,
+        "parts": parts
+    }
+
+    with state_cache.lock:
+        return _get_dashboard_locked(project_root, state_cache, evidence_fields, freshness)
+
+
+def _evidence_projection() -> Optional[Tuple[str, ...]]:
+    """
+    Evidence projection requested via ?detail= / ?fields=
+
+    Returns:
+        None for full evidence (detail=full), else the extra evidence keys to
+        add to the summary (sorted, possibly empty)
+
+    Raises:
+        ValueError for an unknown detail level or evidence key (the projection
+        becomes part of the ETag and of memo keys, so it must stay bounded)
+    """
+    detail = request.args.get('detail', 'summary').lower()
+    if detail not in ('summary', 'full'):
+        raise ValueError("detail parameter must be 'summary' or 'full'")
+    if detail == 'full':
+        return None
+    fields = {f.strip() for f in request.args.get('fields', '').split(',') if f.strip()}
+    unknown = fields.difference(EVIDENCE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown evidence field(s): {', '.join(sorted(unknown))} "
+                         f"(expected: {', '.join(EVIDENCE_FIELDS)})")
+    return tuple(sorted(fields))
+
+
+def _get_dashboard_locked(project_root: str, state_cache: ProjectStateCache,
+                          evidence_fields: Optional[Tuple[str, ...]] = (),
+                          freshness: Optional[Dict[str, Any]] = None):
+    """Build the dashboard response while holding the shared state cache lock"""
+    state = state_cache.cache_data
+
+    etag = state_cache.etag
+    if evidence_fields != ():
+        # Projections are different representations of the same generation
+        etag += "-full" if evidence_fields is None else "-" + ",".join(evidence_fields)
+    if freshness is not None:
+        # A revalidation that changed nothing still turns stale parts fresh
+        stale = [part for part, report in freshness["parts"].items() if report["stale"]]
+        etag += "-swr:" + (",".join(stale) or "fresh")
+    if request.if_none_match.contains(etag):
+        not_modified = Response(status=304)
+        not_modified.set_etag(etag)
+        not_modified.headers['Cache-Control'] = 'no-cache'
+        return not_modified
+
+    response = _dashboard_payload(project_root, state_cache, state, evidence_fields)
+    if freshness is not None:
+        response["freshness"] = freshness
+
+    http_response = jsonify(response)
+    http_response.set_etag(etag)
+    http_response.headers['Cache-Control'] = 'no-cache'  # Always revalidate; unchanged state costs a 304
+    return http_response, 200
+
+
+def _dashboard_view(project_root: str, state_cache: ProjectStateCache, state,
+                    evidence_fields: Optional[Tuple[str, ...]] = ()) -> Dict[str, Any]:
+    """View model shared by all requests until the state generation changes (read-only)"""
+    root = os.path.abspath(project_root)  # One entry however the client spells the path
+    return state_cache.memoized(
+        ("dashboard", root, evidence_fields),
+        lambda: build_dashboard_view(root, state, evidence_fields)
+    )
+
+
+def _dashboard_payload(project_root: str, state_cache: ProjectStateCache, state,
+                       evidence_fields: Optional[Tuple[str, ...]] = ()) -> Dict[str, Any]:
+    """Full dashboard response: memoized view plus per-request fields"""
+    response = dict(_dashboard_view(project_root, state_cache, state, evidence_fields))  # Per-request fields must not leak into the memo
+    response["project"] = {**response["project"], "root_path": project_root}  # As the request spelled it
+    response["generation"] = state_cache.generation
+    response["epoch"] = state_cache.epoch
     
-    # Load state
-    state = state_cache.load()
+    # Add cache_age_ms
+    try:
+        if os.path.exists(state_cache.cache_file):
+            mtime = os.path.getmtime(state_cache.cache_file)
+            age = (time.time() - mtime) * 1000
+            response["cache_age_ms"] = age
+        else:
+            response["cache_age_ms"] = 0
+    except OSError:
+        response["cache_age_ms"] = 0
     
-    # Bootstrap if cache is empty or has no epics
-    if not state.epics:
-        logger.info("Cache empty or no epics - running bootstrap...")
-        state_cache.bootstrap(project_root)
-        state_cache.save()
-        state = state_cache.cache_data
-    else:
-        # Sync with file system (only re-parses changed stories)
-        state_cache.sync(project_root)
+    # Add smart cache stats (Story 5.55)
+    cache_stats = state_cache.get_cache_stats()
+    if cache_stats:
+        response["smart_cache"] = cache_stats
+
+    if state_cache.bootstrap_in_progress:
+        stream = state_cache.bootstrap_stream
+        response["bootstrap"] = {
+            "in_progress": True,
+            "completed": stream.completed,
+            "total": stream.total,
+            "stream_url": f"/api/dashboard/evidence-stream?project_root={quote(project_root)}"
+        }
+    return response
+
+
+@dashboard_bp.route('/api/dashboard/delta', methods=['GET'])
+@handle_api_errors
+def get_dashboard_delta():
+    """
+    Returns only what changed after a state generation
+
+    Query Parameters:
+        project_root (str): Path to the BMAD project root
+        since (int): `generation` from the last dashboard or delta response
+        epoch (str, optional): `epoch` from that response; a different epoch
+            (server restart, other worker) gets a full snapshot
+        detail, fields (optional): Evidence projection, as for /api/dashboard
+
+    Returns:
+        JSON with generation, epoch and either
+        - full: false, stories (kanban entries plus their column), removed_stories,
+          epics, removed_epics, counts and - if anything changed - breadcrumb,
+          quick_glance and action_card
+        - full: true and snapshot (the /api/dashboard payload) when the change
+          log no longer covers `since`
+    """
+    project_root = request.args.get('project_root')
+
+    if not project_root:
+        raise ValueError("project_root parameter is required")
+
+    if not os.path.exists(project_root):
+        raise FileNotFoundError(f"Project not found: {project_root}")
+
+    try:
+        since = int(request.args.get('since', ''))
+    except ValueError:
+        raise ValueError("since parameter must be an integer generation")
+    epoch = request.args.get('epoch')
+    evidence_fields = _evidence_projection()
+
+    state_cache = ProjectStateCache.for_project(project_root)
+    state_cache.refresh(project_root)
+    with state_cache.lock:
         state = state_cache.cache_data
+        changes = None if epoch and epoch != state_cache.epoch else state_cache.changes_since(since)
+
+        if changes is None:
+            return jsonify({
+                "full": True,
+                "since": since,
+                "generation": state_cache.generation,
+                "epoch": state_cache.epoch,
+                "snapshot": _dashboard_payload(project_root, state_cache, state, evidence_fields)
+            }), 200
+
+        return jsonify(build_dashboard_delta(project_root, state_cache, state, since, changes, evidence_fields)), 200
+
+
+def build_dashboard_delta(project_root: str, state_cache: ProjectStateCache, state, since: int,
+                          changes, evidence_fields: Optional[Tuple[str, ...]] = ()) -> Dict[str, Any]:
+    """
+    Build a delta response from the memoized view
+
+    Args:
+        project_root: Project root as given by the request
+        state_cache: Shared state cache (lock held)
+        state: Current ProjectState
+        since: Generation the client has
+        changes: ChangeSet since that generation
+        evidence_fields: Evidence projection (see _evidence_projection)
+
+    Returns:
+        Delta dictionary (see get_dashboard_delta)
+    """
+    view = _dashboard_view(project_root, state_cache, state, evidence_fields)
+    kanban_index = state_cache.memoized(
+        ("dashboard-kanban-index", os.path.abspath(project_root), evidence_fields),
+        lambda: {
+            entry["story_id"]: (column, entry)
+            for column, entries in view["kanban"].items()
+            for entry in entries
+        }
+    )
+
+    stories = []
+    removed_stories = []
+    epic_keys = set(changes.epic_keys)
+    for story_id in sorted(changes.story_ids, key=sort_story_key):
+        if story_id in kanban_index:
+            column, entry = kanban_index[story_id]
+            stories.append({**entry, "column": column})
+            epic_keys.add(f"epic-{story_id.split('.')[0]}")
+        else:
+            removed_stories.append(story_id)
+
+    epics = []
+    removed_epics = []
+    for epic_key in sorted(epic_keys, key=sort_epic_key):
+        epic = state.epics.get(epic_key)
+        if epic is None:
+            removed_epics.append(epic_key)
+            continue
+        epics.append({
+            "id": epic_key,
+            "epic_id": epic.epic_id,
+            "title": epic.title,
+            "status": epic.status,
+            "progress": epic.progress,
+            "story_ids": [s.story_id for s in epic.stories]
+        })
+
+    delta = {
+        "full": False,
+        "since": since,
+        "generation": state_cache.generation,
+        "epoch": state_cache.epoch,
+        "stories": stories,
+        "removed_stories": removed_stories,
+        "epics": epics,
+        "removed_epics": removed_epics,
+        "counts": {column: len(entries) for column, entries in view["kanban"].items()}
+    }
+    if stories or removed_stories or epics or removed_epics:
+        for key in ("breadcrumb", "quick_glance", "action_card"):
+            delta[key] = view[key]
+    return delta
+
+
+@dashboard_bp.route('/api/dashboard/evidence-stream', methods=['GET'])
+@handle_api_errors
+def stream_bootstrap_evidence():
+    """
+    Server-Sent Events stream of per-story evidence from a progressive bootstrap
+
+    Each event is `data: {"type": "evidence", "story_id", "evidence", "completed", "total"}`
+    with summary evidence as in /api/dashboard; the last one is
+    `{"type": "complete", ...}`. Events carry ids, so a
+    reconnecting EventSource resumes after Last-Event-ID. If no bootstrap is
+    running, only the complete event is sent.
+    """
+    project_root = request.args.get('project_root')
+
+    if not project_root:
+        raise ValueError("project_root parameter is required")
+
+    if not os.path.exists(project_root):
+        raise FileNotFoundError(f"Project not found: {project_root}")
+
+    stream = ProjectStateCache.for_project(project_root).bootstrap_stream
+    try:
+        after = int(request.headers.get('Last-Event-ID') or request.args.get('after') or 0)
+    except ValueError:
+        after = 0
+
+    def generate():
+        if stream is None:
+            yield f"data: {json.dumps({'type': 'complete', 'completed': 0, 'total': 0})}\n\n"
+            return
+        for item in stream.subscribe(after):
+            if item is None:
+                yield ": keep-alive\n\n"
+                continue
+            seq, event = item
+            yield f"id: {seq}\ndata: {json.dumps(event)}\n\n"
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+def build_dashboard_view(project_root: str, state, evidence_fields: Optional[Tuple[str, ...]] = ()) -> Dict[str, Any]:
+    """
+    Link stories into epics and build the state-derived part of the dashboard response
     
+    Args:
+        project_root: Project root as given by the request
+        state: ProjectState (epics' story lists are rebuilt in place)
+        evidence_fields: Extra evidence keys for the story summaries; None for full evidence
+        
+    Returns:
+        Dictionary with project, breadcrumb, quick_glance, kanban, action_card
+        and workflow_validation
+    """
     # Reconstruct Project object linking Epics and Stories
     # ProjectState stores them disconnected after deserialization
     epics_map = state.epics
@@ -103,29 +446,14 @@ def get_dashboard():
     )
     
     # Build dashboard response
-    response = build_dashboard_response(project)
-    
-    # Add cache_age_ms
-    try:
-        if os.path.exists(state_cache.cache_file):
-            mtime = os.path.getmtime(state_cache.cache_file)
-            age = (time.time() - mtime) * 1000
-            response["cache_age_ms"] = age
-        else:
-            response["cache_age_ms"] = 0
-    except OSError:
-        response["cache_age_ms"] = 0
-    
-    # Add smart cache stats (Story 5.55)
-    cache_stats = state_cache.get_cache_stats()
-    if cache_stats:
-        response["smart_cache"] = cache_stats
+    response = build_dashboard_response(project, evidence_fields)
 
     # Add workflow validation status (Story 7.1)
     if state.workflow_validation:
         response["workflow_validation"] = state.workflow_validation
 
-    return jsonify(response), 200
+    return response
+
 
 def sort_story_key(story_id):
     try:
@@ -194,12 +522,13 @@ def _get_current_story_focus(all_stories):
     return None
 
 
-def build_dashboard_response(project) -> Dict[str, Any]:
+def build_dashboard_response(project, evidence_fields: Optional[Tuple[str, ...]] = ()) -> Dict[str, Any]:
     """
     Build complete dashboard response from Project dataclass
     
     Args:
         project: Project dataclass from BMADParser
+        evidence_fields: Extra evidence keys for the story summaries; None for full evidence
         
     Returns:
         Dictionary with project, breadcrumb, quick_glance, and kanban data
@@ -208,7 +537,7 @@ def build_dashboard_response(project) -> Dict[str, Any]:
         "project": build_project_data(project),
         "breadcrumb": build_breadcrumb(project),
         "quick_glance": build_quick_glance(project),
-        "kanban": build_kanban(project),
+        "kanban": build_kanban(project, evidence_fields),
         "action_card": build_action_card(project)
     }
 
@@ -311,8 +640,8 @@ def build_breadcrumb(project) -> Dict[str, Any]:
                 "title": target_story.title
             }
             
-            # Find first todo task
-            for task in target_story.tasks:
+            # Find first todo task (materializes tasks of a lazy story)
+            for task in target_story.with_details().tasks:
                 if task.status == "todo":
                     breadcrumb["task"] = {
                         "id": task.task_id,
@@ -399,21 +728,22 @@ def build_quick_glance(project) -> Dict[str, Any]:
     current_story = _get_current_story_focus(all_stories)
     
     if current_story:
-        # Calculate progress
-        total_tasks = len(current_story.tasks)
-        official_done = len([t for t in current_story.tasks if t.status == "done" and not getattr(t, 'inferred', False)])
-        inferred_done = len([t for t in current_story.tasks if getattr(t, 'inferred', False)])
+        # Calculate progress (materializes tasks of a lazy story)
+        tasks = current_story.with_details().tasks
+        total_tasks = len(tasks)
+        official_done = len([t for t in tasks if t.status == "done" and not getattr(t, 'inferred', False)])
+        inferred_done = len([t for t in tasks if getattr(t, 'inferred', False)])
         done_tasks = official_done + inferred_done
         
         # Find current task (first in-progress, or first todo)
         current_task_title = "No active task"
-        for task in current_story.tasks:
+        for task in tasks:
             if task.status == "in-progress":
                 current_task_title = task.title
                 break
         
         if current_task_title == "No active task":
-            for task in current_story.tasks:
+            for task in tasks:
                 if task.status == "todo":
                     current_task_title = task.title
                     break
@@ -455,7 +785,7 @@ def build_quick_glance(project) -> Dict[str, Any]:
     return quick_glance
 
 
-def build_kanban(project) -> Dict[str, List[Dict[str, Any]]]:
+def build_kanban(project, evidence_fields: Optional[Tuple[str, ...]] = ()) -> Dict[str, List[Dict[str, Any]]]:
     """
     Build kanban board grouping stories by status
     
@@ -467,6 +797,8 @@ def build_kanban(project) -> Dict[str, List[Dict[str, Any]]]:
     
     Args:
         project: Project dataclass
+        evidence_fields: Extra evidence keys added to each story's evidence
+            summary; None embeds the full evidence
         
     Returns:
         Dictionary with todo, in_progress, review, done story lists
@@ -495,8 +827,10 @@ def build_kanban(project) -> Dict[str, List[Dict[str, Any]]]:
                 "epic": story.epic,
                 "status": story.status,
                 "last_updated": story.last_updated if hasattr(story, 'last_updated') else None,
-                "tasks": [task.to_dict() for task in story.tasks],
-                "evidence": story.evidence if hasattr(story, 'evidence') else {}
+                # Lazy stories only carry counters; task items load via the story detail endpoint
+                "tasks": [task.to_dict() for task in story.tasks] if story.details_loaded else [],
+                "task_counts": story.task_progress(),
+                "evidence": _story_evidence(story, evidence_fields)
             }
             
             # Add completed date for done stories
@@ -512,6 +846,14 @@ def build_kanban(project) -> Dict[str, List[Dict[str, Any]]]:
     return kanban
 
 
+def _story_evidence(story, evidence_fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Evidence of a kanban entry: summary plus requested fields, or everything"""
+    evidence = story.evidence if hasattr(story, 'evidence') else {}
+    if evidence_fields is None:
+        return evidence or {}
+    return summarize_evidence(evidence, evidence_fields)
+
+
 def build_action_card(project) -> Dict[str, Any]:
     """
     Build action card with three layers: Story > Task > Command
@@ -616,22 +958,23 @@ def build_action_card(project) -> Dict[str, Any]:
             "acceptance_criteria_summary": ac_summary
         }
         
-        # Layer 2: Task information
-        total_tasks = len(current_story.tasks)
-        done_tasks = len([t for t in current_story.tasks if t.status == "done"])
+        # Layer 2: Task information (materializes tasks of a lazy story)
+        tasks = current_story.with_details().tasks
+        total_tasks = len(tasks)
+        done_tasks = len([t for t in tasks if t.status == "done"])
         
         # Find current task (first in-progress, or first todo)
         current_task = None
         current_task_index = 0
         
-        for i, task in enumerate(current_story.tasks):
+        for i, task in enumerate(tasks):
             if task.status == "in-progress":
                 current_task = task
                 current_task_index = i + 1  # 1-indexed
                 break
         
         if not current_task:
-            for i, task in enumerate(current_story.tasks):
+            for i, task in enumerate(tasks):
                 if task.status == "todo":
                     current_task = task
                     current_task_index = i + 1  # 1-indexed
@@ -701,7 +1044,7 @@ def get_cache_stats():
     if not os.path.exists(project_root):
         raise FileNotFoundError(f"Project not found: {project_root}")
     
-    smart_cache = SmartCache(project_root)
+    smart_cache = SmartCache.for_project(project_root)
     stats = smart_cache.get_cache_stats()
     
     return jsonify(stats), 200
@@ -712,27 +1055,38 @@ def get_cache_stats():
 def get_story_details(story_id):
     """
     Returns full story details (markdown + tasks) for the detail modal.
+
+    Query Parameters:
+        project_root: Path to project root directory (required)
+        limit, cursor, expand: Paginate evidence commits like /api/git-evidence;
+            the page's cursor state is returned in evidence.commits_page
     """
     project_root = request.args.get('project_root')
     if not project_root:
         raise ValueError("project_root parameter is required")
+    if not os.path.exists(project_root):
+        raise FileNotFoundError(f"Project not found: {project_root}")
+    page_params = commit_page_params(request.args)
 
-    smart_cache = SmartCache(project_root)
-    cache_file = os.path.join(project_root, "_bmad-output/implementation-artifacts/project-state.json")
-    state_cache = ProjectStateCache(cache_file, smart_cache=smart_cache)
-    
-    state = state_cache.load()
-    story = state.stories.get(story_id)
-    
-    if not story:
-        raise FileNotFoundError(f"Story {story_id} not found in cache")
+    state_cache = ProjectStateCache.for_project(project_root)
+    with state_cache.lock:
+        state = state_cache.load_if_changed()
+        story = state.stories.get(story_id)
+        
+        if not story:
+            raise FileNotFoundError(f"Story {story_id} not found in cache")
+        
+        # Full task list of a lazy story is loaded into a copy (the cached story stays lazy)
+        tasks = [task.to_dict() for task in story.with_details().tasks]
+        evidence = story.evidence
+        if page_params is not None and evidence:
+            evidence = _paginate_evidence_commits(evidence, *page_params)
     
-    # Load markdown content if file exists
+    # Load markdown content if file exists (shared per-file revision cache)
     content = ""
     if story.file_path and os.path.exists(story.file_path):
         try:
-            with open(story.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = load_story_document(story.file_path).content
         except Exception as e:
             logger.error(f"Error reading story file {story.file_path}: {e}")
             content = f"Error reading story file: {str(e)}"
@@ -741,12 +1095,41 @@ def get_story_details(story_id):
         "story_id": story.story_id,
         "title": story.title,
         "status": story.status,
-        "tasks": [task.to_dict() for task in story.tasks],
+        "tasks": tasks,
         "content": content,
-        "evidence": story.evidence
+        "evidence": evidence
     })
 
 
+def _paginate_evidence_commits(evidence: Dict[str, Any], cursor: Optional[str], limit: int,
+                               expand_files: bool) -> Dict[str, Any]:
+    """
+    Copy of cached story evidence with one page of its commits
+
+    Args:
+        evidence: Story evidence (commits are dicts, newest first)
+        cursor: next_cursor of the previous page (None = first page)
+        limit: Page size
+        expand_files: Keep files_changed on the page's commits
+
+    Returns:
+        Evidence dict whose "commits" is the page and "commits_page" holds
+        total_count, next_cursor and has_more (cursors match /api/git-evidence)
+    """
+    commits = sorted(evidence.get("commits") or [], key=commit_key, reverse=True)
+    page, next_cursor = paginate(commits, commit_key, cursor, limit)
+    if not expand_files:
+        page = [{k: v for k, v in c.items() if k != "files_changed"} for c in page]
+    paged = dict(evidence)
+    paged["commits"] = page
+    paged["commits_page"] = {
+        "total_count": len(commits),
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
+    }
+    return paged
+
+
 @dashboard_bp.route('/api/cache/clear', methods=['POST'])
 @handle_api_errors
 def clear_cache():
@@ -767,14 +1150,14 @@ def clear_cache():
     if not os.path.exists(project_root):
         raise FileNotFoundError(f"Project not found: {project_root}")
     
-    smart_cache = SmartCache(project_root)
+    smart_cache = SmartCache.for_project(project_root)
     smart_cache.clear_project_cache()
     
     # Also clear the project state cache to force a full re-bootstrap (Story 5.55 Fix)
+    # Shared ProjectStateCache instances notice the removal and reload (empty) on next request
     state_cache_file = os.path.join(project_root, "_bmad-output/implementation-artifacts/project-state.json")
-    if os.path.exists(state_cache_file):
-        os.remove(state_cache_file)
-        logger.info(f"Deleted project-state.json for full refresh: {state_cache_file}")
+    if remove_state_files(state_cache_file):
+        logger.info(f"Deleted project state for full refresh: {state_cache_file}")
     
     logger.info(f"Cleared SmartCache for project: {project_root}")
     
@@ -805,7 +1188,7 @@ def invalidate_story_cache(story_id: str):
     if not os.path.exists(project_root):
         raise FileNotFoundError(f"Project not found: {project_root}")
     
-    smart_cache = SmartCache(project_root)
+    smart_cache = SmartCache.for_project(project_root)
     smart_cache.invalidate_story(story_id)
     
     logger.info(f"Invalidated SmartCache for story {story_id} in project: {project_root}")
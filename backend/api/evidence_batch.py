@@ -0,0 +1,54 @@
+"""
+BMAD Dash - Batched Evidence API Endpoint
+POST /api/evidence/batch - Git/test/review evidence for many stories in one request
+"""
+import logging
+from flask import Blueprint, jsonify, request
+from backend.config import Config
+from backend.services.evidence_batch import EVIDENCE_TYPES, EvidenceBatch
+from backend.utils.error_handler import handle_api_errors
+
+logger = logging.getLogger(__name__)
+
+evidence_batch_bp = Blueprint('evidence_batch', __name__)
+
+
+@evidence_batch_bp.route('/api/evidence/batch', methods=['POST'])
+@handle_api_errors
+def post_evidence_batch():
+    """
+    Returns evidence for several stories, answered from one git history walk,
+    one test discovery scan and one artifact index
+
+    JSON Body:
+        project_root: Path to the project repository (required)
+        story_ids: List of story IDs (required, at most Config.EVIDENCE_BATCH_MAX)
+        types: Evidence types, any of "git", "test", "review" (default: all)
+
+    Returns:
+        JSON {"results": {story_id: {type: payload}}, "types": [...]}. Each
+        payload is what the single-story endpoint returns for that story; a
+        failed entry is that endpoint's error body (with its "status" code)
+    """
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        raise ValueError("Request body must be a JSON object")
+
+    project_root = body.get('project_root')
+    if not project_root:
+        raise ValueError("project_root is required")
+
+    story_ids = body.get('story_ids')
+    if not isinstance(story_ids, list) or not all(isinstance(s, str) and s for s in story_ids):
+        raise ValueError("story_ids must be a list of story ID strings")
+    if len(story_ids) > Config.EVIDENCE_BATCH_MAX:
+        raise ValueError(f"At most {Config.EVIDENCE_BATCH_MAX} story_ids per batch")
+
+    types = body.get('types') or list(EVIDENCE_TYPES)
+    if not isinstance(types, list):
+        raise ValueError(f"types must be a list (any of: {', '.join(EVIDENCE_TYPES)})")
+
+    results = EvidenceBatch(project_root).collect(story_ids, types)
+    logger.info(f"Evidence batch for {len(results)} stories ({', '.join(types)})")
+
+    return jsonify({"results": results, "types": list(dict.fromkeys(types))}), 200
@@ -3,15 +3,48 @@ BMAD Dash - Git Evidence API Endpoint
 GET /api/git-evidence/<story_id> - Returns Git commits for a story
 """
 import logging
+from typing import Optional, Tuple
 from flask import Blueprint, jsonify, request
+from backend.config import Config
+from backend.services.commit_index import CommitIndex, decode_cursor
 from backend.services.git_correlator import GitCorrelator
-from backend.models.git_evidence import GitEvidence
+from backend.services.evidence_batch import git_evidence_payload
+from backend.utils.single_flight import flight_key, single_flight
 
 logger = logging.getLogger(__name__)
 
 git_evidence_bp = Blueprint('git_evidence', __name__)
 
 
+def commit_page_params(args) -> Optional[Tuple[Optional[str], int, bool]]:
+    """
+    Commit pagination query parameters (limit, cursor, expand=files)
+
+    Args:
+        args: Request query arguments
+
+    Returns:
+        (cursor, limit, expand_files), or None if neither limit nor cursor
+        was given (the full commit list is requested)
+
+    Raises:
+        ValueError if limit or cursor is invalid
+    """
+    if 'limit' not in args and 'cursor' not in args:
+        return None
+    try:
+        limit = int(args.get('limit', Config.COMMIT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("limit must be an integer")
+    if not 1 <= limit <= Config.COMMIT_PAGE_MAX:
+        raise ValueError(f"limit must be between 1 and {Config.COMMIT_PAGE_MAX}")
+    cursor = args.get('cursor') or None
+    if cursor:
+        decode_cursor(cursor)
+    expand = {part.strip() for part in args.get('expand', '').split(',')}
+    return cursor, limit, 'files' in expand
+
+
 @git_evidence_bp.route('/api/git-evidence/<story_id>', methods=['GET'])
 def get_git_evidence(story_id):
     """
@@ -19,9 +52,13 @@ def get_git_evidence(story_id):
     
     Query Parameters:
         project_root: Path to the project repository
+        limit: Commits per page (optional; enables pagination)
+        cursor: next_cursor of the previous page (optional; enables pagination)
+        expand: "files" to include files_changed for the page's commits
     
     Returns:
-        JSON response with commits, status, and last_commit_time
+        JSON response with commits, status, and last_commit_time. Paginated
+        responses also carry total_count, next_cursor and has_more
     """
     try:
         # Extract project_root from query parameters
@@ -35,27 +72,25 @@ def get_git_evidence(story_id):
                 'status': 400
             }), 400
         
-        # Initialize GitCorrelator
-        correlator = GitCorrelator(project_root)
-        
-        # Get commits for story with fallback to file mtime (NFR22)
-        commits = correlator.get_commits_with_fallback(story_id, project_root)
-        
-        # Calculate status
-        status, last_commit_time = correlator.calculate_status(commits)
+        try:
+            page_params = commit_page_params(request.args)
+        except ValueError as e:
+            return jsonify({
+                'error': 'InvalidParameter',
+                'message': str(e),
+                'details': 'Use limit=1..N and a cursor returned by a previous page',
+                'status': 400
+            }), 400
+        if page_params is not None:
+            return jsonify(_git_evidence_page(story_id, project_root, *page_params)), 200
         
-        # Build GitEvidence response
-        evidence = GitEvidence(
-            story_id=story_id,
-            commits=commits
+        # Concurrent requests for the same story share one history walk
+        response = single_flight.do(
+            flight_key(project_root, "git-evidence", story_id),
+            lambda: _git_evidence(story_id, project_root)
         )
         
-        # Convert to dict and add status info
-        response = evidence.to_dict()
-        response['status'] = status
-        response['last_commit_time'] = last_commit_time.isoformat() if last_commit_time else None
-        
-        logger.info(f"Git evidence retrieved for story {story_id}: {len(commits)} commits, status={status}")
+        logger.info(f"Git evidence retrieved for story {story_id}: {len(response['commits'])} commits, status={response['status']}")
         
         return jsonify(response), 200
         
@@ -67,3 +102,41 @@ def get_git_evidence(story_id):
             'details': str(e),
             'status': 500
         }), 500
+
+
+def _git_evidence(story_id: str, project_root: str) -> dict:
+    """Full Git evidence for a story"""
+    # Initialize GitCorrelator
+    correlator = GitCorrelator(project_root)
+
+    # Get commits for story with fallback to file mtime (NFR22)
+    commits = correlator.get_commits_with_fallback(story_id, project_root)
+
+    # Build GitEvidence response with status info
+    return git_evidence_payload(correlator, story_id, commits)
+
+
+def _git_evidence_page(story_id: str, project_root: str, cursor: Optional[str], limit: int,
+                       expand_files: bool) -> dict:
+    """One page of a story's commits, served from the shared CommitIndex"""
+    index = CommitIndex.for_project(project_root)
+    commits = index.commits_for_story(story_id)
+    if commits:
+        response = index.page(story_id, cursor, limit, expand_files)
+    else:
+        # File mtime fallback (NFR22) is a single synthetic commit
+        commits = index.correlator.get_commits_with_fallback(story_id, project_root, commits=[])
+        response = {
+            'commits': [index.commit_dict(c, expand_files) for c in commits] if not cursor else [],
+            'total_count': len(commits),
+            'next_cursor': None,
+            'has_more': False
+        }
+
+    status, last_commit_time = index.correlator.calculate_status(commits)
+    response['story_id'] = story_id
+    response['status'] = status
+    response['last_commit_time'] = last_commit_time.isoformat() if last_commit_time else None
+
+    logger.info(f"Git evidence page for story {story_id}: {len(response['commits'])}/{response['total_count']} commits")
+    return response
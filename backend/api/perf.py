@@ -0,0 +1,49 @@
+"""
+BMAD Dash - Performance Report API Endpoint
+GET /api/perf/bootstrap - Per-phase timings of recent bootstrap and sync runs
+"""
+import logging
+from flask import Blueprint, jsonify, request
+from backend.utils.error_handler import handle_api_errors
+from backend.utils.perf import perf_log
+from backend.utils.single_flight import single_flight
+from backend.config import Config
+from backend.services.refresh_scheduler import RefreshScheduler
+
+logger = logging.getLogger(__name__)
+
+perf_bp = Blueprint('perf', __name__)
+
+RUN_KINDS = ("bootstrap", "sync", "revalidate")
+
+
+@perf_bp.route('/api/perf/bootstrap', methods=['GET'])
+@handle_api_errors
+def get_bootstrap_perf():
+    """
+    Returns the last runs recorded in this process, newest first
+
+    Query Parameters:
+        kind: "bootstrap", "sync" or "revalidate" (optional, default: all)
+        project_root: Only runs for this project (optional)
+
+    Returns:
+        JSON {"runs": {kind: [report, ...]}, "history_size": N, "single_flight"}.
+        Each report has total_ms, phases ({name: {calls, total_ms, max_ms}})
+        and the slowest per-story outliers; single_flight counts, per
+        coalesced operation, the executions and the callers that shared one;
+        with BMAD_REFRESH_SCHEDULER on, "scheduler" has each project's
+        background refresh schedule
+    """
+    kind = request.args.get('kind')
+    if kind and kind not in RUN_KINDS:
+        raise ValueError(f"kind must be one of: {', '.join(RUN_KINDS)}")
+
+    runs = perf_log.snapshot(kind, request.args.get('project_root'))
+    for run_kind in ([kind] if kind else RUN_KINDS):
+        runs.setdefault(run_kind, [])
+
+    report = {"runs": runs, "history_size": perf_log.size, "single_flight": single_flight.stats()}
+    if Config.REFRESH_SCHEDULER:
+        report["scheduler"] = RefreshScheduler.shared().stats()
+    return jsonify(report), 200
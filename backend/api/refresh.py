@@ -9,6 +9,7 @@ import logging
 
 # Import the shared cache instance from dashboard
 from backend.api.dashboard import _cache
+from backend.services.state_store import remove_state_files
 
 refresh_bp = Blueprint('refresh', __name__)
 logger = logging.getLogger(__name__)
@@ -38,13 +39,10 @@ def refresh():
         }), 400
         
     try:
-        # Delete project-state.json to force full bootstrap on next request
+        # Delete project-state.json (and the SQLite state, if used) to force full bootstrap on next request
         import os
         cache_file = os.path.join(project_root, "_bmad-output/implementation-artifacts/project-state.json")
-        deleted = False
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
-            deleted = True
+        deleted = remove_state_files(cache_file)
             
         # Also clear legacy cache if it exists (for safety)
         if _cache:
@@ -2,10 +2,10 @@
 BMAD Dash - Review Evidence API Endpoint
 GET /api/review-evidence/<story_id> - Checks for code review artifacts
 """
-import os
-import glob
 import logging
 from flask import Blueprint, jsonify, request
+from backend.services.evidence_batch import review_evidence_payload
+from backend.utils.artifact_index import ArtifactIndex
 
 logger = logging.getLogger(__name__)
 
@@ -18,21 +18,8 @@ def get_review_evidence(story_id):
         if not project_root:
             return jsonify({'error': 'MissingParameter', 'message': 'project_root required'}), 400
             
-        # Normalize story ID (e.g. "1.3" -> "1-3")
-        normalized = story_id.replace('.', '-')
-        
-        # Look for code-review-*.md in artifacts
-        pattern = os.path.join(project_root, "_bmad-output", "implementation-artifacts", f"code-review-{normalized}.md")
-        matches = glob.glob(pattern)
-        
-        if matches:
-            return jsonify({
-                'status': 'reviewed',
-                'file': os.path.basename(matches[0]),
-                'path': matches[0]
-            })
-        
-        return jsonify({'status': 'pending'})
+        # Look for code-review-X-Y.md in artifacts
+        return jsonify(review_evidence_payload(ArtifactIndex.for_project(project_root), story_id))
         
     except Exception as e:
         logger.error(f"Error checking review evidence: {e}")
@@ -4,13 +4,11 @@ GET /api/test-evidence/<story_id> - Returns test results for a story
 """
 import logging
 import time
-import os
-import glob
 import re
 from flask import Blueprint, jsonify, request
 from backend.services.test_discoverer import TestDiscoverer
-from backend.utils.story_test_parser import parse_test_counts_from_story_file
-from backend.models.test_evidence import TestEvidence
+from backend.services.evidence_batch import story_test_evidence
+from backend.utils.artifact_index import ArtifactIndex
 
 logger = logging.getLogger(__name__)
 
@@ -55,23 +53,8 @@ def _check_story_exists(story_id: str, project_root: str) -> bool:
     if not normalized:
         return False
 
-    # Convert "1.3" to "1-3" for filename
-    story_key = normalized.replace('.', '-')
-
-    # Common story file locations
-    possible_paths = [
-        os.path.join(project_root, "_bmad-output", "implementation-artifacts", f"{story_key}-*.md"),
-        os.path.join(project_root, "_bmad-output", "implementation", f"{story_key}-*.md"),
-        os.path.join(project_root, "stories", f"{story_key}-*.md"),
-    ]
-
-    # Try to find story file
-    for pattern in possible_paths:
-        matches = glob.glob(pattern)
-        if matches:
-            return True
-
-    return False
+    # Story file locations: implementation-artifacts, implementation, stories
+    return ArtifactIndex.for_project(project_root).story_file(normalized) is not None
 
 
 @test_evidence_bp.route('/api/test-evidence/<story_id>', methods=['GET'])
@@ -113,26 +96,8 @@ def get_test_evidence(story_id):
         # Initialize TestDiscoverer
         discoverer = TestDiscoverer(project_root)
 
-        # Get test evidence for story
-        evidence = discoverer.get_test_evidence_for_story(story_id, project_root)
-
-        # If no tests were found or all counts are 0, try parsing from story file
-        if evidence.pass_count == 0 and evidence.fail_count == 0:
-            logger.info(f"No test execution results for story {story_id}, attempting to parse from story file")
-            parsed_counts = parse_test_counts_from_story_file(story_id, project_root)
-
-            if parsed_counts:
-                # Create new evidence with parsed counts
-                evidence = TestEvidence(
-                    story_id=story_id,
-                    test_files=[],
-                    pass_count=parsed_counts["pass_count"],
-                    fail_count=parsed_counts["fail_count"],
-                    failing_test_names=[],
-                    last_run_time=None,
-                    status=parsed_counts["status"]
-                )
-                logger.info(f"Using parsed test counts from story file: {parsed_counts['pass_count']}/{parsed_counts['total_tests']}")
+        # Get test evidence for story (falls back to counts in the story file)
+        evidence = story_test_evidence(discoverer, story_id, project_root)
 
         # Convert to dict for JSON response
         response = evidence.to_dict()
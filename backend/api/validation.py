@@ -8,6 +8,7 @@ GET /api/validate-story/<story_id> - Returns validation result for a specific st
 import logging
 from flask import Blueprint, jsonify, request
 from backend.services.validation_service import ValidationService
+from backend.utils.single_flight import flight_key, single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +30,11 @@ def get_workflow_gaps():
         # Extract project_root from query parameters
         project_root = request.args.get('project_root', '.')
 
-        # Initialize ValidationService
-        validation_service = ValidationService(project_root)
-
-        # Detect workflow gaps
-        gaps = validation_service.detect_workflow_gaps()
+        # Detect workflow gaps (concurrent requests share one run)
+        gaps = single_flight.do(
+            flight_key(project_root, "workflow-gaps"),
+            lambda: ValidationService(project_root).detect_workflow_gaps()
+        )
 
         logger.info(f"Workflow gaps detected: {len(gaps)} stories with gaps")
 
@@ -67,11 +68,11 @@ def validate_story(story_id):
         # Extract project_root from query parameters
         project_root = request.args.get('project_root', '.')
 
-        # Initialize ValidationService
-        validation_service = ValidationService(project_root)
-
-        # Validate story
-        validation_result = validation_service.validate_story(story_id)
+        # Validate story (concurrent requests share one git scan and test run)
+        validation_result = single_flight.do(
+            flight_key(project_root, "validation", story_id),
+            lambda: ValidationService(project_root).validate_story(story_id)
+        )
 
         logger.info(f"Story {story_id} validated: is_complete={validation_result.is_complete}")
 
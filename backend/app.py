@@ -44,6 +44,10 @@ def create_app():
     from backend.api.review_evidence import review_evidence_bp
     app.register_blueprint(review_evidence_bp)
 
+    # Register batched evidence blueprint (many stories per request)
+    from backend.api.evidence_batch import evidence_batch_bp
+    app.register_blueprint(evidence_batch_bp)
+
     # Register Refresh blueprint (Story 3.3)
     from backend.api.refresh import refresh_bp
     app.register_blueprint(refresh_bp)
@@ -60,6 +64,10 @@ def create_app():
     from backend.api.bmad_sync import bmad_sync_bp
     app.register_blueprint(bmad_sync_bp)
 
+    # Register Performance report blueprint (bootstrap/sync timings)
+    from backend.api.perf import perf_bp
+    app.register_blueprint(perf_bp)
+
     @app.route('/')
     def index():
         return app.send_static_file('index.html')
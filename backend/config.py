@@ -17,6 +17,59 @@ class Config:
     BMAD_ARTIFACTS_PATH = os.getenv('BMAD_ARTIFACTS_PATH', '_bmad-output')
     CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', '300'))  # 5 minutes default
     
+    # Lazy story mode: keep only task counters in project state, load task lists on demand
+    LAZY_STORIES = os.getenv('BMAD_LAZY_STORIES', 'False').lower() == 'true'
+    
+    # Project state storage backend: "json" (project-state.json) or "sqlite" (project-state.db, WAL)
+    STATE_BACKEND = os.getenv('BMAD_STATE_BACKEND', 'json').lower()
+    
+    # SmartCache write-behind: batch evidence writes, flush after debounce (seconds) or at shutdown
+    SMART_CACHE_WRITE_BEHIND = os.getenv('BMAD_SMART_CACHE_WRITE_BEHIND', 'False').lower() == 'true'
+    SMART_CACHE_FLUSH_INTERVAL = float(os.getenv('BMAD_SMART_CACHE_FLUSH_INTERVAL', '2.0'))
+    
+    # File watcher driving incremental sync: off, auto (watchdog if installed, else polling), polling
+    FILE_WATCHER = os.getenv('BMAD_FILE_WATCHER', 'off').lower()
+    WATCH_POLL_INTERVAL = float(os.getenv('BMAD_WATCH_POLL_INTERVAL', '1.0'))
+    
+    # Thread pool size for bootstrap evidence collection (git/test lookups per story); 1 = sequential
+    EVIDENCE_WORKERS = int(os.getenv('BMAD_EVIDENCE_WORKERS', '8'))
+    
+    # Most story IDs accepted by one POST /api/evidence/batch request
+    EVIDENCE_BATCH_MAX = int(os.getenv('BMAD_EVIDENCE_BATCH_MAX', '200'))
+    
+    # Commit pages served by /api/git-evidence and /api/dashboard/story (?limit=, ?cursor=)
+    COMMIT_PAGE_SIZE = int(os.getenv('BMAD_COMMIT_PAGE_SIZE', '20'))
+    COMMIT_PAGE_MAX = int(os.getenv('BMAD_COMMIT_PAGE_MAX', '200'))
+    
+    # Stale-while-revalidate /api/dashboard (or ?swr=1): answer from the last known state, refresh stale evidence in the background
+    DASHBOARD_SWR = os.getenv('BMAD_DASHBOARD_SWR', 'False').lower() == 'true'
+    TEST_EVIDENCE_TTL = float(os.getenv('BMAD_TEST_EVIDENCE_TTL', '300'))  # Seconds; 0 = only on test file changes
+    
+    # Background evidence refresh of in-progress/review stories (seconds; jitter is a fraction of the interval)
+    REFRESH_SCHEDULER = os.getenv('BMAD_REFRESH_SCHEDULER', 'False').lower() == 'true'
+    REFRESH_INTERVAL = float(os.getenv('BMAD_REFRESH_INTERVAL', '60'))
+    REFRESH_JITTER = float(os.getenv('BMAD_REFRESH_JITTER', '0.2'))
+    REFRESH_MAX_BACKOFF = float(os.getenv('BMAD_REFRESH_MAX_BACKOFF', '900'))
+    # Budget shared by all projects: concurrent refreshes, and share of wall time spent refreshing
+    REFRESH_MAX_CONCURRENT = int(os.getenv('BMAD_REFRESH_MAX_CONCURRENT', '1'))
+    REFRESH_CPU_BUDGET = float(os.getenv('BMAD_REFRESH_CPU_BUDGET', '0.25'))
+    
+    # Bootstrap/sync timing reports kept per run kind (see /api/perf/bootstrap)
+    PERF_HISTORY = int(os.getenv('BMAD_PERF_HISTORY', '20'))
+    
+    # State generations kept in the change log for /api/dashboard/delta (older ones get a full snapshot)
+    CHANGE_LOG_SIZE = int(os.getenv('BMAD_CHANGE_LOG_SIZE', '256'))
+    
+    # Seconds to wait for the advisory lock on a cache file (shared across workers/CLI)
+    LOCK_TIMEOUT = float(os.getenv('BMAD_LOCK_TIMEOUT', '5.0'))
+    
+    # Cache file codec: auto (orjson if installed, else json), json, orjson, msgpack, msgpack+zstd
+    CACHE_CODEC = os.getenv('BMAD_CACHE_CODEC', 'auto').lower()
+    
+    # SmartCache file layout: "json" (single document) or "indexed" (per-story offsets, lazy reads)
+    SMART_CACHE_LAYOUT = os.getenv('BMAD_SMART_CACHE_LAYOUT', 'json').lower()
+    SMART_CACHE_MMAP = os.getenv('BMAD_SMART_CACHE_MMAP', 'True').lower() == 'true'
+    
     # AI Coach settings
     BMAD_DOCS_URL = os.getenv('BMAD_DOCS_URL', 'http://docs.bmad-method.org')
     BMAD_REPO_URL = os.getenv('BMAD_REPO_URL', 'https://github.com/bmad-code-org/BMAD-METHOD/archive/refs/heads/main.zip')
@@ -19,13 +19,13 @@ class Epic:
     stories: List['Story'] = field(default_factory=list)
     progress: Dict[str, int] = field(default_factory=lambda: {"total": 0, "done": 0})
     
-    def to_dict(self) -> dict:
+    def to_dict(self, include_tasks: bool = True) -> dict:
         """Serialize to dictionary for JSON responses"""
         return {
             "epic_id": self.epic_id,
             "title": self.title,
             "status": self.status,
-            "stories": [story.to_dict() for story in self.stories],
+            "stories": [story.to_dict(include_tasks=include_tasks) for story in self.stories],
             "progress": self.progress
         }
     
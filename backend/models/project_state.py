@@ -18,16 +18,35 @@ class ProjectState:
     stories: Dict[str, Story] = field(default_factory=dict)
     version: str = "1.0"
     workflow_validation: Dict[str, Any] = field(default_factory=dict)
+    # sprint-status.yaml snapshot used by sync to diff development_status
+    sprint_status_mtime: float = 0.0
+    development_status: Dict[str, str] = field(default_factory=dict)
+    # In-memory change counter set by ProjectStateCache (not serialized, see ProjectStateCache.etag)
+    generation: int = field(default=0, compare=False)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize complete project state to dictionary"""
+    def to_dict(self, include_story_details: bool = True) -> Dict[str, Any]:
+        """
+        Serialize complete project state to dictionary
+
+        Args:
+            include_story_details: Include full task lists. When False stories are
+                written with task counters only (lazy story mode)
+        """
         return {
             "version": self.version,
             "project": self.project,
             "current": self.current,
-            "epics": {k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self.epics.items()},
-            "stories": {k: v.to_dict() if hasattr(v, 'to_dict') else v for k, v in self.stories.items()},
-            "workflow_validation": self.workflow_validation
+            "epics": {
+                k: v.to_dict(include_tasks=include_story_details) if hasattr(v, 'to_dict') else v
+                for k, v in self.epics.items()
+            },
+            "stories": {
+                k: v.to_dict(include_tasks=include_story_details) if hasattr(v, 'to_dict') else v
+                for k, v in self.stories.items()
+            },
+            "workflow_validation": self.workflow_validation,
+            "sprint_status_mtime": self.sprint_status_mtime,
+            "development_status": self.development_status
         }
 
     @classmethod
@@ -57,5 +76,7 @@ class ProjectState:
             epics=epics,
             stories=stories,
             version=data.get("version", "1.0"),
-            workflow_validation=data.get("workflow_validation", {})
+            workflow_validation=data.get("workflow_validation", {}),
+            sprint_status_mtime=data.get("sprint_status_mtime", 0.0),
+            development_status=data.get("development_status", {})
         )
@@ -1,6 +1,7 @@
 """
 BMAD Dash - Story Data Model
 """
+import copy
 from dataclasses import dataclass, field
 from typing import List, Optional, TYPE_CHECKING, Dict, Any
 
@@ -23,16 +24,98 @@ class Story:
     completed: Optional[str] = None  # ISO date if done
     file_path: str = ""
     mtime: float = 0.0
+    file_fingerprint: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)  # mtime_ns/size/hash
     workflow_history: List[Dict[str, Any]] = field(default_factory=list)  # Workflow execution history
     gaps: List[Dict[str, Any]] = field(default_factory=list)  # Detected workflow gaps
     last_updated: Optional[str] = None  # ISO date from frontmatter
     evidence: Dict[str, Any] = field(default_factory=dict)
+    # Lazy story mode: tasks are not materialized until load_details() is called
+    details_loaded: bool = field(default=True, compare=False, repr=False)
+    task_counts: Dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
     
-    def to_dict(self) -> dict:
-        """Serialize to dictionary for JSON responses"""
+    def task_progress(self) -> Dict[str, Any]:
+        """
+        Task counters without requiring the full task list
+        
+        Returns:
+            Dict with done, total, inferred counts and inferred_ids
+        """
+        if not self.details_loaded:
+            return {
+                "done": self.task_counts.get("done", 0),
+                "total": self.task_counts.get("total", 0),
+                "inferred": self.task_counts.get("inferred", 0),
+                "inferred_ids": list(self.task_counts.get("inferred_ids", []))
+            }
+        inferred_ids = [t.task_id for t in self.tasks if t.inferred]
+        return {
+            "done": sum(1 for t in self.tasks if t.status == "done"),
+            "total": len(self.tasks),
+            "inferred": len(inferred_ids),
+            "inferred_ids": inferred_ids
+        }
+    
+    def load_details(self) -> 'Story':
+        """
+        Materialize the full task list of a lazy story from the story file
+        (served from the per-file tokenizer cache) and re-apply inferred task state
+        """
+        if self.details_loaded:
+            return self
+        
+        from .task import Task
+        from ..parsers.markdown_parser import MarkdownParser
+        from ..parsers.story_tokenizer import load_story_document
+        
+        tasks = []
+        if self.file_path:
+            try:
+                document = load_story_document(self.file_path)
+                body = MarkdownParser.parse_sections(document.sections)
+                tasks = [Task.from_dict(t) for t in body.get("tasks", [])]
+            except (OSError, UnicodeDecodeError):
+                tasks = []
+        
+        inferred_ids = set(self.task_counts.get("inferred_ids", []))
+        for task in tasks:
+            if task.task_id in inferred_ids and task.status != "done":
+                task.status = "done"
+                task.inferred = True
+        
+        self.tasks = tasks
+        self.details_loaded = True
+        return self
+    
+    def with_details(self) -> 'Story':
+        """
+        The story with its task list materialized, for read paths: itself if
+        already loaded, otherwise a loaded copy, so a shared lazy story in the
+        cached project state is never modified by a read
+        """
+        if self.details_loaded:
+            return self
+        return copy.copy(self).load_details()
+    
+    def unload_details(self):
+        """Drop the task list, keeping only counters (lazy story mode)"""
+        if not self.details_loaded:
+            return
+        self.task_counts = self.task_progress()
+        self.tasks = []
+        self.details_loaded = False
+    
+    def to_dict(self, include_tasks: bool = True) -> dict:
+        """
+        Serialize to dictionary for JSON responses
+        
+        Args:
+            include_tasks: Include full task items. When False only task counters
+                are written (lazy story mode)
+        """
         # Calculate task stats
-        total_tasks = len(self.tasks)
-        done_tasks = sum(1 for t in self.tasks if t.status == "done")
+        tasks = self.task_progress()
+        if include_tasks and self.details_loaded:
+            tasks["items"] = [task.to_dict() for task in self.tasks]
         
         return {
             "story_id": self.story_id,
@@ -40,16 +123,13 @@ class Story:
             "title": self.title,
             "status": self.status,
             "epic": self.epic,
-            "tasks": {
-                "done": done_tasks,
-                "total": total_tasks,
-                "items": [task.to_dict() for task in self.tasks]
-            },
+            "tasks": tasks,
             "evidence": self.evidence,
             "created": self.created,
             "completed": self.completed,
             "file_path": self.file_path,
             "mtime": self.mtime,
+            "file_fingerprint": self.file_fingerprint,
             "workflow_history": self.workflow_history,
             "gaps": self.gaps,
             "last_updated": self.last_updated
@@ -61,9 +141,15 @@ class Story:
         from .task import Task
         
         tasks_data = data.get("tasks", [])
+        details_loaded = True
+        task_counts = {}
         if isinstance(tasks_data, dict):
             # Handle new object format
             tasks_list = tasks_data.get("items", [])
+            if "items" not in tasks_data and tasks_data.get("total", 0) > 0:
+                # Summary-only entry written in lazy story mode
+                details_loaded = False
+                task_counts = {k: v for k, v in tasks_data.items() if k != "items"}
         else:
             # Handle legacy list format
             tasks_list = tasks_data
@@ -80,7 +166,10 @@ class Story:
             completed=data.get("completed"),
             file_path=data.get("file_path", ""),
             mtime=data.get("mtime", 0.0),
+            file_fingerprint=data.get("file_fingerprint") or {},
             workflow_history=data.get("workflow_history", []),
             gaps=data.get("gaps", []),
-            last_updated=data.get("last_updated")
+            last_updated=data.get("last_updated"),
+            details_loaded=details_loaded,
+            task_counts=task_counts
         )
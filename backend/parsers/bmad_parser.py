@@ -3,7 +3,6 @@ BMAD Dash - Main BMAD Artifact Parser
 Coordinates parsing of BMAD artifacts (epics, stories, sprint-status)
 """
 import os
-import glob
 import re
 from typing import Optional
 from ..models.project import Project
@@ -12,9 +11,12 @@ from ..models.story import Story
 from ..models.task import Task
 from .yaml_parser import YAMLParser
 from .markdown_parser import MarkdownParser
+from .story_tokenizer import load_story_document
 from ..services.phase_detector import PhaseDetector
 from ..services.git_correlator import GitCorrelator
 from ..utils.cache import Cache
+from ..utils.artifact_index import ArtifactIndex
+from ..utils import content_hash
 
 
 # Gap severity constants
@@ -121,20 +123,13 @@ class BMADParser:
         Returns:
             List of Epic dataclasses
         """
-        import re
-        
         # Group entries by epic
         epic_map = {}  # epic_num -> {status, stories: []}
         
         for key, status in dev_status.items():
-            # Skip retrospective entries
-            if 'retrospective' in key:
-                continue
-            
             # Check if this is an epic entry (e.g., "epic-0")
-            epic_match = re.match(r'^epic-(\d+)$', key)
-            if epic_match:
-                epic_num = int(epic_match.group(1))
+            epic_num = self.epic_entry(key)
+            if epic_num is not None:
                 if epic_num not in epic_map:
                     epic_map[epic_num] = {'status': status, 'stories': []}
                 else:
@@ -142,22 +137,13 @@ class BMADParser:
                 continue
             
             # Check if this is a story entry (e.g., "2-4-evidence-badges")
-            story_match = re.match(r'^(\d+)-(\d+)-(.+)$', key)
-            if story_match:
-                epic_num = int(story_match.group(1))
-                story_num = int(story_match.group(2))
-                story_slug = story_match.group(3)
-                
+            story_data = self.story_entry(key, status)
+            if story_data:
+                epic_num = story_data['epic']
                 if epic_num not in epic_map:
                     epic_map[epic_num] = {'status': 'backlog', 'stories': []}
                 
-                epic_map[epic_num]['stories'].append({
-                    'story_key': key,
-                    'story_id': f"{epic_num}.{story_num}",
-                    'epic': epic_num,
-                    'status': status,
-                    'title': story_slug.replace('-', ' ').title()
-                })
+                epic_map[epic_num]['stories'].append(story_data)
         
         # Build Epic objects
         epics = []
@@ -186,6 +172,69 @@ class BMADParser:
         
         return epics
     
+    def read_development_status(self) -> Optional[dict]:
+        """
+        Read the flat development_status map from sprint-status.yaml
+        
+        Returns:
+            development_status dict, or None if the file is missing, invalid
+            or uses the nested epics format
+        """
+        sprint_status_path = os.path.join(self.implementation_artifacts, "sprint-status.yaml")
+        if not os.path.exists(sprint_status_path):
+            return None
+        
+        with open(sprint_status_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        parsed = YAMLParser.parse_yaml_file(content, sprint_status_path)
+        if 'error' in parsed:
+            return None
+        
+        dev_status = parsed.get('development_status')
+        return dict(dev_status) if isinstance(dev_status, dict) and dev_status else None
+    
+    @staticmethod
+    def epic_entry(key: str) -> Optional[int]:
+        """
+        Epic number for a development_status epic key (e.g., "epic-2" -> 2)
+        
+        Returns:
+            Epic number or None if key is not an epic entry
+        """
+        match = re.match(r'^epic-(\d+)$', key)
+        return int(match.group(1)) if match else None
+    
+    @staticmethod
+    def story_entry(key: str, status: str) -> Optional[dict]:
+        """
+        Story data for a development_status story key (e.g., "2-4-evidence-badges")
+        
+        Args:
+            key: development_status key
+            status: development_status value
+            
+        Returns:
+            Story dict for _parse_story_file, or None if key is not a story entry
+            (retrospective entries are skipped)
+        """
+        if 'retrospective' in key:
+            return None
+        
+        match = re.match(r'^(\d+)-(\d+)-(.+)$', key)
+        if not match:
+            return None
+        
+        epic_num = int(match.group(1))
+        story_num = int(match.group(2))
+        return {
+            'story_key': key,
+            'story_id': f"{epic_num}.{story_num}",
+            'epic': epic_num,
+            'status': status,
+            'title': match.group(3).replace('-', ' ').title()
+        }
+    
     def _build_epic(self, epic_data: dict) -> Optional[Epic]:
         """
         Build Epic dataclass from sprint-status epic data
@@ -285,16 +334,18 @@ class BMADParser:
         
         # Parse story file
         try:
-            with open(story_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = load_story_document(story_path)
             
             # Parse frontmatter
-            parsed = YAMLParser.parse_frontmatter(content, story_path)
+            parsed = YAMLParser.parse_frontmatter(document.content, story_path)
             frontmatter = parsed.get('frontmatter', {})
-            markdown_content = parsed.get('content', '')
             
-            # Parse markdown content for tasks
-            markdown_data = MarkdownParser.parse_content(markdown_content)
+            # Parse markdown content for tasks (reuse the shared tokenized sections
+            # unless the frontmatter was malformed and the split differs)
+            if 'error' in parsed:
+                markdown_data = MarkdownParser.parse_content(parsed.get('content', ''))
+            else:
+                markdown_data = MarkdownParser.parse_sections(document.sections)
             task_dicts = markdown_data.get('tasks', [])
             
             # Convert task dicts to Task dataclasses
@@ -322,6 +373,7 @@ class BMADParser:
                 completed=frontmatter.get('completed'),
                 file_path=story_path,
                 mtime=mtime,
+                file_fingerprint=content_hash.fingerprint(story_path) or {},
                 workflow_history=workflow_history,
                 gaps=gaps,
                 last_updated=frontmatter.get('last_updated')
@@ -357,14 +409,8 @@ class BMADParser:
         Returns:
             List of story file paths
         """
-        if not os.path.exists(self.implementation_artifacts):
-            return []
-        
         # Pattern: X-Y-story-name.md where X is epic and Y is story number
-        pattern = os.path.join(self.implementation_artifacts, "*-*-*.md")
-        story_files = glob.glob(pattern)
-        
-        return story_files
+        return ArtifactIndex.for_project(self.root_path).story_files()
     
     def _extract_workflow_history(self, frontmatter: dict, story_id: str = None, story_path: str = None) -> list:
         """
@@ -431,18 +477,13 @@ class BMADParser:
             import yaml
             from pathlib import Path
 
-            # Convert story_id to file pattern (e.g., "1.3" -> "code-review-1-3.md")
-            story_file_id = story_id.replace('.', '-')
-            code_review_pattern = f"code-review-{story_file_id}.md"
-
-            # Look for code review file in implementation-artifacts
-            artifacts_dir = os.path.join(self.root_path, '_bmad-output', 'implementation-artifacts')
-            code_review_path = os.path.join(artifacts_dir, code_review_pattern)
+            # Look up code-review-X-Y.md in implementation-artifacts (e.g., "1.3" -> "code-review-1-3.md")
+            code_review_path = ArtifactIndex.for_project(self.root_path).code_review_file(story_id)
 
             workflows = []
 
             # Check if code review file exists
-            if os.path.exists(code_review_path):
+            if code_review_path:
                 # Parse the code review file to get metadata
                 with open(code_review_path, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -558,6 +599,32 @@ class BMADParser:
             print(f"Error extracting workflow history from Git: {e}")
             return []
     
+    @staticmethod
+    def executed_workflows(workflow_history: list) -> set:
+        """
+        Normalized names of workflows present in a workflow history
+        
+        Args:
+            workflow_history: List of workflow execution records (dicts or strings)
+            
+        Returns:
+            Set of workflow names without the 'bmad-bmm-workflows-' prefix
+        """
+        executed = set()
+        for wf in workflow_history or []:
+            if isinstance(wf, dict):
+                # Handle dict entries (from frontmatter or git logs)
+                wf_name = wf.get('name') or wf.get('workflow') or ''
+            elif isinstance(wf, str):
+                # Handle string entries
+                wf_name = wf
+            else:
+                wf_name = ''
+            
+            if wf_name:
+                executed.add(wf_name.replace('bmad-bmm-workflows-', ''))
+        return executed
+    
     def _detect_gaps(self, frontmatter: dict, workflow_history: list, story_path: str = None) -> list:
         """
         Detect workflow gaps based on story status and workflow history
@@ -565,35 +632,22 @@ class BMADParser:
         Gap Detection Rules:
         1. Story is "done" but no "dev-story" workflow was run
         2. "dev-story" is complete but no "code-review" was executed
-        3. "code-review" is done but 0 passing tests found (test-gap)
+        
+        The evidence-based test gap ("code-review" done but 0 passing tests) is
+        detected after evidence collection by GapDetector, so parsing never runs
+        test discovery.
         
         Args:
             frontmatter: Parsed YAML frontmatter dictionary
             workflow_history: List of workflow execution records
-            story_path: Path to story file for test evidence lookup
+            story_path: Path to story file (unused, kept for compatibility)
             
         Returns:
             List of gap dictionaries with type, message, and suggested command
         """
         gaps = []
         status = frontmatter.get('status', '')
-        
-        # Create a set of workflow names for quick lookup
-        executed_workflows = set()
-        for wf in workflow_history:
-            if isinstance(wf, dict):
-                # Handle dict entries (from frontmatter or git logs)
-                wf_name = wf.get('name') or wf.get('workflow') or ''
-            elif isinstance(wf, str):
-                # Handle string entries
-                wf_name = wf
-            else:
-                wf_name = ''
-            
-            if wf_name:
-                # Normalize: remove 'bmad-bmm-workflows-' prefix if present
-                clean_name = wf_name.replace('bmad-bmm-workflows-', '')
-                executed_workflows.add(clean_name)
+        executed_workflows = self.executed_workflows(workflow_history)
         
         # Gap 1: Story is "done" but no "dev-story" workflow was run
         if status == 'done' and 'dev-story' not in executed_workflows:
@@ -613,78 +667,8 @@ class BMADParser:
                 'severity': GAP_SEVERITY_MEDIUM
             })
         
-        # Gap 3: "code-review" is done but 0 passing tests found (test-gap)
-        # This requires actual test evidence verification
-        if status == 'done' and 'code-review' in executed_workflows:
-            # Check test evidence to verify if 0 tests are passing
-            test_gap_detected = self._check_test_gap(story_path)
-            
-            if test_gap_detected:
-                gaps.append({
-                    'type': 'test-gap',
-                    'message': '⚠️ Critical: No passing tests found',
-                    'suggested_command': 'npx bmad-method run dev-story',
-                    'severity': GAP_SEVERITY_HIGH
-                })
-        
         return gaps
     
-    def _check_test_gap(self, story_path: str = None) -> bool:
-        """
-        Check if there are 0 passing tests for the story
-        
-        Args:
-            story_path: Path to story file
-            
-        Returns:
-            True if 0 passing tests detected, False otherwise
-        """
-        if not story_path:
-            return False
-        
-        try:
-            # Import test discovery service
-            from ..services.test_discoverer import TestDiscoverer
-            from ..utils.story_test_parser import parse_test_counts_from_story_file
-
-            # Extract story ID from story path
-            story_id = None
-            match = re.search(r'(\d+)-(\d+)-', story_path)
-            if match:
-                story_id = f"{match.group(1)}.{match.group(2)}"
-
-            if not story_id:
-                return False
-
-            # Discover test files for this story
-            discoverer = TestDiscoverer(self.root_path)
-            test_files = discoverer.discover_tests_for_story(story_id)
-
-            # If test files found, count tests
-            if test_files:
-                # Use static count for gap detection to avoid running tests during parse
-                total_tests = 0
-                for tf in test_files:
-                    total_tests += discoverer.count_tests_static(tf)
-
-                # Return True if 0 tests are found
-                return total_tests == 0
-
-            # No test files found - check for manual test evidence in story file
-            manual_counts = parse_test_counts_from_story_file(story_id, self.root_path)
-            if manual_counts and manual_counts.get('total_tests', 0) > 0:
-                # Manual test evidence found - no gap
-                return False
-
-            # No test files AND no manual evidence - this is a gap
-            return True
-            
-        except Exception as e:
-            # If we can't check test evidence, don't add a gap
-            # (better to have false negative than false positive)
-            print(f"Warning: Could not check test gap for {story_path}: {e}")
-            return False
-    
     def invalidate_cache(self):
         """Invalidate all cached data"""
         self.cache.invalidate_all()
@@ -3,7 +3,7 @@ BMAD Dash - Markdown Content Parser
 Parses markdown content sections from BMAD artifacts
 """
 from typing import Dict, Any, List
-import re
+from .story_tokenizer import StoryTokenizer, StorySections
 
 
 class MarkdownParser:
@@ -33,121 +33,69 @@ class MarkdownParser:
                 "headings": []
             }
         
-        tasks = MarkdownParser._extract_tasks(content)
-        acceptance_criteria = MarkdownParser._extract_acceptance_criteria(content)
-        headings = MarkdownParser._extract_headings(content)
+        sections = StoryTokenizer.tokenize(content, detect_frontmatter=False)
+        return MarkdownParser.parse_sections(sections)
+    
+    @staticmethod
+    def parse_sections(sections: StorySections) -> Dict[str, Any]:
+        """
+        Builds the parse_content result from an already tokenized story
         
+        Args:
+            sections: StorySections from StoryTokenizer (e.g. a cached StoryDocument)
+            
+        Returns:
+            Same dictionary shape as parse_content
+        """
         return {
-            "tasks": tasks,
-            "acceptance_criteria": acceptance_criteria,
-            "headings": headings
+            "tasks": MarkdownParser._extract_tasks(sections),
+            "acceptance_criteria": list(sections.acceptance_criteria),
+            "headings": MarkdownParser._extract_headings(sections)
         }
     
     @staticmethod
-    def _extract_tasks(content: str) -> List[Dict[str, Any]]:
+    def _extract_tasks(sections: StorySections) -> List[Dict[str, Any]]:
         """
-        Extract tasks from markdown content
+        Extract tasks from tokenized checkbox items
         Supports:
         - [ ] Unchecked task
         - [x] Checked task
         - Nested subtasks (indented)
         """
         tasks = []
-        lines = content.split('\n')
         current_task = None
-        task_counter = 1
         
-        for i, line in enumerate(lines):
-            line = line.strip('\r') # Handle CRLF
-            # Match top-level tasks (allow up to 2 spaces of indentation)
-            task_match = re.match(r'^[-*]\s+\[([ xX])\]\s+(.+)$', line)
+        for item in sections.checkboxes:
+            status = 'done' if item.checked else 'todo'
             
-            if task_match:
-                # Save previous task if exists
-                if current_task:
-                    tasks.append(current_task)
-                    task_counter += 1
-                
-                # Create new task
-                status = 'done' if task_match.group(1).lower() == 'x' else 'todo'
-                title = task_match.group(2).strip()
-                
+            if item.indent == 0:
+                # Top-level task
                 current_task = {
-                    "task_id": f"task-{task_counter}",
-                    "title": title,
+                    "task_id": f"task-{len(tasks) + 1}",
+                    "title": item.text,
                     "status": status,
                     "subtasks": []
                 }
-            
-            # Match subtasks (indented with spaces or tabs)
+                tasks.append(current_task)
             elif current_task:
-                subtask_match = re.match(r'^\s+[-*]\s+\[([ xX])\]\s+(.+)$', line)
-                if subtask_match:
-                    subtask_status = 'done' if subtask_match.group(1).lower() == 'x' else 'todo'
-                    subtask_text = subtask_match.group(2).strip()
-                    current_task["subtasks"].append({
-                        "text": subtask_text,
-                        "status": subtask_status
-                    })
-
-        
-        # Don't forget the last task
-        if current_task:
-            tasks.append(current_task)
+                # Indented items belong to the preceding top-level task
+                current_task["subtasks"].append({
+                    "text": item.text,
+                    "status": status
+                })
         
         return tasks
     
     @staticmethod
-    def _extract_acceptance_criteria(content: str) -> List[str]:
-        """
-        Extract acceptance criteria from markdown content
-        Looks for "Acceptance Criteria" section and extracts bullet points
-        """
-        criteria = []
-        lines = content.split('\n')
-        in_criteria_section = False
-        
-        for line in lines:
-            # Check if we're entering the Acceptance Criteria section
-            if re.match(r'^#+\s*Acceptance\s+Criteria', line, re.IGNORECASE):
-                in_criteria_section = True
-                continue
-            
-            # Check if we've hit another section
-            if in_criteria_section and re.match(r'^#+\s+', line):
-                in_criteria_section = False
-                continue
-            
-            # Extract criteria (starts with Given/When/Then/And or bullet points)
-            if in_criteria_section:
-                # Match Given/When/Then/And patterns
-                criteria_match = re.match(r'^\*\*(?:Given|When|Then|And)\*\*\s+(.+)$', line.strip())
-                if criteria_match:
-                    criteria.append(line.strip())
-                # Also match plain bullet points
-                elif re.match(r'^[-*]\s+', line.strip()):
-                    criteria.append(line.strip())
-        
-        return criteria
-    
-    @staticmethod
-    def _extract_headings(content: str) -> List[Dict[str, Any]]:
+    def _extract_headings(sections: StorySections) -> List[Dict[str, Any]]:
         """
         Extract all markdown headings for structure tracking
         """
-        headings = []
-        lines = content.split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                text = heading_match.group(2).strip()
-                headings.append({
-                    "level": level,
-                    "text": text,
-                    "line": line_num
-                })
-        
-        return headings
-
+        return [
+            {
+                "level": heading.level,
+                "text": heading.text,
+                "line": heading.line
+            }
+            for heading in sections.headings
+        ]
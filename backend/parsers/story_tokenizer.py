@@ -0,0 +1,292 @@
+"""
+BMAD Dash - Story Section Tokenizer
+Single-pass tokenizer that turns story markdown into a section tree
+(headings, checkbox items, acceptance criteria, test count lines).
+
+Shared by MarkdownParser, StoryDetailFetcher and the story test count parser
+so a story body is scanned once per file revision instead of once per consumer.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+CHECKBOX_RE = re.compile(r'^(\s*)[-*]\s+\[([ xX])\]\s+(.+)$')
+BULLET_RE = re.compile(r'^[-*]\s+')
+GIVEN_WHEN_THEN_RE = re.compile(r'^\*\*(?:Given|When|Then|And)\*\*\s+(.+)$')
+AC_SECTION_RE = re.compile(r'^#+\s*Acceptance\s+Criteria', re.IGNORECASE)
+SECTION_END_RE = re.compile(r'^#+\s+')
+
+# Test count patterns in priority order (first pattern with a match wins)
+TEST_COUNT_PATTERNS = [
+    re.compile(r'(\d+)/(\d+)\s+passing', re.IGNORECASE),           # "22/22 passing"
+    re.compile(r'passing\s*\((\d+)/(\d+)', re.IGNORECASE),         # "passing (22/22 tests)"
+    re.compile(r'Tests?:\s*(\d+)/(\d+)', re.IGNORECASE),           # "Tests: 22/22"
+    re.compile(r'Test Results?:\s*(\d+)/(\d+)', re.IGNORECASE),    # "Test Results: 22/22"
+    re.compile(r'All\s+(\d+)\s+tests?\s+passing', re.IGNORECASE),  # "All 101 tests passing"
+    re.compile(r'(\d+)\s+tests?,\s*all passing', re.IGNORECASE),   # "22 tests, all passing"
+]
+
+# Maximum number of tokenized files kept in memory
+DOCUMENT_CACHE_SIZE = 512
+
+
+@dataclass
+class Heading:
+    """A markdown heading and the extent of the section it opens"""
+    level: int
+    text: str
+    line: int  # 1-based line number within the body
+    end_line: int = 0  # 1-based line number where the section ends (exclusive)
+    parent: int = -1  # Index of enclosing heading, -1 for top level
+
+
+@dataclass
+class CheckboxItem:
+    """A markdown checkbox list item ("- [x] text")"""
+    checked: bool
+    text: str
+    indent: int  # Leading whitespace width, 0 for top-level items
+    line: int
+    heading: int = -1  # Index of the enclosing heading, -1 if none
+
+
+@dataclass
+class TestCountLine:
+    """A line reporting test counts (e.g. "Tests: 22/22 passing")"""
+    pattern: int  # Index into TEST_COUNT_PATTERNS
+    pass_count: int
+    total: int
+    line: int
+
+
+@dataclass
+class StorySections:
+    """
+    Section tree produced by StoryTokenizer.tokenize
+    """
+    lines: List[str] = field(default_factory=list)
+    headings: List[Heading] = field(default_factory=list)
+    checkboxes: List[CheckboxItem] = field(default_factory=list)
+    acceptance_criteria: List[str] = field(default_factory=list)
+    test_counts: List[TestCountLine] = field(default_factory=list)
+
+    def find_heading(self, predicate: Callable[[Heading], bool], start: int = 0) -> int:
+        """Return index of the first heading matching predicate, or -1"""
+        for i in range(start, len(self.headings)):
+            if predicate(self.headings[i]):
+                return i
+        return -1
+
+    def children(self, index: int) -> List[int]:
+        """Return indices of all headings nested inside heading `index`"""
+        heading = self.headings[index]
+        return [
+            i for i in range(index + 1, len(self.headings))
+            if self.headings[i].line < heading.end_line
+        ]
+
+    def section_lines(self, index: int, own_text_only: bool = False) -> List[str]:
+        """
+        Lines belonging to a heading's section (heading line excluded)
+
+        Args:
+            index: Heading index
+            own_text_only: Stop at the first nested heading instead of the section end
+        """
+        heading = self.headings[index]
+        end = heading.end_line
+        if own_text_only and index + 1 < len(self.headings):
+            end = min(end, self.headings[index + 1].line)
+        return self.lines[heading.line:end - 1]
+
+    def section_text(self, index: int) -> str:
+        """Section body as a single string"""
+        return '\n'.join(self.section_lines(index))
+
+    def checkboxes_in(self, index: int) -> List[CheckboxItem]:
+        """Checkbox items inside a heading's section (including nested sections)"""
+        heading = self.headings[index]
+        return [c for c in self.checkboxes if heading.line < c.line < heading.end_line]
+
+    def best_test_count(self) -> Optional[TestCountLine]:
+        """Highest-priority test count line (lowest pattern index, first occurrence)"""
+        if not self.test_counts:
+            return None
+        return min(self.test_counts, key=lambda t: (t.pattern, t.line))
+
+
+@dataclass
+class StoryDocument:
+    """A tokenized story file"""
+    path: str
+    content: str
+    sections: StorySections
+    revision: Tuple[int, int] = (0, 0)  # (mtime_ns, size)
+
+
+class StoryTokenizer:
+    """
+    Linear, line-based tokenizer for story markdown
+    """
+
+    @staticmethod
+    def tokenize(content: str, detect_frontmatter: bool = True) -> StorySections:
+        """
+        Tokenize markdown content in a single pass
+
+        Args:
+            content: Markdown content
+            detect_frontmatter: Skip a leading "---" YAML block for structural
+                tokens (test count lines are still collected from it)
+
+        Returns:
+            StorySections with headings, checkboxes, AC lines and test counts
+        """
+        sections = StorySections()
+        if not content:
+            return sections
+
+        raw_lines = content.split('\n')
+        in_frontmatter = detect_frontmatter and raw_lines[0].rstrip() == '---'
+        body_start = 0
+        in_ac_section = False
+        heading_stack: List[int] = []
+        seen_patterns = set()
+
+        for raw_index, raw in enumerate(raw_lines):
+            line = raw.rstrip('\r')
+
+            # Test count lines are collected from the whole file, frontmatter included
+            if len(seen_patterns) < len(TEST_COUNT_PATTERNS):
+                lowered = line.lower()
+                if 'pass' in lowered or 'test' in lowered:
+                    for p_index, pattern in enumerate(TEST_COUNT_PATTERNS):
+                        if p_index in seen_patterns:
+                            continue
+                        match = pattern.search(line)
+                        if match:
+                            seen_patterns.add(p_index)
+                            passing = int(match.group(1))
+                            total = int(match.group(2)) if len(match.groups()) == 2 else passing
+                            sections.test_counts.append(TestCountLine(
+                                pattern=p_index,
+                                pass_count=passing,
+                                total=total,
+                                line=raw_index + 1
+                            ))
+
+            if in_frontmatter:
+                if raw_index > 0 and line.rstrip() == '---':
+                    in_frontmatter = False
+                    body_start = raw_index + 1
+                continue
+
+            sections.lines.append(line)
+            line_num = raw_index - body_start + 1
+
+            if line.startswith('#'):
+                # Acceptance Criteria section boundaries (heading-agnostic match)
+                if AC_SECTION_RE.match(line):
+                    in_ac_section = True
+                elif in_ac_section and SECTION_END_RE.match(line):
+                    in_ac_section = False
+
+                heading_match = HEADING_RE.match(line)
+                if heading_match:
+                    level = len(heading_match.group(1))
+                    # Close sections at the same or deeper level
+                    while heading_stack and sections.headings[heading_stack[-1]].level >= level:
+                        sections.headings[heading_stack.pop()].end_line = line_num
+                    sections.headings.append(Heading(
+                        level=level,
+                        text=heading_match.group(2).strip(),
+                        line=line_num,
+                        parent=heading_stack[-1] if heading_stack else -1
+                    ))
+                    heading_stack.append(len(sections.headings) - 1)
+                continue
+
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            checkbox_match = CHECKBOX_RE.match(line)
+            if checkbox_match:
+                sections.checkboxes.append(CheckboxItem(
+                    checked=checkbox_match.group(2).lower() == 'x',
+                    text=checkbox_match.group(3).strip(),
+                    indent=len(checkbox_match.group(1)),
+                    line=line_num,
+                    heading=heading_stack[-1] if heading_stack else -1
+                ))
+
+            if in_ac_section and (GIVEN_WHEN_THEN_RE.match(stripped) or BULLET_RE.match(stripped)):
+                sections.acceptance_criteria.append(stripped)
+
+        if in_frontmatter:
+            # No closing delimiter: the whole file is markdown
+            return StoryTokenizer.tokenize(content, detect_frontmatter=False)
+
+        end_line = len(sections.lines) + 1
+        for index in heading_stack:
+            sections.headings[index].end_line = end_line
+
+        return sections
+
+
+_document_cache: "OrderedDict[str, StoryDocument]" = OrderedDict()
+_document_cache_lock = threading.Lock()
+
+
+def load_story_document(path: str) -> StoryDocument:
+    """
+    Read and tokenize a story file, reusing the cached result while the
+    file revision (mtime_ns, size) is unchanged
+
+    Args:
+        path: Path to the story markdown file
+
+    Returns:
+        StoryDocument for the current file revision
+
+    Raises:
+        OSError if the file cannot be read (invalid UTF-8 bytes are replaced, not raised)
+    """
+    stat = os.stat(path)
+    revision = (stat.st_mtime_ns, stat.st_size)
+
+    with _document_cache_lock:
+        cached = _document_cache.get(path)
+        if cached and cached.revision == revision:
+            _document_cache.move_to_end(path)
+            return cached
+
+    # A stray non-UTF-8 byte (pasted log output, legacy encodings) must not hide the whole story
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+
+    document = StoryDocument(
+        path=path,
+        content=content,
+        sections=StoryTokenizer.tokenize(content),
+        revision=revision
+    )
+
+    with _document_cache_lock:
+        _document_cache[path] = document
+        _document_cache.move_to_end(path)
+        while len(_document_cache) > DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+
+    return document
+
+
+def clear_document_cache():
+    """Drop all cached story documents"""
+    with _document_cache_lock:
+        _document_cache.clear()
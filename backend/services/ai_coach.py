@@ -44,8 +44,7 @@ class AICoach:
         # Initialize ProjectStateCache (Story 5.4)
         self.project_state_cache = None
         if project_root:
-            cache_file = os.path.join(project_root, "_bmad-output/implementation-artifacts/project-state.json")
-            self.project_state_cache = ProjectStateCache(cache_file)
+            self.project_state_cache = ProjectStateCache.for_project(project_root)
 
         # Initialize StoryDetailFetcher for detailed story lookups
         self.story_detail_fetcher = StoryDetailFetcher(project_root) if project_root else None
@@ -264,7 +263,7 @@ class AICoach:
             return system_prompt
 
         # Fetch detailed story information
-        story_details = self.story_detail_fetcher.get_story_details(story_id)
+        story_details = self.story_detail_fetcher.get_story_details(story_id, include_raw_content=False)
         if not story_details:
             return system_prompt
 
@@ -362,24 +361,23 @@ class AICoach:
             
             if not self.project_state_cache or normalized_effective != current_cache_root:
                 try:
-                   cache_dir = os.path.join(effective_root, "_bmad-output", "implementation-artifacts")
-                   cache_file = os.path.join(cache_dir, "project-state.json")
-                   logger.info(f"AI Coach initializing ProjectStateCache for root: {effective_root}")
-                   self.project_state_cache = ProjectStateCache(cache_file)
+                   logger.info(f"AI Coach using shared ProjectStateCache for root: {effective_root}")
+                   self.project_state_cache = ProjectStateCache.for_project(effective_root)
                 except Exception as ex:
                    logger.error(f"AI Coach failed to init cache for {effective_root}: {ex}")
 
         if self.project_state_cache and effective_root:
             try:
-                # Ensure data is loaded from file first
-                if self.project_state_cache.cache_data is None:
-                    self.project_state_cache.load()
-
                 # Sync to ensure we satisfy "all epics, all stories" requirement
-                self.project_state_cache.sync(effective_root)
-                state = self.project_state_cache.cache_data
+                # (coalesced with concurrent dashboard requests)
+                self.project_state_cache.refresh(effective_root)
+
+                # Shared with dashboard requests: read under the cache lock
+                with self.project_state_cache.lock:
+                    state = self.project_state_cache.cache_data
+                    summary = self.project_state_cache.summarize_for_ai() if state else ""
                 if state:
-                    project_state_context = f"\n\nPROJECT STATE SUMMARY:\n{self.project_state_cache.summarize_for_ai()}"
+                    project_state_context = f"\n\nPROJECT STATE SUMMARY:\n{summary}"
                     logger.info(f"AI Coach injected summary size: {len(project_state_context)} chars")
 
                     # Check workflow validation status
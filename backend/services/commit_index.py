@@ -0,0 +1,233 @@
+"""
+BMAD Dash - Git Commit Index
+Per-project index of recent commit metadata, rebuilt only when HEAD moves, that
+serves cursor-paginated per-story commit lists (/api/git-evidence?limit=)
+
+Commits are ordered newest first by (commit time, sha). A cursor names the last
+commit of a page, so paging stays stable while new commits land on top. File
+lists need a diff per commit, so they are only computed for the commits of a
+page that asks for them, and memoized by sha (commits are immutable).
+"""
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ..models.git_evidence import GitCommit
+from .git_correlator import GitCorrelator
+
+logger = logging.getLogger(__name__)
+
+# History window indexed per project (same as GitCorrelator.get_commits_for_story)
+MAX_INDEXED_COMMITS = 1000
+
+T = TypeVar("T")
+CursorKey = Tuple[int, str]
+
+
+def _epoch(timestamp: Any) -> int:
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return int(timestamp.timestamp())
+
+
+def commit_key(commit: Any) -> CursorKey:
+    """(epoch seconds, sha) ordering key of a GitCommit or commit dict"""
+    if isinstance(commit, dict):
+        return _epoch(commit.get("timestamp")), commit.get("sha", "")
+    return _epoch(commit.timestamp), commit.sha
+
+
+def encode_cursor(key: CursorKey) -> str:
+    return f"{key[0]}.{key[1]}"
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """
+    Parse a cursor produced by encode_cursor
+
+    Raises:
+        ValueError if the cursor is malformed
+    """
+    epoch, sep, sha = (cursor or "").partition(".")
+    if not sep or not sha or not epoch.lstrip("-").isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(epoch), sha
+
+
+def paginate(items: Sequence[T], key: Callable[[T], CursorKey], cursor: Optional[str],
+             limit: int) -> Tuple[List[T], Optional[str]]:
+    """
+    One page of items sorted newest first by key
+
+    Args:
+        items: Items in descending key order
+        key: Ordering key of an item
+        cursor: Cursor returned with the previous page (None = first page)
+        limit: Page size
+
+    Returns:
+        (page, next_cursor) - next_cursor is None on the last page
+
+    Raises:
+        ValueError if the cursor is malformed
+    """
+    start = 0
+    if cursor:
+        after = decode_cursor(cursor)
+        start = next((i for i, item in enumerate(items) if key(item) < after), len(items))
+    page = list(items[start:start + limit])
+    has_more = start + len(page) < len(items)
+    return page, (encode_cursor(key(page[-1])) if has_more and page else None)
+
+
+class CommitIndex:
+    """
+    Commit metadata of a project's recent history, matched per story on demand
+
+    Usage:
+        index = CommitIndex.for_project(project_root)
+        commits = index.commits_for_story("5.4")          # all, newest first
+        page = index.page("5.4", cursor=None, limit=20, expand_files=True)
+
+    The history window is re-read only when HEAD changes; per-story matches
+    are memoized for the current HEAD.
+    """
+
+    _instances: Dict[str, "CommitIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, project_root: str):
+        """
+        Args:
+            project_root: Path to project root directory
+        """
+        self.project_root = project_root
+        self.correlator = GitCorrelator(project_root)
+        self._lock = threading.Lock()  # GitPython repos are not thread-safe
+        self._head: Optional[str] = None
+        self._commits: List[GitCommit] = []
+        self._by_story: Dict[str, List[GitCommit]] = {}
+        self._files: Dict[str, List[str]] = {}
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "CommitIndex":
+        """
+        Shared index for a project root (one per process)
+
+        Args:
+            project_root: Path to project root directory
+
+        Returns:
+            CommitIndex instance
+        """
+        key = os.path.abspath(project_root)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls(project_root)
+                cls._instances[key] = index
+            return index
+
+    def commits_for_story(self, story_id: str) -> List[GitCommit]:
+        """
+        Commits matching a story (GitCorrelator matching rules), newest first
+
+        Args:
+            story_id: Story identifier (e.g., "1.3", "story-1.3")
+
+        Returns:
+            GitCommit objects without file lists (see files_changed)
+        """
+        with self._lock:
+            self._refresh()
+            commits = self._by_story.get(story_id)
+            if commits is None:
+                patterns = self.correlator._build_story_patterns(story_id)
+                commits = [c for c in self._commits if self.correlator._matches_story(c.message, patterns)]
+                self._by_story[story_id] = commits
+            return commits
+
+    def files_changed(self, sha: str) -> List[str]:
+        """Files changed by a commit (memoized per sha)"""
+        with self._lock:
+            files = self._files.get(sha)
+            if files is None:
+                try:
+                    stats = self.correlator.repo.commit(sha).stats.files
+                    files = list(stats.keys()) if stats else []
+                except Exception as e:
+                    logger.warning(f"Could not read files changed by {sha}: {e}")
+                    return []
+                self._files[sha] = files
+            return files
+
+    def page(self, story_id: str, cursor: Optional[str] = None, limit: int = 20,
+             expand_files: bool = False) -> Dict[str, Any]:
+        """
+        One page of a story's commits
+
+        Args:
+            story_id: Story identifier
+            cursor: next_cursor of the previous page (None = first page)
+            limit: Page size
+            expand_files: Include files_changed for the commits of this page
+
+        Returns:
+            {"commits", "total_count", "next_cursor", "has_more"}
+
+        Raises:
+            ValueError if the cursor is malformed
+        """
+        commits = self.commits_for_story(story_id)
+        page, next_cursor = paginate(commits, commit_key, cursor, limit)
+        return {
+            "commits": [self.commit_dict(c, expand_files) for c in page],
+            "total_count": len(commits),
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None
+        }
+
+    def commit_dict(self, commit: GitCommit, expand_files: bool = False) -> Dict[str, Any]:
+        """GitCommit as JSON dict, with files_changed only when expanded"""
+        data = commit.to_dict()
+        if not expand_files:
+            data.pop("files_changed", None)
+        elif not commit.files_changed:
+            data["files_changed"] = self.files_changed(commit.sha)
+        return data
+
+    def _refresh(self):
+        """Re-read the history window if HEAD moved (caller holds the lock)"""
+        repo = self.correlator.repo
+        if repo is None:
+            return
+        try:
+            head = repo.head.commit.hexsha
+        except Exception:
+            head = None  # Empty repository or detached/broken HEAD
+        if head == self._head:
+            return
+
+        commits: List[GitCommit] = []
+        if head is not None:
+            try:
+                for commit in repo.iter_commits(max_count=MAX_INDEXED_COMMITS):
+                    commits.append(GitCommit(
+                        sha=commit.hexsha,
+                        message=commit.message.strip(),
+                        author=commit.author.name,
+                        timestamp=commit.committed_datetime
+                    ))
+            except Exception as e:
+                logger.error(f"Error indexing commits for {self.project_root}: {e}")
+                return
+        commits.sort(key=commit_key, reverse=True)
+
+        self._head = head
+        self._commits = commits
+        self._by_story = {}
+        indexed = {c.sha for c in commits}
+        self._files = {sha: files for sha, files in self._files.items() if sha in indexed}
+        logger.info(f"Indexed {len(commits)} commits for {self.project_root} at {head}")
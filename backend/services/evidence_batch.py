@@ -0,0 +1,219 @@
+"""
+BMAD Dash - Batched Evidence Lookup
+Answers git/test/review evidence for many stories from one GitCorrelator
+history walk, one TestDiscoverer scan and one ArtifactIndex (POST /api/evidence/batch)
+
+The per-story payload builders are shared with the single-story endpoints, so
+a batch entry is exactly what /api/git-evidence, /api/test-evidence and
+/api/review-evidence return for that story.
+"""
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..models.git_evidence import GitCommit, GitEvidence
+from ..models.test_evidence import TestEvidence
+from ..utils.artifact_index import ArtifactIndex
+from ..utils.single_flight import flight_key, single_flight
+from ..utils.story_test_parser import parse_test_counts_from_story_file
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_GIT = "git"
+EVIDENCE_TEST = "test"
+EVIDENCE_REVIEW = "review"
+EVIDENCE_TYPES = (EVIDENCE_GIT, EVIDENCE_TEST, EVIDENCE_REVIEW)
+
+
+def git_evidence_payload(correlator, story_id: str, commits: List[GitCommit]) -> Dict[str, Any]:
+    """
+    /api/git-evidence response body
+
+    Args:
+        correlator: GitCorrelator (for status calculation)
+        story_id: Story identifier
+        commits: Commits for the story (including any mtime fallback)
+
+    Returns:
+        Dict with story_id, commits, status and last_commit_time
+    """
+    status, last_commit_time = correlator.calculate_status(commits)
+    response = GitEvidence(story_id=story_id, commits=commits).to_dict()
+    response['status'] = status
+    response['last_commit_time'] = last_commit_time.isoformat() if last_commit_time else None
+    return response
+
+
+def story_test_evidence(discoverer, story_id: str, project_root: str) -> TestEvidence:
+    """
+    Test evidence for a story, falling back to counts recorded in the story file
+
+    Args:
+        discoverer: TestDiscoverer
+        story_id: Story identifier
+        project_root: Path to project root directory
+
+    Returns:
+        TestEvidence instance (shared with concurrent callers for the same
+        story, so treat it as read-only)
+    """
+    return single_flight.do(
+        flight_key(project_root, "test-evidence", story_id),
+        lambda: _story_test_evidence(discoverer, story_id, project_root)
+    )
+
+
+def _story_test_evidence(discoverer, story_id: str, project_root: str) -> TestEvidence:
+    evidence = discoverer.get_test_evidence_for_story(story_id, project_root)
+
+    # If no tests were found or all counts are 0, try parsing from story file
+    if evidence.pass_count == 0 and evidence.fail_count == 0:
+        logger.info(f"No test execution results for story {story_id}, attempting to parse from story file")
+        parsed_counts = parse_test_counts_from_story_file(story_id, project_root)
+
+        if parsed_counts:
+            # Create new evidence with parsed counts
+            evidence = TestEvidence(
+                story_id=story_id,
+                test_files=[],
+                pass_count=parsed_counts["pass_count"],
+                fail_count=parsed_counts["fail_count"],
+                failing_test_names=[],
+                last_run_time=None,
+                status=parsed_counts["status"]
+            )
+            logger.info(f"Using parsed test counts from story file: {parsed_counts['pass_count']}/{parsed_counts['total_tests']}")
+
+    return evidence
+
+
+def review_evidence_payload(index: ArtifactIndex, story_id: str) -> Dict[str, Any]:
+    """
+    /api/review-evidence response body
+
+    Args:
+        index: ArtifactIndex for the project
+        story_id: Story identifier
+
+    Returns:
+        {"status": "reviewed", "file", "path"} or {"status": "pending"}
+    """
+    # Look for code-review-X-Y.md in artifacts
+    review_file = index.code_review_file(story_id)
+    if review_file:
+        return {
+            'status': 'reviewed',
+            'file': os.path.basename(review_file),
+            'path': review_file
+        }
+    return {'status': 'pending'}
+
+
+class EvidenceBatch:
+    """
+    Evidence of several types for many stories of one project
+
+    Usage:
+        results = EvidenceBatch(project_root).collect(["1.1", "1.2"], ["git", "review"])
+        # {"1.1": {"git": {...}, "review": {...}}, "1.2": {...}}
+
+    A failure only affects its own (story, type) entry, which becomes an
+    error dict shaped like the single-story endpoint's error response.
+    """
+
+    def __init__(self, project_root: str):
+        """
+        Args:
+            project_root: Path to project root directory
+        """
+        self.project_root = project_root
+        self._git_correlator = None
+        self._test_discoverer = None
+
+    @property
+    def git_correlator(self):
+        if self._git_correlator is None:
+            from .git_correlator import GitCorrelator
+            self._git_correlator = GitCorrelator(self.project_root)
+        return self._git_correlator
+
+    @property
+    def test_discoverer(self):
+        if self._test_discoverer is None:
+            from .test_discoverer import TestDiscoverer
+            self._test_discoverer = TestDiscoverer(self.project_root, cache_scans=True)
+        return self._test_discoverer
+
+    def collect(self, story_ids: List[str], types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect evidence for stories
+
+        Args:
+            story_ids: Story identifiers (duplicates are answered once)
+            types: Evidence types from EVIDENCE_TYPES (default: all)
+
+        Returns:
+            Dict of story_id -> {type: payload or error dict}
+        """
+        story_ids = list(dict.fromkeys(story_ids))
+        types = list(dict.fromkeys(types or EVIDENCE_TYPES))
+        unknown = [t for t in types if t not in EVIDENCE_TYPES]
+        if unknown:
+            raise ValueError(f"Unknown evidence type(s): {', '.join(unknown)} (expected: {', '.join(EVIDENCE_TYPES)})")
+
+        results: Dict[str, Dict[str, Any]] = {story_id: {} for story_id in story_ids}
+        if not story_ids:
+            return results
+
+        index = ArtifactIndex.for_project(self.project_root)
+        if EVIDENCE_GIT in types:
+            self._collect_git(story_ids, results)
+        if EVIDENCE_TEST in types:
+            self._collect_tests(story_ids, index, results)
+        if EVIDENCE_REVIEW in types:
+            self._collect_reviews(story_ids, index, results)
+        return results
+
+    def _collect_git(self, story_ids: List[str], results: Dict[str, Dict[str, Any]]):
+        correlator = self.git_correlator
+        commits_by_story = correlator.get_commits_for_stories(story_ids)
+        for story_id in story_ids:
+            try:
+                # Fall back to file mtime (NFR22) for stories without commits
+                commits = correlator.get_commits_with_fallback(
+                    story_id, self.project_root, commits=commits_by_story.get(story_id, [])
+                )
+                results[story_id][EVIDENCE_GIT] = git_evidence_payload(correlator, story_id, commits)
+            except Exception as e:
+                logger.error(f"Error getting Git evidence for story {story_id}: {e}")
+                results[story_id][EVIDENCE_GIT] = self._error('GitCorrelationError', 'Failed to retrieve Git evidence', e)
+
+    def _collect_tests(self, story_ids: List[str], index: ArtifactIndex, results: Dict[str, Dict[str, Any]]):
+        discoverer = self.test_discoverer
+        for story_id in story_ids:
+            if index.story_file(story_id) is None:
+                results[story_id][EVIDENCE_TEST] = {
+                    'error': 'StoryNotFound',
+                    'message': f'Story {story_id} not found',
+                    'details': f'No story file found for story ID: {story_id}',
+                    'status': 404
+                }
+                continue
+            try:
+                evidence = story_test_evidence(discoverer, story_id, self.project_root)
+                results[story_id][EVIDENCE_TEST] = evidence.to_dict()
+            except Exception as e:
+                logger.error(f"Error getting test evidence for story {story_id}: {e}")
+                results[story_id][EVIDENCE_TEST] = self._error('TestDiscoveryError', 'Failed to retrieve test evidence', e)
+
+    def _collect_reviews(self, story_ids: List[str], index: ArtifactIndex, results: Dict[str, Dict[str, Any]]):
+        for story_id in story_ids:
+            try:
+                results[story_id][EVIDENCE_REVIEW] = review_evidence_payload(index, story_id)
+            except Exception as e:
+                logger.error(f"Error checking review evidence for story {story_id}: {e}")
+                results[story_id][EVIDENCE_REVIEW] = self._error('InternalError', 'Failed to check review evidence', e)
+
+    @staticmethod
+    def _error(error: str, message: str, exc: Exception) -> Dict[str, Any]:
+        return {'error': error, 'message': message, 'details': str(exc), 'status': 500}
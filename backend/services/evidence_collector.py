@@ -0,0 +1,294 @@
+"""
+BMAD Dash - Evidence Collection Pipeline
+Collects git and test evidence for many stories concurrently
+Story 5.4: Project State Cache (bootstrap evidence)
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..config import Config
+from ..models.story import Story
+from ..utils.perf import PerfRun, timed
+
+logger = logging.getLogger(__name__)
+
+# Active stories: their tests are actually run (others only get a static count)
+ACTIVE_STATUSES = ("in-progress", "review")
+
+
+def default_evidence() -> Dict[str, Any]:
+    """Default evidence structure to prevent frontend partial-failure crashes (Fix #5)"""
+    return {
+        "commits": [],
+        "commit_count": 0,
+        "status": "unknown",
+        "tests_passed": 0,
+        "tests_total": 0,
+        "healthy": False,
+        "failing_tests": [],
+        "test_files": []
+    }
+
+
+# Every key a story's evidence dict may carry (see default_evidence, collect_git, collect_tests)
+EVIDENCE_FIELDS = (
+    "commits", "commit_count", "status", "last_commit",
+    "tests_passed", "tests_total", "healthy", "last_test_run", "failing_tests", "test_files",
+    "pending"
+)
+
+# Evidence keys kept in list payloads such as /api/dashboard; commit and test
+# file lists are served by the per-story evidence endpoints
+SUMMARY_FIELDS = (
+    "commit_count", "status", "last_commit",
+    "tests_passed", "tests_total", "healthy", "last_test_run",
+    "pending"
+)
+
+
+def summarize_evidence(evidence: Optional[Dict[str, Any]], extra_fields: Iterable[str] = ()) -> Dict[str, Any]:
+    """
+    Compact evidence: counters, status and last timestamps
+
+    Args:
+        evidence: Full evidence dict (may be None/empty)
+        extra_fields: Additional evidence keys to copy verbatim (e.g., "commits")
+
+    Returns:
+        Summary dict whose size does not grow with the number of commits or tests
+    """
+    if not evidence:
+        return {}
+    summary = {key: evidence[key] for key in SUMMARY_FIELDS if key in evidence}
+    if "commit_count" not in summary and isinstance(evidence.get("commits"), list):
+        summary["commit_count"] = len(evidence["commits"])
+    summary["failing_count"] = len(evidence.get("failing_tests") or [])
+    summary["test_file_count"] = len(evidence.get("test_files") or [])
+    for key in extra_fields:
+        if key in evidence:
+            summary[key] = evidence[key]
+    return summary
+
+
+def pending_evidence() -> Dict[str, Any]:
+    """Placeholder evidence for stories still being collected by a progressive bootstrap"""
+    evidence = default_evidence()
+    evidence["pending"] = True
+    return evidence
+
+
+class EvidenceCollector:
+    """
+    Collects evidence (commits, inferred tasks, test files/counts/results) for stories
+
+    Stories are processed by a bounded thread pool - git lookups, test discovery,
+    static counting and active-story test runs are I/O and subprocess bound, so
+    a cold bootstrap takes roughly as long as its slowest stories rather than
+    the sum of all of them. Each worker thread has its own GitCorrelator and
+    TestDiscoverer (GitPython repos are not thread-safe). Results are applied
+    in input order and a failing story only loses its own evidence.
+    """
+
+    def __init__(self, project_root: str, max_workers: Optional[int] = None, perf: Optional[PerfRun] = None):
+        """
+        Args:
+            project_root: Path to project root directory
+            max_workers: Thread pool size; 1 collects sequentially
+                (default: Config.EVIDENCE_WORKERS)
+            perf: Run to record per-story phase timings in
+        """
+        self.project_root = project_root
+        self.max_workers = max(1, max_workers or Config.EVIDENCE_WORKERS)
+        self.perf = perf
+        self._local = threading.local()
+
+    @property
+    def git_correlator(self):
+        """GitCorrelator for the current thread"""
+        correlator = getattr(self._local, "git_correlator", None)
+        if correlator is None:
+            from .git_correlator import GitCorrelator
+            correlator = GitCorrelator(self.project_root)
+            self._local.git_correlator = correlator
+        return correlator
+
+    @property
+    def test_discoverer(self):
+        """TestDiscoverer for the current thread"""
+        discoverer = getattr(self._local, "test_discoverer", None)
+        if discoverer is None:
+            from .test_discoverer import TestDiscoverer
+            discoverer = TestDiscoverer(self.project_root)
+            self._local.test_discoverer = discoverer
+        return discoverer
+
+    def collect_all(self, stories: List[Story]) -> int:
+        """
+        Collect evidence for stories and store it in story.evidence
+
+        Args:
+            stories: Stories to collect (task inference updates their tasks)
+
+        Returns:
+            Number of stories whose collection failed (they get default evidence)
+        """
+        if not stories:
+            return 0
+
+        if self.max_workers == 1 or len(stories) == 1:
+            results = [self._collect_isolated(story) for story in stories]
+        else:
+            workers = min(self.max_workers, len(stories))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bmad-evidence") as pool:
+                results = list(pool.map(self._collect_isolated, stories))
+
+        failures = 0
+        for story, (evidence, ok) in zip(stories, results):
+            story.evidence = evidence
+            failures += 0 if ok else 1
+        return failures
+
+    def iter_collect(self, stories: List[Story]) -> Iterator[Tuple[Story, Dict[str, Any], bool]]:
+        """
+        Collect evidence for stories, yielding each result as soon as it is ready
+
+        Unlike collect_all, story.evidence is left for the caller to assign, so
+        results can be applied (and published) one at a time.
+
+        Args:
+            stories: Stories to collect (task inference updates their tasks)
+
+        Yields:
+            (story, evidence, ok) in completion order
+        """
+        if not stories:
+            return
+
+        if self.max_workers == 1 or len(stories) == 1:
+            for story in stories:
+                evidence, ok = self._collect_isolated(story)
+                yield story, evidence, ok
+            return
+
+        workers = min(self.max_workers, len(stories))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bmad-evidence") as pool:
+            futures = {pool.submit(self._collect_isolated, story): story for story in stories}
+            for future in as_completed(futures):
+                evidence, ok = future.result()
+                yield futures[future], evidence, ok
+
+    def _collect_isolated(self, story: Story):
+        """Collect one story; any unexpected error only affects this story"""
+        try:
+            return self.collect(story), True
+        except Exception as e:
+            logger.warning(f"Evidence collection failed for {story.story_id}: {e}")
+            return default_evidence(), False
+
+    def collect(self, story: Story) -> Dict[str, Any]:
+        """
+        Collect evidence for one story
+
+        Args:
+            story: Story to collect evidence for (inferred tasks are marked done)
+
+        Returns:
+            Evidence dict
+        """
+        evidence = default_evidence()
+        self.collect_git(story, evidence)
+        self.collect_tests(story, evidence)
+        return evidence
+
+    def collect_git(self, story: Story, evidence: Dict[str, Any]):
+        """Get Git Evidence and Infer Tasks (updates evidence in place)"""
+        story_id = story.story_id
+        git_correlator = self.git_correlator
+        try:
+            with timed(self.perf, "git_correlation", story_id):
+                commits = git_correlator.get_commits_for_story(story_id)
+            if commits:
+                # Store rich evidence for instant frontend display
+                evidence["commits"] = [c.to_dict() for c in commits]
+                evidence["commit_count"] = len(commits)
+                last_commit = max(c.timestamp for c in commits)
+                evidence["last_commit"] = last_commit.isoformat()
+
+                # Calculate status based on recency
+                status, _ = git_correlator.calculate_status(commits)
+                evidence["status"] = status
+
+                # Infer task progress (Task 6)
+                task_nums = {
+                    str(task_num)
+                    for commit in commits
+                    for task_num in git_correlator.extract_task_references(commit.message)
+                }
+                if task_nums:
+                    self._infer_tasks(story, task_nums)
+        except Exception as e:
+            logger.warning(f"Git evidence collection failed for {story_id}: {e}")
+
+    @staticmethod
+    def _infer_tasks(story: Story, task_nums: Set[str]):
+        """
+        Mark tasks referenced by commits ("Task 2" -> "2" or "task-2") done
+
+        A lazy story's task list is loaded for this and released again, so
+        the inferred tasks end up in its counters (inferred_ids).
+        """
+        lazy = not story.details_loaded
+        if lazy:
+            story.load_details()
+        for task in story.tasks:
+            task_num = task.task_id[len("task-"):] if task.task_id.startswith("task-") else task.task_id
+            if task_num in task_nums and task.status != "done":
+                task.status = "done"
+                task.inferred = True
+                logger.info(f"Inferred task {task_num} done for story {story.story_id} from commit")
+        if lazy:
+            story.unload_details()
+
+    def collect_tests(self, story: Story, evidence: Dict[str, Any]):
+        """Get Test Evidence (updates evidence in place)"""
+        story_id = story.story_id
+        test_discoverer = self.test_discoverer
+        try:
+            # PERFORMANCE FIX: Don't run full tests during bootstrap for all stories.
+            # Just discover the files for now. Full parsing happens during sync/detail fetch.
+            with timed(self.perf, "test_discovery", story_id):
+                test_files = test_discoverer.discover_tests_for_story(story_id)
+            evidence["test_files"] = test_files
+
+            # Only do full test parse (subprocess run) for active stories
+            if story.status in ACTIVE_STATUSES and test_files:
+                with timed(self.perf, "test_execution", story_id):
+                    test_ev = test_discoverer.get_test_evidence_for_story(story_id, self.project_root)
+                if test_ev:
+                    evidence["tests_passed"] = test_ev.pass_count
+                    evidence["tests_total"] = test_ev.pass_count + test_ev.fail_count
+                    evidence["healthy"] = (test_ev.fail_count == 0) and (test_ev.pass_count > 0)
+                    evidence["failing_tests"] = test_ev.failing_test_names
+                    if test_ev.last_run_time:
+                        evidence["last_test_run"] = test_ev.last_run_time.isoformat()
+            # For DONE stories, perform a fast static count to avoid "No tests found" warning
+            # We assume if it's DONE, tests passed. We just need to report existence.
+            elif story.status == "done" and test_files:
+                with timed(self.perf, "static_counts", story_id):
+                    total_count = sum(test_discoverer.count_tests_static(tf) for tf in test_files)
+
+                evidence["tests_passed"] = total_count
+                evidence["tests_total"] = total_count
+                evidence["healthy"] = (total_count > 0)
+                # Estimate last run time from file mtime
+                try:
+                    last_mtime = max(os.path.getmtime(tf) for tf in test_files)
+                    evidence["last_test_run"] = datetime.fromtimestamp(last_mtime).isoformat()
+                except OSError:
+                    pass
+        except Exception as e:
+            logger.warning(f"Test evidence collection failed for {story_id}: {e}")
@@ -0,0 +1,100 @@
+"""
+BMAD Dash - Bootstrap Evidence Stream
+Per-story evidence results of a progressive bootstrap, published by the
+collecting thread and replayed to any number of SSE subscribers
+"""
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+EVENT_EVIDENCE = "evidence"
+EVENT_COMPLETE = "complete"
+
+
+class EvidenceStream:
+    """
+    Append-only event log for one bootstrap run
+
+    Events are kept until the stream is discarded, so a subscriber that
+    connects (or reconnects) late replays everything it missed. Sequence
+    numbers start at 1 and double as SSE event ids.
+    """
+
+    def __init__(self, total: int):
+        """
+        Args:
+            total: Number of stories whose evidence will be published
+        """
+        self.total = total
+        self._events: List[Dict[str, Any]] = []
+        self._completed = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def completed(self) -> int:
+        """Number of stories published so far"""
+        with self._cond:
+            return self._completed
+
+    @property
+    def closed(self) -> bool:
+        with self._cond:
+            return self._closed
+
+    def publish(self, story_id: str, evidence: Dict[str, Any]):
+        """Publish one story's evidence (ignored once the stream is closed)"""
+        with self._cond:
+            if self._closed:
+                return
+            self._completed += 1
+            self._events.append({
+                "type": EVENT_EVIDENCE,
+                "story_id": story_id,
+                "evidence": evidence,
+                "completed": self._completed,
+                "total": self.total
+            })
+            self._cond.notify_all()
+
+    def close(self, error: Optional[str] = None):
+        """Publish the final event and wake all subscribers (idempotent)"""
+        with self._cond:
+            if self._closed:
+                return
+            event = {"type": EVENT_COMPLETE, "completed": self._completed, "total": self.total}
+            if error:
+                event["error"] = error
+            self._events.append(event)
+            self._closed = True
+            self._cond.notify_all()
+
+    def subscribe(self, after: int = 0, timeout: float = 15.0) -> Iterator[Optional[Tuple[int, Dict[str, Any]]]]:
+        """
+        Iterate over events, blocking for new ones until the stream closes
+
+        Args:
+            after: Sequence number of the last event already seen (0 = replay all)
+            timeout: Seconds to wait before yielding None (lets callers send keep-alives)
+
+        Yields:
+            (sequence, event) pairs, or None after `timeout` seconds without events
+        """
+        index = max(0, after)
+        while True:
+            with self._cond:
+                if index >= len(self._events) and not self._closed:
+                    self._cond.wait(timeout)
+                batch = self._events[index:]
+                closed = self._closed
+
+            if not batch:
+                if closed:
+                    return
+                yield None
+                continue
+
+            for event in batch:
+                index += 1
+                yield index, event
+            if closed and batch[-1]["type"] == EVENT_COMPLETE:
+                return
@@ -0,0 +1,374 @@
+"""
+BMAD Dash - Project File Watcher
+Tracks which stories and evidence sources changed on disk so that
+ProjectStateCache.sync only processes what actually changed
+
+Watches _bmad-output/ (and stories/), the test roots, .git/refs (plus HEAD and packed-refs)
+and .bmad-cache/. Uses watchdog (inotify/FSEvents/ReadDirectoryChangesW) when
+installed, otherwise a background polling thread. Either way, request threads
+only read the accumulated dirty set - they never touch the filesystem.
+"""
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..config import Config
+from ..utils.artifact_index import CODE_REVIEW_FILE_RE, STORY_FILE_RE
+from .test_discoverer import TEST_DIRS
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - optional dependency
+    FileSystemEventHandler = object
+    Observer = None
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_GIT = "git"
+EVIDENCE_TESTS = "tests"
+
+BMAD_OUTPUT_DIR = "_bmad-output"
+ARTIFACT_ROOTS = (BMAD_OUTPUT_DIR, "stories")  # See artifact_index.ARTIFACT_DIRS
+SMART_CACHE_DIR = ".bmad-cache"
+SPRINT_STATUS_FILE = "sprint-status.yaml"
+# Files written by the caches themselves: only signal a possible state reload
+STATE_FILES = {
+    "project-state.json", "project-state.msgpack", "stories.json",
+    "project-state.db", "project-state.db-wal", "project-state.db-shm", "project-state.db-journal",
+}
+# Test files TestDiscoverer matches (pytest, jest/vitest, Rust), or anything inside a tests directory
+TEST_FILE_RE = re.compile(r'^(test_.+\.(py|rs)|.+_test\.(py|rs)|.+\.(test|spec)\.[jt]sx?)$')
+TEST_DIR_NAMES = {"tests", "test", "__tests__"}
+IGNORED_SUFFIXES = (".lock", ".tmp", ".pyc", ".swp", "~")
+# Directories skipped by the polling scanner (build output, dependencies, VCS)
+SKIPPED_DIRS = {".git", "__pycache__", "node_modules", "target", "dist", "build", ".pytest_cache", ".venv"}
+
+WATCH_MODES = ("off", "auto", "polling")
+
+
+@dataclass
+class DirtySet:
+    """Changes observed since the last drain"""
+    story_ids: Set[str] = field(default_factory=set)
+    reviews: Set[str] = field(default_factory=set)  # Stories whose code-review file changed (reparse even if unchanged)
+    evidence: Set[str] = field(default_factory=set)  # EVIDENCE_GIT / EVIDENCE_TESTS
+    sprint_status: bool = False
+    full: bool = False  # Unclassified change: sync must sweep everything
+
+    def is_empty(self) -> bool:
+        return not (self.story_ids or self.evidence or self.sprint_status or self.full)
+
+
+def _is_test_path(rel: str) -> bool:
+    """True for a test file or a file in a tests directory (e.g. conftest.py, fixtures), not plain source"""
+    parts = rel.split("/")
+    return bool(TEST_FILE_RE.match(parts[-1])) or any(part in TEST_DIR_NAMES for part in parts)
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to the watcher"""
+
+    def __init__(self, watcher: "ProjectWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        if event.is_directory:
+            self._watcher.record_directory(event.event_type, event.src_path, getattr(event, "dest_path", None))
+            return
+        self._watcher.record_path(event.src_path)
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            self._watcher.record_path(dest)
+
+
+class ProjectWatcher:
+    """
+    Accumulates a dirty set of story IDs and evidence types for one project
+
+    The first drain after start() reports a full sweep, covering changes made
+    while nothing was watching.
+    """
+
+    def __init__(self, project_root: str, mode: str = "auto", poll_interval: Optional[float] = None):
+        """
+        Args:
+            project_root: Path to project root directory
+            mode: "auto" (watchdog if installed, else polling) or "polling"
+            poll_interval: Seconds between polling scans (default: Config.WATCH_POLL_INTERVAL)
+        """
+        self.project_root = os.path.abspath(project_root)
+        self.mode = mode
+        self.poll_interval = Config.WATCH_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.backend: Optional[str] = None  # "watchdog" or "polling" once started
+        self._lock = threading.Lock()
+        self._dirty = DirtySet(full=True)
+        self._state_changed = True
+        self._observer = None
+        self._watches: Dict[Tuple[str, bool], Any] = {}  # (path, recursive) -> watchdog ObservedWatch
+        self._watch_lock = threading.Lock()
+        self._poll_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+
+    @property
+    def active(self) -> bool:
+        return self.backend is not None
+
+    def start(self) -> bool:
+        """
+        Start watching (idempotent)
+
+        Returns:
+            True if a watcher backend is running
+        """
+        if self.active:
+            return True
+        if self.mode != "polling" and Observer is not None:
+            try:
+                self._start_watchdog()
+                self.backend = "watchdog"
+            except Exception as e:
+                logger.warning(f"watchdog unavailable for {self.project_root} ({e}), falling back to polling")
+        if not self.active:
+            self._start_polling()
+            self.backend = "polling"
+        logger.info(f"Watching {self.project_root} for changes ({self.backend})")
+        return True
+
+    def stop(self):
+        """Stop watching; sync falls back to full sweeps"""
+        self.backend = None
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+            self._watches.clear()
+        if self._poll_thread is not None:
+            self._poll_thread.join(timeout=2)
+            self._poll_thread = None
+
+    def drain(self) -> DirtySet:
+        """Return the changes observed since the last drain and reset the set"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, DirtySet()
+            return dirty
+
+    def take_state_change(self) -> bool:
+        """True (once) if a cache/state file was written since the last call"""
+        with self._lock:
+            changed, self._state_changed = self._state_changed, False
+            return changed
+
+    def mark_full(self):
+        """Force a full sweep on the next sync (e.g., after a failed sync)"""
+        with self._lock:
+            self._dirty.full = True
+            self._state_changed = True
+
+    def record_path(self, path: str):
+        """Classify a changed path into the dirty set"""
+        rel = os.path.relpath(path, self.project_root).replace(os.sep, "/")
+        name = rel.rsplit("/", 1)[-1]
+        if rel.startswith("../") or name.endswith(IGNORED_SUFFIXES):
+            return
+
+        with self._lock:
+            if name in STATE_FILES and (rel.startswith(BMAD_OUTPUT_DIR + "/") or rel.startswith(SMART_CACHE_DIR + "/")):
+                self._state_changed = True
+            elif rel.startswith(".git/"):
+                if rel in (".git/HEAD", ".git/packed-refs") or rel.startswith(".git/refs/"):
+                    self._dirty.evidence.add(EVIDENCE_GIT)
+            elif rel.startswith(SMART_CACHE_DIR + "/"):
+                return
+            elif any(rel.startswith(d + "/") for d in ARTIFACT_ROOTS):
+                self._record_artifact(name)
+            elif any(rel.startswith(d.replace(os.sep, "/") + "/") for d in TEST_DIRS):
+                if "/__pycache__/" not in rel and _is_test_path(rel):
+                    self._dirty.evidence.add(EVIDENCE_TESTS)
+
+    def record_directory(self, event_type: str, path: str, dest_path: Optional[str] = None):
+        """
+        Handle a directory event (watchdog backend)
+
+        A watch target (or a directory on the way to one) that appears is
+        scheduled, and the next sync sweeps everything since files may have
+        been written into it before it was watched. Directories deleted or
+        moved in or around the targets force a sweep as well.
+        """
+        if event_type == "moved":
+            self.record_directory("deleted", path)
+            if dest_path:
+                self.record_directory("created", dest_path)
+            return
+        if event_type not in ("created", "deleted"):
+            return
+
+        rel = os.path.relpath(path, self.project_root).replace(os.sep, "/")
+        if rel.startswith("../") or rel == ".":
+            return
+        targets = [target for target, _recursive in self._target_paths()]
+        on_the_way = any(target == rel or target.startswith(rel + "/") for target in targets)
+        inside = any(rel.startswith(target + "/") for target in targets)
+        if event_type == "created" and on_the_way:
+            self._schedule_targets()
+            self.mark_full()
+        elif event_type == "deleted" and (on_the_way or inside):
+            if on_the_way:
+                self._unschedule_under(path)  # Recreating the directory must schedule a new watch
+            self.mark_full()
+
+    def _record_artifact(self, name: str):
+        """
+        Story, code-review and sprint-status files map to specific work; other
+        files (plans, reports, retrospectives) are not read by sync. Moved or
+        deleted directories force a sweep (see _EventHandler).
+        """
+        if name == SPRINT_STATUS_FILE:
+            self._dirty.sprint_status = True
+            return
+        match = STORY_FILE_RE.match(name)
+        review = CODE_REVIEW_FILE_RE.match(name)
+        if match:
+            self._dirty.story_ids.add(f"{match.group(1)}.{match.group(2)}")
+        elif review:
+            story_id = f"{review.group(1)}.{review.group(2)}"
+            self._dirty.story_ids.add(story_id)
+            self._dirty.reviews.add(story_id)
+
+    @staticmethod
+    def _target_paths() -> List[Tuple[str, bool]]:
+        """(relative directory, recursive) pairs that are watched when they exist"""
+        targets = [(d, True) for d in ARTIFACT_ROOTS]
+        targets.extend((d.replace(os.sep, "/"), True) for d in TEST_DIRS)
+        targets.append((".git/refs", True))
+        targets.append((".git", False))
+        targets.append((SMART_CACHE_DIR, False))
+        return targets
+
+    def _watch_targets(self) -> List[Tuple[str, bool]]:
+        """(directory, recursive) pairs that exist"""
+        targets = [(os.path.join(self.project_root, *rel.split("/")), recursive)
+                   for rel, recursive in self._target_paths()]
+        return [(path, recursive) for path, recursive in targets if os.path.isdir(path)]
+
+    def _missing_target_parents(self) -> List[Tuple[str, bool]]:
+        """
+        Nearest existing parent of each missing target (always including the
+        project root), watched non-recursively to see the target appear
+        """
+        parents = {self.project_root}
+        for rel, _recursive in self._target_paths():
+            path = os.path.join(self.project_root, *rel.split("/"))
+            if os.path.isdir(path):
+                continue
+            parent = os.path.dirname(path)
+            while parent != self.project_root and not os.path.isdir(parent):
+                parent = os.path.dirname(parent)
+            parents.add(parent)
+        return [(parent, False) for parent in sorted(parents)]
+
+    def _start_watchdog(self):
+        observer = Observer()
+        observer.daemon = True
+        self._observer = observer
+        try:
+            self._schedule_targets()
+            observer.start()
+        except Exception:
+            self._observer = None
+            self._watches.clear()
+            raise
+
+    def _schedule_targets(self):
+        """Schedule every existing target (and parents of missing ones) not watched yet"""
+        observer = self._observer
+        if observer is None:
+            return
+        handler = _EventHandler(self)
+        with self._watch_lock:
+            for path, recursive in self._watch_targets() + self._missing_target_parents():
+                if (path, recursive) in self._watches:
+                    continue
+                try:
+                    self._watches[(path, recursive)] = observer.schedule(handler, path, recursive=recursive)
+                except OSError as e:  # Removed again in the meantime
+                    logger.debug(f"Cannot watch {path}: {e}")
+
+    def _unschedule_under(self, path: str):
+        """Drop the watches of a deleted directory and everything below it"""
+        observer = self._observer
+        if observer is None:
+            return
+        prefix = path.rstrip(os.sep) + os.sep
+        with self._watch_lock:
+            for key in [key for key in self._watches if key[0] == path or key[0].startswith(prefix)]:
+                watch = self._watches.pop(key)
+                try:
+                    observer.unschedule(watch)
+                except (KeyError, OSError):
+                    pass
+
+    # Polling fallback
+
+    def _start_polling(self):
+        self._stop.clear()
+        self._snapshot = self._scan()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop, name=f"bmad-watch-{os.path.basename(self.project_root)}", daemon=True
+        )
+        self._poll_thread.start()
+
+    def _poll_loop(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"File watcher poll failed for {self.project_root}: {e}")
+                self.mark_full()
+
+    def poll(self):
+        """Scan watched paths once and record differences from the previous scan"""
+        snapshot = self._scan()
+        previous = self._snapshot
+        self._snapshot = snapshot
+        for path in self._changed_paths(previous, snapshot):
+            self.record_path(path)
+
+    @staticmethod
+    def _changed_paths(previous: Dict[str, Tuple[int, int]], current: Dict[str, Tuple[int, int]]) -> Iterable[str]:
+        for path, signature in current.items():
+            if previous.get(path) != signature:
+                yield path
+        for path in previous.keys() - current.keys():
+            yield path
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime_ns, size) of every watched file"""
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for path, recursive in self._watch_targets():
+            self._scan_dir(path, recursive, snapshot)
+        return snapshot
+
+    def _scan_dir(self, directory: str, recursive: bool, snapshot: Dict[str, Tuple[int, int]]):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and entry.name not in SKIPPED_DIRS:
+                                self._scan_dir(entry.path, True, snapshot)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
@@ -0,0 +1,184 @@
+"""
+BMAD Dash - Evidence Freshness Policies
+Decides from a few stat() calls, without collecting anything, whether each kind
+of evidence in the project state may be outdated (stale-while-revalidate mode
+of /api/dashboard)
+
+  git     stale when .git/HEAD, .git/packed-refs or a ref under .git/refs changed
+  tests   stale when the TTL expired or a test file of an active story changed
+  review  stale when code-review files were added to or removed from the artifacts
+
+A part is fresh from the moment its signature was taken for a refresh (see
+FreshnessTracker.mark_fresh); changes made while that refresh ran make it
+stale again.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from ..config import Config
+from ..utils.artifact_index import ArtifactIndex
+from .evidence_collector import ACTIVE_STATUSES
+
+PART_GIT = "git"
+PART_TESTS = "tests"
+PART_REVIEW = "review"
+FRESHNESS_PARTS = (PART_GIT, PART_TESTS, PART_REVIEW)
+
+FileStat = Tuple[str, int, int]  # (path, mtime_ns, size)
+
+
+def _stat(path: str) -> Optional[FileStat]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return path, st.st_mtime_ns, st.st_size
+
+
+def git_ref_signature(project_root: str) -> Tuple[FileStat, ...]:
+    """
+    Stat of HEAD, packed-refs and every loose ref: changes on commit, checkout,
+    fetch, branch or tag updates
+
+    Args:
+        project_root: Path to project root directory
+
+    Returns:
+        Sorted tuple of (path, mtime_ns, size); empty outside a git repository
+    """
+    git_dir = os.path.join(project_root, ".git")
+    if not os.path.isdir(git_dir):
+        stat = _stat(git_dir)  # Worktree/submodule pointer file, or no repository
+        return (stat,) if stat else ()
+
+    stats = [_stat(os.path.join(git_dir, "HEAD")), _stat(os.path.join(git_dir, "packed-refs"))]
+    for dirpath, _dirnames, filenames in os.walk(os.path.join(git_dir, "refs")):
+        stats.extend(_stat(os.path.join(dirpath, name)) for name in filenames)
+    return tuple(sorted(s for s in stats if s))
+
+
+def test_files_signature(test_files: Iterable[str]) -> FrozenSet[FileStat]:
+    """Stat of each test file (missing files are left out, so deletions count as changes)"""
+    return frozenset(s for s in map(_stat, set(test_files)) if s)
+
+
+def review_signature(project_root: str) -> FrozenSet[str]:
+    """
+    Story IDs with a code-review file
+
+    Read from the shared ArtifactIndex, which only rescans an artifact
+    directory when its mtime moved. Directory mtimes alone are no signature:
+    the state and SmartCache files are written into implementation-artifacts.
+    """
+    return frozenset(ArtifactIndex.for_project(project_root).code_review_ids())
+
+
+def active_test_files(state) -> set:
+    """Test files recorded in the evidence of in-progress/review stories"""
+    files = set()
+    for story in state.stories.values():
+        if story.status in ACTIVE_STATUSES and story.evidence:
+            files.update(story.evidence.get("test_files") or [])
+    return files
+
+
+class FreshnessTracker:
+    """
+    Per-project record of when, and against which signature, each evidence
+    part was last refreshed
+
+    Usage:
+        tracker = FreshnessTracker(project_root)
+        report = tracker.check(state)      # {"git": {"stale": True, ...}, ...}
+        signatures = tracker.signatures(state, ["git"])
+        ...refresh git evidence...
+        tracker.mark_fresh(signatures)
+    """
+
+    def __init__(self, project_root: str, test_ttl: Optional[float] = None):
+        """
+        Args:
+            project_root: Path to project root directory
+            test_ttl: Seconds before test evidence is stale regardless of file
+                changes (default: Config.TEST_EVIDENCE_TTL; 0 = file changes only)
+        """
+        self.project_root = project_root
+        self.test_ttl = Config.TEST_EVIDENCE_TTL if test_ttl is None else test_ttl
+        self._lock = threading.Lock()
+        self._marks: Dict[str, Tuple[Any, float]] = {}  # part -> (signature, monotonic time)
+
+    def signatures(self, state, parts: Iterable[str] = FRESHNESS_PARTS) -> Dict[str, Any]:
+        """
+        Current signature of each part
+
+        Args:
+            state: ProjectState (test files of active stories are stat'ed)
+            parts: Parts from FRESHNESS_PARTS
+
+        Returns:
+            Dict of part -> signature
+        """
+        result = {}
+        for part in parts:
+            if part == PART_GIT:
+                result[part] = git_ref_signature(self.project_root)
+            elif part == PART_TESTS:
+                result[part] = test_files_signature(active_test_files(state))
+            elif part == PART_REVIEW:
+                result[part] = review_signature(self.project_root)
+            else:
+                raise ValueError(f"Unknown freshness part: {part}")
+        return result
+
+    def mark_fresh(self, signatures: Dict[str, Any], at: Optional[float] = None):
+        """
+        Record that parts were refreshed
+
+        Args:
+            signatures: From signatures(), taken before the refresh started
+            at: time.monotonic() of the refresh (default: now)
+        """
+        at = time.monotonic() if at is None else at
+        with self._lock:
+            for part, signature in signatures.items():
+                self._marks[part] = (signature, at)
+
+    def last_signature(self, part: str) -> Optional[Any]:
+        """Signature recorded by the last mark_fresh of a part (None if never)"""
+        with self._lock:
+            mark = self._marks.get(part)
+        return mark[0] if mark else None
+
+    def check(self, state) -> Dict[str, Dict[str, Any]]:
+        """
+        Staleness of each part
+
+        Args:
+            state: ProjectState being served
+
+        Returns:
+            Dict of part -> {"stale": bool, "reason": str or None,
+            "age_ms": ms since the last refresh or None if never refreshed}
+        """
+        now = time.monotonic()
+        current = self.signatures(state)
+        with self._lock:
+            marks = dict(self._marks)
+
+        report = {}
+        for part in FRESHNESS_PARTS:
+            mark = marks.get(part)
+            if mark is None:
+                report[part] = {"stale": True, "reason": "never-checked", "age_ms": None}
+                continue
+            signature, at = mark
+            reason = None
+            if part == PART_TESTS and self.test_ttl and now - at >= self.test_ttl:
+                reason = "ttl-expired"
+            elif current[part] != signature:
+                reason = {PART_GIT: "refs-changed", PART_TESTS: "files-changed",
+                          PART_REVIEW: "reviews-changed"}[part]
+            report[part] = {"stale": reason is not None, "reason": reason, "age_ms": round((now - at) * 1000)}
+        return report
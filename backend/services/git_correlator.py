@@ -5,11 +5,12 @@ Correlates Git commits to BMAD stories
 import re
 import os
 import logging
-from typing import List, Tuple, Optional, Pattern
+from typing import Dict, List, Tuple, Optional, Pattern
 from datetime import datetime, timedelta
 from git import Repo
 from git.exc import InvalidGitRepositoryError, GitCommandError, NoSuchPathError
 from backend.models.git_evidence import GitCommit
+from backend.utils.artifact_index import ArtifactIndex
 
 
 logger = logging.getLogger(__name__)
@@ -58,17 +59,7 @@ class GitCorrelator:
             matching_commits = []
             for commit in self.repo.iter_commits(max_count=1000):
                 if self._matches_story(commit.message, patterns):
-                    # Extract files changed
-                    files_changed = list(commit.stats.files.keys()) if commit.stats.files else []
-                    
-                    git_commit = GitCommit(
-                        sha=commit.hexsha,
-                        message=commit.message.strip(),
-                        author=commit.author.name,
-                        timestamp=commit.committed_datetime,
-                        files_changed=files_changed
-                    )
-                    matching_commits.append(git_commit)
+                    matching_commits.append(self._to_git_commit(commit))
             
             logger.info(f"Found {len(matching_commits)} commits for story {story_id}")
             return matching_commits
@@ -76,6 +67,52 @@ class GitCorrelator:
         except Exception as e:
             logger.error(f"Error getting commits for story {story_id}: {e}")
             return []
+
+    def get_commits_for_stories(self, story_ids: List[str]) -> Dict[str, List[GitCommit]]:
+        """
+        Gets Git commits for many stories in a single history walk
+
+        Each commit is read (and its changed files diffed) at most once, however
+        many stories it matches.
+
+        Args:
+            story_ids: Story identifiers (e.g., ["1.3", "story-1.4"])
+
+        Returns:
+            Dict of story_id -> list of matching GitCommit objects (same order
+            and matching rules as get_commits_for_story)
+        """
+        results: Dict[str, List[GitCommit]] = {story_id: [] for story_id in story_ids}
+        if not self.repo or not story_ids:
+            return results
+
+        try:
+            story_patterns = [(story_id, self._build_story_patterns(story_id)) for story_id in results]
+            for commit in self.repo.iter_commits(max_count=1000):
+                git_commit = None
+                for story_id, patterns in story_patterns:
+                    if self._matches_story(commit.message, patterns):
+                        if git_commit is None:
+                            git_commit = self._to_git_commit(commit)
+                        results[story_id].append(git_commit)
+        except Exception as e:
+            logger.error(f"Error getting commits for {len(story_ids)} stories: {e}")
+            return {story_id: [] for story_id in story_ids}
+
+        logger.info(f"Found commits for {sum(1 for c in results.values() if c)} of {len(results)} stories")
+        return results
+
+    def _to_git_commit(self, commit) -> GitCommit:
+        """Convert a GitPython commit to a GitCommit"""
+        # Extract files changed
+        files_changed = list(commit.stats.files.keys()) if commit.stats.files else []
+        return GitCommit(
+            sha=commit.hexsha,
+            message=commit.message.strip(),
+            author=commit.author.name,
+            timestamp=commit.committed_datetime,
+            files_changed=files_changed
+        )
     
     def _build_story_patterns(self, story_id: str) -> List[Pattern]:
         """
@@ -261,19 +298,23 @@ class GitCorrelator:
         most_recent = max(commits, key=lambda c: c.timestamp)
         return most_recent.timestamp
     
-    def get_commits_with_fallback(self, story_id: str, project_root: Optional[str] = None) -> List[GitCommit]:
+    def get_commits_with_fallback(self, story_id: str, project_root: Optional[str] = None,
+                                  commits: Optional[List[GitCommit]] = None) -> List[GitCommit]:
         """
         Get commits for story with fallback to file modification time
         
         Args:
             story_id: Story identifier
             project_root: Optional project root path for fallback
+            commits: Commits already correlated for the story (e.g., by
+                get_commits_for_stories); skips the history walk
             
         Returns:
             List of GitCommit objects (may include synthetic commit from file mtime)
         """
         # Try normal Git correlation first
-        commits = self.get_commits_for_story(story_id)
+        if commits is None:
+            commits = self.get_commits_for_story(story_id)
         
         # If no commits and project_root provided, try file mtime fallback
         if not commits and project_root:
@@ -338,21 +379,5 @@ class GitCorrelator:
         if not normalized:
             return None
         
-        # Convert "1.3" to "1-3" for filename
-        story_key = normalized.replace('.', '-')
-        
-        # Common story file locations
-        possible_paths = [
-            os.path.join(project_root, "_bmad-output", "implementation-artifacts", f"{story_key}-*.md"),
-            os.path.join(project_root, "_bmad-output", "implementation", f"{story_key}-*.md"),
-            os.path.join(project_root, "stories", f"{story_key}-*.md"),
-        ]
-        
-        # Try to find story file
-        import glob
-        for pattern in possible_paths:
-            matches = glob.glob(pattern)
-            if matches:
-                return matches[0]  # Return first match
-        
-        return None
+        # Story file locations: implementation-artifacts, implementation, stories
+        return ArtifactIndex.for_project(project_root).story_file(normalized)
@@ -1,33 +1,231 @@
 
+import copy
 import json
 import logging
 import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Any, Callable, Deque, Dict, Hashable, Optional, Set, Tuple
+from ..models.epic import Epic
 from ..models.project_state import ProjectState
 from ..models.story import Story
+from ..config import Config
+from ..utils import content_hash
+from ..utils.cache_codec import CodecError
+from ..utils.perf import PerfRun, perf_log, timed
+from ..utils.single_flight import flight_key, single_flight
+from .evidence_collector import (
+    ACTIVE_STATUSES, EvidenceCollector, default_evidence as _default_evidence, pending_evidence, summarize_evidence
+)
+from .evidence_stream import EvidenceStream
+from .file_watcher import EVIDENCE_GIT, EVIDENCE_TESTS, DirtySet, ProjectWatcher
+from .freshness import FRESHNESS_PARTS, PART_GIT, PART_REVIEW, PART_TESTS, FreshnessTracker
+from .refresh_scheduler import RefreshBudget, RefreshScheduler
 from .smart_cache import SmartCache
+from .state_store import create_state_store
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class ChangeSet:
+    """Stories and epics touched by one state mutation (see ProjectStateCache.changes_since)"""
+    story_ids: Set[str] = field(default_factory=set)
+    epic_keys: Set[str] = field(default_factory=set)  # "epic-N"
+
+    def update(self, other: "ChangeSet"):
+        self.story_ids |= other.story_ids
+        self.epic_keys |= other.epic_keys
+
+
 class ProjectStateCache:
     """
     Service for managing the project state cache (project-state.json).
     Handles loading, saving, and updating the state.
+    Storage is pluggable: project-state.json (default) or SQLite (state_backend="sqlite").
+
+    Request handlers share one long-lived instance per project root via
+    for_project(); hold `lock` while reading or updating the shared state.
+
+    Every real change to the in-memory state (load, bootstrap, sync, update)
+    bumps a generation counter; `etag` identifies the state a response was
+    built from. A bounded change log records which stories/epics each
+    generation touched, so clients can fetch deltas (changes_since).
     """
-    def __init__(self, cache_file: str, smart_cache: Optional[SmartCache] = None):
-        self.cache_file = Path(cache_file)
-        self.cache_data: Optional[ProjectState] = None
+
+    _instances: Dict[tuple, "ProjectStateCache"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache_file: str, smart_cache: Optional[SmartCache] = None, lazy_stories: bool = False,
+                 state_backend: str = "json", codec: Optional[str] = None):
+        self.store = create_state_store(cache_file, state_backend, codec or Config.CACHE_CODEC)
+        self.cache_file = Path(self.store.path)  # File backing the active store
+        self._cache_data: Optional[ProjectState] = None
+        self._generation = 0
+        self.epoch = uuid.uuid4().hex[:8]  # Generations are only comparable within one instance
+        self._memo: Dict[Hashable, Tuple[int, Any]] = {}  # key -> (generation, derived value)
+        # (generation, ChangeSet or None for "everything changed"), oldest first
+        self._changes: Deque[Tuple[int, Optional[ChangeSet]]] = deque(maxlen=max(1, Config.CHANGE_LOG_SIZE))
         self.file_mtimes: Dict[str, float] = {}
-        self.sprint_status_mtime: float = 0.0
         self.smart_cache = smart_cache  # Optional SmartCache for story evidence caching
+        self.lazy_stories = lazy_stories  # Keep only task counters resident; load task lists on demand
+        self.lock = threading.RLock()  # Serializes request threads sharing this instance
+        self._store_signature = None  # Storage signature when cache_data was last loaded/saved
+        self.watcher: Optional[ProjectWatcher] = None  # Set for shared instances when BMAD_FILE_WATCHER is on
+        self.bootstrap_stream: Optional[EvidenceStream] = None  # Latest progressive bootstrap
+        self._freshness: Optional[FreshnessTracker] = None  # Per-part evidence freshness (see freshness())
+        self._revalidation_thread: Optional[threading.Thread] = None  # Latest start_revalidation()
+
+    @property
+    def cache_data(self) -> Optional[ProjectState]:
+        return self._cache_data
+
+    @cache_data.setter
+    def cache_data(self, state: Optional[ProjectState]):
+        self._cache_data = state
+        if state is not None:
+            self.mark_changed()
+
+    @property
+    def generation(self) -> int:
+        """Monotonic change counter of the in-memory state"""
+        return self._generation
+
+    @property
+    def etag(self) -> str:
+        """Strong validator for responses built from the current state"""
+        return f"{self.epoch}-{self._generation}"
+
+    def mark_changed(self, changes: Optional[ChangeSet] = None):
+        """
+        Record a mutation of the in-memory state (bumps the generation)
+
+        Args:
+            changes: Stories/epics the mutation touched; None if unknown or
+                everything (deltas across this generation need a full snapshot)
+        """
+        self._generation += 1
+        if self._cache_data is not None:
+            self._cache_data.generation = self._generation
+        self._changes.append((self._generation, changes))
+        self._memo.clear()  # Every memoized value belongs to an older generation now
+
+    def changes_since(self, generation: int) -> Optional[ChangeSet]:
+        """
+        Stories and epics changed after a generation
+
+        Args:
+            generation: Generation the client last saw
+
+        Returns:
+            Union of the changes since then (empty if current), or None if the
+            log cannot answer: the generation aged out of the log, is from the
+            future, or a full change happened since
+        """
+        if generation > self._generation or generation < 0:
+            return None
+        result = ChangeSet()
+        if generation == self._generation:
+            return result
+        if not self._changes or self._changes[0][0] > generation + 1:
+            return None  # Aged out
+        for changed_generation, changes in self._changes:
+            if changed_generation <= generation:
+                continue
+            if changes is None:
+                return None
+            result.update(changes)
+        return result
+
+    def memoized(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Value derived from the current state, rebuilt only after the generation changes
+
+        Call with `lock` held: concurrent requests then wait for one build and
+        share its result. Callers must treat the returned value as read-only.
+        Values are dropped when the generation changes, so only the current
+        generation's keys are ever held.
+
+        Args:
+            key: Identifies the derived value (e.g., ("dashboard", project_root))
+            build: Computes the value from the current state
+
+        Returns:
+            Cached or freshly built value
+        """
+        entry = self._memo.get(key)
+        if entry is not None and entry[0] == self._generation:
+            return entry[1]
+        value = build()
+        self._memo[key] = (self._generation, value)
+        return value
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "ProjectStateCache":
+        """
+        Shared, long-lived cache for a project root (one per process)
+
+        The instance keeps its state in memory between requests and reloads it
+        only when the storage changes underneath it (see load_if_changed).
+
+        Args:
+            project_root: Path to project root directory
+
+        Returns:
+            ProjectStateCache instance with the project's shared SmartCache
+
+        Raises:
+            FileNotFoundError if project_root is not a directory (instances,
+            watchers and schedules live for the whole process, so only real
+            projects are registered)
+        """
+        root = os.path.abspath(project_root)
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Project not found: {project_root}")
+        key = (root, Config.STATE_BACKEND, Config.LAZY_STORIES)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                cache_file = os.path.join(root, "_bmad-output", "implementation-artifacts", "project-state.json")
+                instance = cls(cache_file, smart_cache=SmartCache.for_project(root),
+                               lazy_stories=Config.LAZY_STORIES, state_backend=Config.STATE_BACKEND)
+                if Config.FILE_WATCHER in ("auto", "polling"):
+                    instance.watcher = ProjectWatcher(root, mode=Config.FILE_WATCHER)
+                    instance.watcher.start()
+                if Config.REFRESH_SCHEDULER:
+                    RefreshScheduler.shared().register(root, instance)
+                cls._instances[key] = instance
+            return instance
+
+    def load_if_changed(self) -> ProjectState:
+        """
+        Return the in-memory state, reloading it only if the storage was
+        changed by someone else (another worker, a cache clear) since we last
+        loaded or saved it. Costs one stat() per backing file otherwise, or
+        nothing when a file watcher reports no state file writes.
+        """
+        if self._watching and self.cache_data is not None and not self.watcher.take_state_change():
+            return self.cache_data
+        if self.smart_cache:
+            self.smart_cache.reload_if_changed()
+        if self.cache_data is None or self.store.signature() != self._store_signature:
+            if self.cache_data is not None:
+                logger.info(f"{self.cache_file} changed on disk - reloading project state")
+            return self.load()
+        return self.cache_data
 
     def load(self) -> ProjectState:
         """
         Load project state from cache file.
         If file is missing or invalid, initializes a new empty state.
         """
-        if not self.cache_file.exists():
+        if not self.store.exists():
             logger.info(f"Cache file {self.cache_file} not found. Creating new.")
             self.cache_data = ProjectState(
                 project={"name": "BMAD Dash", "bmad_version": "latest"},
@@ -39,11 +237,10 @@ class ProjectStateCache:
             return self.cache_data
         
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.cache_data = ProjectState.from_dict(data)
-                return self.cache_data
-        except (json.JSONDecodeError, IOError) as e:
+            self.cache_data = self.store.load()
+            self._store_signature = self.store.signature()
+            return self.cache_data
+        except (CodecError, json.JSONDecodeError, IOError, sqlite3.Error) as e:
             logger.error(f"Error loading cache: {e}")
             # Fallback to empty state
             self.cache_data = ProjectState(
@@ -52,6 +249,7 @@ class ProjectStateCache:
                 epics={},
                 stories={}
             )
+            self._store_signature = self.store.signature()
             return self.cache_data
 
     def save(self):
@@ -59,15 +257,20 @@ class ProjectStateCache:
         if not self.cache_data:
             return
             
-        # Ensure directory exists
-        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache_data.to_dict(), f, indent=2)
-        except IOError as e:
+            merged = self.store.save(self.cache_data, include_story_details=not self.lazy_stories)
+            # After merging another worker's changes the file is ahead of us: reload on next read
+            self._store_signature = None if merged else self.store.signature()
+        except (CodecError, IOError, sqlite3.Error) as e:
             logger.error(f"Error saving cache: {e}")
 
+    def _release_story_details(self):
+        """In lazy story mode, drop resident task lists and keep only counters"""
+        if not self.lazy_stories or not self.cache_data:
+            return
+        for story in self.cache_data.stories.values():
+            story.unload_details()
+
     def get_story(self, story_id: str) -> Optional[Story]:
         """Get a story by ID from the cache"""
         if not self.cache_data:
@@ -90,6 +293,7 @@ class ProjectStateCache:
         for k, v in data.items():
             if hasattr(story, k):
                 setattr(story, k, v)
+        self.mark_changed(ChangeSet(story_ids={story_id}))
         
         # Save changes
         self.save()
@@ -140,19 +344,122 @@ class ProjectStateCache:
             ProjectState with all stories and their evidence
         """
         logger.info("Bootstrapping project state...")
+        perf = PerfRun("bootstrap", project_root)
+        state, to_collect, smart_cache = self._bootstrap_skeleton(project_root, use_smart_cache, perf)
+
+        # Git and test evidence for cache misses, collected concurrently per story
+        with perf.phase("evidence_collection"):
+            failures = EvidenceCollector(project_root, perf=perf).collect_all(to_collect)
+        if failures:
+            logger.warning(f"Evidence collection failed for {failures} of {len(to_collect)} stories")
+
+        self._finish_bootstrap(project_root, state, smart_cache, perf)
+        report = perf.finish(stories=len(state.stories), cache_hits=len(state.stories) - len(to_collect),
+                             cache_misses=len(to_collect), failures=failures)
+        perf_log.record(report)
+        logger.info(f"Bootstrap complete in {report['total_ms'] / 1000:.1f}s. "
+                    f"Cache hits: {report['cache_hits']}, Cache misses: {report['cache_misses']}")
+        return state
+
+    @property
+    def bootstrap_in_progress(self) -> bool:
+        """True while a progressive bootstrap is still collecting evidence"""
+        return self.bootstrap_stream is not None and not self.bootstrap_stream.closed
+
+    def start_progressive_bootstrap(self, project_root: str) -> EvidenceStream:
+        """
+        Bootstrap without waiting for evidence
 
+        The skeleton (epics, stories, statuses, SmartCache hits) becomes the
+        in-memory state immediately; stories still being collected carry
+        pending evidence. A background thread collects the rest, publishing
+        each story's evidence to the returned stream, then runs gap detection
+        and saves the state as bootstrap() would. Call with `lock` held.
+
+        Args:
+            project_root: Path to the project root directory
+
+        Returns:
+            EvidenceStream of the running (or already running) bootstrap
+        """
+        if self.bootstrap_in_progress:
+            return self.bootstrap_stream
+
+        logger.info("Bootstrapping project state progressively...")
+        perf = PerfRun("bootstrap", project_root)
+        state, to_collect, smart_cache = self._bootstrap_skeleton(project_root, True, perf)
+        for story in to_collect:
+            story.evidence = pending_evidence()
+
+        stream = EvidenceStream(total=len(to_collect))
+        self.cache_data = state
+        self._store_signature = self.store.signature()  # Keep the skeleton until the bootstrap saves
+        self.bootstrap_stream = stream
+
+        thread = threading.Thread(
+            target=self._run_progressive_bootstrap,
+            args=(project_root, state, to_collect, smart_cache, stream, perf),
+            name=f"bmad-bootstrap-{os.path.basename(os.path.abspath(project_root))}",
+            daemon=True
+        )
+        thread.start()
+        return stream
+
+    def _run_progressive_bootstrap(self, project_root: str, state: ProjectState, to_collect: list,
+                                   smart_cache: Optional[SmartCache], stream: EvidenceStream, perf: PerfRun):
+        """Background half of start_progressive_bootstrap"""
+        error = None
+        try:
+            failures = 0
+            collector = EvidenceCollector(project_root, perf=perf)
+            with perf.phase("evidence_collection"):
+                for story, evidence, ok in collector.iter_collect(to_collect):
+                    with self.lock:
+                        story.evidence = evidence
+                        self.mark_changed(ChangeSet(story_ids={story.story_id}))
+                    stream.publish(story.story_id, summarize_evidence(evidence))
+                    failures += 0 if ok else 1
+            if failures:
+                logger.warning(f"Evidence collection failed for {failures} of {len(to_collect)} stories")
+
+            with self.lock:
+                if self.cache_data is state:
+                    self._finish_bootstrap(project_root, state, smart_cache, perf)
+                    perf_log.record(perf.finish(
+                        stories=len(state.stories), cache_hits=len(state.stories) - len(to_collect),
+                        cache_misses=len(to_collect), failures=failures, progressive=True
+                    ))
+                    logger.info(f"Progressive bootstrap complete ({len(to_collect)} stories collected)")
+                else:
+                    logger.info("Project state replaced during progressive bootstrap - discarding its results")
+        except Exception as e:
+            logger.error(f"Progressive bootstrap failed: {e}")
+            error = str(e)
+            with self.lock:
+                if self.cache_data is state:
+                    self.cache_data = None  # Next request bootstraps again instead of serving pending evidence
+        finally:
+            stream.close(error)
+
+    def _bootstrap_skeleton(self, project_root: str, use_smart_cache: bool, perf: Optional[PerfRun] = None):
+        """
+        Parse epics/stories/statuses and apply SmartCache hits, without collecting evidence
+
+        Returns:
+            (ProjectState, stories that still need evidence, SmartCache or None)
+        """
         # We perform lazy import to avoid circular dependencies
         from ..parsers.bmad_parser import BMADParser
-        from ..services.git_correlator import GitCorrelator
-        from ..services.test_discoverer import TestDiscoverer
         from ..services.workflow_status_validator import WorkflowStatusValidator
         
         parser = BMADParser(project_root)
-        project_model = parser.parse_project()
+        with timed(perf, "parse_project"):
+            project_model = parser.parse_project()
 
         # Validate workflow-status file
-        validator = WorkflowStatusValidator(project_root)
-        workflow_validation = validator.validate()
+        with timed(perf, "workflow_validation"):
+            validator = WorkflowStatusValidator(project_root)
+            workflow_validation = validator.validate()
 
         # Log validation warnings/errors
         if not workflow_validation.is_valid:
@@ -177,16 +484,12 @@ class ProjectStateCache:
         smart_cache = self.smart_cache
         if use_smart_cache and not smart_cache:
             smart_cache = SmartCache(project_root)
+        if not use_smart_cache:
+            smart_cache = None
         
-        # Initialize evidence collectors (lazy-loaded as needed)
-        git_correlator = None
-        test_discoverer = None
-        
-        total_stories = len(stories)
-        cache_hits = 0
-        cache_misses = 0
+        to_collect = []
         
-        logger.info(f"Collecting evidence for {total_stories} stories...")
+        logger.info(f"Collecting evidence for {len(stories)} stories...")
         
         for story_id, story in stories.items():
             story_file_path = story.file_path or os.path.join(
@@ -196,110 +499,20 @@ class ProjectStateCache:
             )
             
             # Check SmartCache for done stories (skip expensive git/test work)
-            use_cache = False
-            if use_smart_cache and smart_cache and story.status == "done":
-                cached_evidence, cache_hit = smart_cache.get_story_evidence(
-                    story_id, story_file_path
-                )
+            if smart_cache and story.status == "done":
+                with timed(perf, "smart_cache_lookup"):
+                    cached_evidence, cache_hit = smart_cache.get_story_evidence(
+                        story_id, story_file_path
+                    )
                 if cache_hit:
                     story.evidence = cached_evidence
-                    cache_hits += 1
-                    use_cache = True
                     logger.debug(f"Cache HIT for done story {story_id}")
-                else:
-                    cache_misses += 1
-                    logger.debug(f"Cache MISS for done story {story_id}")
-            else:
-                # Active stories always refresh
-                cache_misses += 1
+                    continue
+                logger.debug(f"Cache MISS for done story {story_id}")
             
-            if not use_cache:
-                # Initialize default evidence structure to prevent frontend partial-failure crashes (Fix #5)
-                story.evidence = {
-                    "commits": [],
-                    "commit_count": 0,
-                    "status": "unknown",
-                    "tests_passed": 0,
-                    "tests_total": 0,
-                    "healthy": False,
-                    "failing_tests": [],
-                    "test_files": []
-                }
-
-                # Lazy-load evidence collectors only when needed
-                if not git_correlator:
-                    git_correlator = GitCorrelator(project_root)
-                if not test_discoverer:
-                    test_discoverer = TestDiscoverer(project_root)
-                
-                # Get Git Evidence and Infer Tasks
-                try:
-                    commits = git_correlator.get_commits_for_story(story_id)
-                    if commits:
-                        # Store rich evidence for instant frontend display
-                        story.evidence["commits"] = [c.to_dict() for c in commits]
-                        story.evidence["commit_count"] = len(commits)
-                        last_commit = max(c.timestamp for c in commits)
-                        story.evidence["last_commit"] = last_commit.isoformat()
-                        
-                        # Calculate status based on recency
-                        status, _ = git_correlator.calculate_status(commits)
-                        story.evidence["status"] = status
-                        
-                        # Infer task progress (Task 6)
-                        for commit in commits:
-                            completed_task_nums = git_correlator.extract_task_references(commit.message)
-                            for task_num in completed_task_nums:
-                                task_str_id = str(task_num)
-                                for task in story.tasks:
-                                    if task.task_id == task_str_id and task.status != "done":
-                                        task.status = "done"
-                                        task.inferred = True
-                                        logger.info(f"Inferred task {task_str_id} done for story {story_id} from commit")
-                except Exception as e:
-                    logger.warning(f"Git evidence collection failed for {story_id}: {e}")
-                    
-                # Get Test Evidence
-                try:
-                    # PERFORMANCE FIX: Don't run full tests during bootstrap for all stories.
-                    # Just discover the files for now. Full parsing happens during sync/detail fetch.
-                    test_files = test_discoverer.discover_tests_for_story(story_id)
-                    story.evidence["test_files"] = test_files
-                    
-                    # Only do full test parse (subprocess run) for active stories
-                    if story.status in ["in-progress", "review"] and test_files:
-                        test_ev = test_discoverer.get_test_evidence_for_story(story_id, project_root)
-                        if test_ev:
-                            story.evidence["tests_passed"] = test_ev.pass_count
-                            story.evidence["tests_total"] = test_ev.pass_count + test_ev.fail_count
-                            story.evidence["healthy"] = (test_ev.fail_count == 0) and (test_ev.pass_count > 0)
-                            story.evidence["failing_tests"] = test_ev.failing_test_names
-                            if test_ev.last_run_time:
-                                 story.evidence["last_test_run"] = test_ev.last_run_time.isoformat()
-                    # For DONE stories, perform a fast static count to avoid "No tests found" warning
-                    # We assume if it's DONE, tests passed. We just need to report existence.
-                    elif story.status == "done" and test_files:
-                        total_count = 0
-                        for tf in test_files:
-                            total_count += test_discoverer.count_tests_static(tf)
-                        
-                        story.evidence["tests_passed"] = total_count
-                        story.evidence["tests_total"] = total_count
-                        story.evidence["healthy"] = (total_count > 0)
-                        # Estimate last run time from file mtime
-                        try:
-                            last_mtime = max(os.path.getmtime(tf) for tf in test_files)
-                            story.evidence["last_test_run"] = datetime.fromtimestamp(last_mtime).isoformat()
-                        except:
-                            pass
-                except Exception as e:
-                    logger.warning(f"Test evidence collection failed for {story_id}: {e}")
-                
-                # Update but don't save yet (save once at the end for performance)
-                if use_smart_cache and smart_cache:
-                    # We'll save the whole structure at the end of bootstrap
-                    pass
-                
+            # Active stories always refresh
+            to_collect.append(story)
+        
         # Create State
         # Infer current story? For now leaving empty or simple
         state = ProjectState(
@@ -313,80 +526,338 @@ class ProjectStateCache:
             epics=epics,
             stories=stories,
             version="1.0",
-            workflow_validation=workflow_validation.to_dict()
+            workflow_validation=workflow_validation.to_dict(),
         )
+        # development_status snapshot lets sync diff later sprint-status.yaml edits
+        development_status = parser.read_development_status()
+        if isinstance(development_status, dict):
+            state.development_status = development_status
+        sprint_status_path = os.path.join(project_root, "_bmad-output/implementation-artifacts/sprint-status.yaml")
+        if os.path.exists(sprint_status_path):
+            state.sprint_status_mtime = os.path.getmtime(sprint_status_path)
+
+        return state, to_collect, smart_cache
+
+    def _finish_bootstrap(self, project_root: str, state: ProjectState, smart_cache: Optional[SmartCache],
+                          perf: Optional[PerfRun] = None):
+        """Detect gaps, store evidence in the SmartCache and save the bootstrapped state"""
+        from ..services.gap_detector import GapDetector
+
+        tracker = self.freshness(project_root)
+        signatures = tracker.signatures(state)
+
+        # Evidence-based workflow gaps, evaluated in one pass over collected evidence
+        with timed(perf, "gap_detection"):
+            GapDetector(project_root).detect(state.stories.values())
         
         # Save SmartCache at the end of bootstrap (much faster)
-        if use_smart_cache and smart_cache:
-            from datetime import datetime, timezone
-            for sid, s in stories.items():
-                s_file_path = s.file_path or os.path.join(
-                    project_root, "_bmad-output/implementation-artifacts", f"{s.story_key}.md"
-                )
-                # Ensure evidence is stored in the cache object before final save
-                smart_cache._cache_data["stories"][sid] = {
-                    "title": s.title,
-                    "status": s.status,
-                    "file_mtime": os.path.getmtime(s_file_path) if os.path.exists(s_file_path) else 0,
-                    "evidence": s.evidence,
-                    "cached_at": datetime.now(timezone.utc).isoformat()
-                }
-            smart_cache._save_cache(smart_cache._cache_data)
+        if smart_cache:
+            with timed(perf, "smart_cache_save"):
+                with smart_cache.batch():
+                    for sid, s in state.stories.items():
+                        s_file_path = s.file_path or os.path.join(
+                            project_root, "_bmad-output/implementation-artifacts", f"{s.story_key}.md"
+                        )
+                        # Ensure evidence is stored in the cache object before final save
+                        smart_cache.set_story_evidence(sid, s_file_path, s.status, s.evidence, s.title)
+                smart_cache.flush(force=True)
 
         self.cache_data = state
-        self.save()
-        logger.info(f"Bootstrap complete. Cache hits: {cache_hits}, Cache misses: {cache_misses}")
-        return state
+        with timed(perf, "state_save"):
+            self._release_story_details()
+            self.save()
+        tracker.mark_fresh(signatures)
+
+    @property
+    def _watching(self) -> bool:
+        return self.watcher is not None and self.watcher.active
 
     def sync(self, project_root: str):
         """
         Sync cache with file system.
         Checks mtimes of stories. Reparses only what changed.
+
+        With a file watcher, only stories and evidence reported dirty are
+        processed, and a sync with nothing dirty touches no files at all.
+        """
+        if self.bootstrap_in_progress:
+            return  # The progressive bootstrap owns the state until it finishes
+
+        dirty = self.watcher.drain() if self._watching else None
+        if dirty is not None and dirty.is_empty() and self.cache_data is not None:
+            return
+
+        perf = PerfRun("sync", project_root)
+        try:
+            summary = self._sync(project_root, dirty, perf)
+        except Exception:
+            if dirty is not None:
+                self.watcher.mark_full()  # Changes were drained but not applied
+            raise
+        if summary is not None:
+            perf_log.record(perf.finish(**summary))
+
+    def refresh(self, project_root: str, progressive: bool = False) -> Optional[ProjectState]:
+        """
+        Bring the shared state up to date: reload, then bootstrap or sync
+
+        Concurrent callers are coalesced per (project_root, operation): while a
+        bootstrap or sync is running, other callers wait for it and share its
+        outcome instead of running their own. Call without holding `lock`.
+
+        Args:
+            project_root: Path to the project root directory
+            progressive: Start a progressive bootstrap instead of a blocking one
+
+        Returns:
+            Current state (a skeleton while a progressive bootstrap runs)
+        """
+        # A running bootstrap/sync holds `lock`: join it rather than queue behind it
+        for operation in ("bootstrap", "sync"):
+            key = self._flight_key(project_root, operation)
+            if single_flight.in_flight(key):
+                single_flight.do(key, lambda: self._run_refresh(project_root, operation))
+                return self.cache_data
+
+        with self.lock:
+            if self.bootstrap_in_progress:
+                # Skeleton from a progressive bootstrap; evidence is still streaming
+                return self.cache_data
+
+            # In-memory state, reloaded only if the stored state changed on disk
+            state = self.load_if_changed()
+            if not state.epics and progressive:
+                logger.info("Cache empty or no epics - starting progressive bootstrap...")
+                self.start_progressive_bootstrap(project_root)
+                return self.cache_data
+            operation = "sync" if state.epics else "bootstrap"
+
+        single_flight.do(self._flight_key(project_root, operation), lambda: self._run_refresh(project_root, operation))
+        return self.cache_data
+
+    def freshness(self, project_root: str) -> FreshnessTracker:
+        """Freshness tracker of the evidence in this instance's state"""
+        if self._freshness is None:
+            self._freshness = FreshnessTracker(project_root)
+        return self._freshness
+
+    def start_revalidation(self, project_root: str, parts=FRESHNESS_PARTS) -> bool:
+        """
+        Run revalidate() in a background thread, unless one is already running
+
+        Call without holding `lock`.
+
+        Args:
+            project_root: Path to the project root directory
+            parts: Stale parts from FRESHNESS_PARTS
+
+        Returns:
+            True if a revalidation was started
+        """
+        if self.revalidating(project_root):
+            return False
+
+        def run():
+            try:
+                self.run_revalidation(project_root, parts)
+            except Exception as e:
+                logger.error(f"Background revalidation failed: {e}")
+
+        thread = threading.Thread(
+            target=run, name=f"bmad-revalidate-{os.path.basename(os.path.abspath(project_root))}", daemon=True
+        )
+        self._revalidation_thread = thread  # Counts as revalidating before it joins the flight
+        thread.start()
+        return True
+
+    def run_revalidation(self, project_root: str, parts=FRESHNESS_PARTS, budget: Optional[RefreshBudget] = None):
+        """revalidate(), or wait for the one already running for this state"""
+        single_flight.do(self._flight_key(project_root, "revalidate"),
+                         lambda: self.revalidate(project_root, parts, budget))
+
+    def revalidating(self, project_root: str) -> bool:
+        """True while a revalidation of this state is running"""
+        thread = self._revalidation_thread
+        return (thread is not None and thread.is_alive()) or \
+            single_flight.in_flight(self._flight_key(project_root, "revalidate"))
+
+    def revalidate(self, project_root: str, parts=FRESHNESS_PARTS, budget: Optional[RefreshBudget] = None):
+        """
+        Sync, then refresh the given evidence parts (blocking)
+
+        git and tests re-collect the evidence of in-progress/review stories
+        (tests are re-run, not only rediscovered); review reparses stories
+        whose code-review file appeared or disappeared since the last check.
+
+        Collection runs on copies of the stories without holding `lock`, so
+        readers are not blocked by git or test subprocesses; the results are
+        merged under the lock afterwards. Stories changed by someone else in
+        the meantime keep their newer state. Collection waits for a slot of
+        the process-wide RefreshBudget. Call without holding `lock`.
+
+        Args:
+            project_root: Path to the project root directory
+            parts: Parts from FRESHNESS_PARTS
+            budget: RefreshBudget to take a slot from (default: RefreshBudget.shared())
         """
+        self.refresh(project_root)
+        with self.lock:
+            state = self.cache_data
+            if self.bootstrap_in_progress or not (state and state.epics):
+                return
+            tracker = self.freshness(project_root)
+            previous_review = tracker.last_signature(PART_REVIEW)
+            # Taken before collecting: changes made meanwhile stay stale
+            signatures = tracker.signatures(state, parts)
+            reviewed = set()
+            if PART_REVIEW in parts:
+                review_ids = signatures[PART_REVIEW]
+                reviewed = set(review_ids ^ previous_review if previous_review is not None else review_ids)
+                reviewed &= set(state.stories)
+            kinds = {kind for part, kind in ((PART_GIT, EVIDENCE_GIT), (PART_TESTS, EVIDENCE_TESTS)) if part in parts}
+            originals = {
+                story_id: story for story_id, story in state.stories.items()
+                if story_id in reviewed or (kinds and story.status in ACTIVE_STATUSES)
+            }
+            work = {story_id: copy.deepcopy(story) for story_id, story in originals.items()}
+            generation = self._generation
+
+        perf = PerfRun("revalidate", project_root)
+        collected = {}
+        if work:
+            budget = budget or RefreshBudget.shared()
+            with timed(perf, "budget_wait"):
+                budget.acquire()
+            started = time.monotonic()
+            try:
+                collected = self._collect_revalidation(project_root, work, reviewed, kinds, perf)
+            finally:
+                budget.release(time.monotonic() - started)
+
+        with self.lock:
+            merged = []
+            if self.cache_data is not state:
+                logger.info("Project state replaced during revalidation - discarding its results")
+            else:
+                changed = self.changes_since(generation)
+                skip = set(originals) if changed is None else changed.story_ids
+                with self.smart_cache.batch() if self.smart_cache else nullcontext():
+                    for story_id, story in collected.items():
+                        original = originals[story_id]
+                        if story_id in skip or state.stories.get(story_id) is not original:
+                            continue  # Updated meanwhile: the newer state wins
+                        vars(original).update(vars(story))  # In place: epics reference the same object
+                        self._store_evidence(project_root, original)
+                        merged.append(original)
+                if merged:
+                    self.mark_changed(ChangeSet(story_ids={s.story_id for s in merged}))
+                    with timed(perf, "state_save"):
+                        self._release_story_details()
+                        self.save()
+            tracker.mark_fresh(signatures)
+        perf_log.record(perf.finish(parts=sorted(parts), reviewed=len(reviewed), refreshed=len(merged)))
+
+    def _collect_revalidation(self, project_root: str, work: Dict[str, Story], reviewed: set, kinds: set,
+                              perf: PerfRun) -> Dict[str, Story]:
+        """
+        Reparse reviewed stories and re-collect evidence on private copies (no lock needed)
+
+        Returns:
+            Dict of story_id -> refreshed copy
+        """
+        from ..parsers.bmad_parser import BMADParser
+        from ..services.gap_detector import GapDetector
+
+        collector = EvidenceCollector(project_root, perf=perf)
+        parser = BMADParser(project_root) if reviewed else None
+        collected = {}
+        for story_id, story in work.items():
+            if story_id in reviewed:
+                with timed(perf, "parse_story", story_id):
+                    new_story = parser.parse_story(story.story_key)
+                if new_story is None:
+                    continue
+                new_story.evidence = story.evidence or _default_evidence()
+                story = new_story
+                if not kinds or story.status not in ACTIVE_STATUSES:
+                    collector.collect_git(story, story.evidence)  # As sync does for a reparsed story
+            if kinds and story.status in ACTIVE_STATUSES:
+                self._collect_evidence_kinds(story, kinds, collector, run_tests=True)
+            collected[story_id] = story
+
+        if collected:
+            with timed(perf, "gap_detection"):
+                GapDetector(project_root).detect(collected.values())
+        return collected
+
+    def _flight_key(self, project_root: str, operation: str) -> tuple:
+        # Instances with different stores for the same project hold different states
+        return flight_key(project_root, operation, str(self.cache_file))
+
+    def _run_refresh(self, project_root: str, operation: str):
+        """Coalesced body of refresh(): one bootstrap (+save) or sync"""
+        with self.lock:
+            # SmartCache evidence writes from bootstrap/sync are flushed once per refresh
+            with self.smart_cache.batch() if self.smart_cache else nullcontext():
+                if operation == "sync":
+                    # Sync with file system (only re-parses changed stories)
+                    self.sync(project_root)
+                elif not (self.cache_data and self.cache_data.epics):
+                    logger.info("Cache empty or no epics - running bootstrap...")
+                    self.bootstrap(project_root)
+                    self.save()
+                # else: bootstrapped by a flight that finished after our check
+
+    def _sync(self, project_root: str, dirty: Optional[DirtySet], perf: Optional[PerfRun] = None) -> Optional[Dict[str, Any]]:
+        """
+        Apply file changes (all files when dirty is None or a full sweep)
+
+        Returns:
+            Run summary for the timing report, or None if a bootstrap ran instead
+        """
+        full_sweep = dirty is None or dirty.full
+
         if not self.cache_data:
             self.load()
             
-        if not self.cache_file.exists():
+        if not self.store.exists():
             logger.info("Cache file missing on disk - bootstrapping...")
             self.bootstrap(project_root)
-            return
+            return None
 
-        # Check sprint-status.yaml for changes (Story 5.4 Fix)
-        sprint_status_path = os.path.join(project_root, "_bmad-output/implementation-artifacts/sprint-status.yaml")
-        if os.path.exists(sprint_status_path):
-            current_sprint_mtime = os.path.getmtime(sprint_status_path)
-            if current_sprint_mtime > self.sprint_status_mtime:
-                logger.info("sprint-status.yaml changed - triggering partial bootstrap for epics...")
-                self.sprint_status_mtime = current_sprint_mtime
-                # We need to re-parse project structure but keep existing story evidence if possible
-                from ..parsers.bmad_parser import BMADParser
-                parser = BMADParser(project_root)
-                project_model = parser.parse_project()
-                if project_model:
-                    # Update project metadata
-                    self.cache_data.project["phase"] = project_model.phase
-                    
-                    # Update Epics
-                    new_epics = {}
-                    for epic in project_model.epics:
-                        epic_key = f"epic-{epic.epic_id}" if not epic.epic_id.startswith("epic-") else epic.epic_id
-                        new_epics[epic_key] = epic
-                    self.cache_data.epics = new_epics
-                    updated = True
-            
         # If still no epics or stories after load, trigger bootstrap
         if not self.cache_data.epics or not self.cache_data.stories:
             logger.info("Cache empty or missing critical data during sync - bootstrapping...")
             self.bootstrap(project_root)
-            return            
+            return None
         from ..parsers.bmad_parser import BMADParser
+        from ..utils.artifact_index import ArtifactIndex
         import re
         
         parser = BMADParser(project_root)
-        story_files = parser.find_all_story_files()
-        
         updated = False
-        git_correlator = None
+        collector = None
+        reparsed_stories = []
+        changes = ChangeSet()
+        
+        # Check sprint-status.yaml for changes (Story 5.4 Fix)
+        sprint_status_path = os.path.join(project_root, "_bmad-output/implementation-artifacts/sprint-status.yaml")
+        if (full_sweep or dirty.sprint_status) and os.path.exists(sprint_status_path):
+            current_sprint_mtime = os.path.getmtime(sprint_status_path)
+            if current_sprint_mtime != self.cache_data.sprint_status_mtime:
+                logger.info("sprint-status.yaml changed - diffing development_status...")
+                self.cache_data.sprint_status_mtime = current_sprint_mtime
+                with timed(perf, "sprint_status"):
+                    changed_stories = self._sync_sprint_status(parser, changes)
+                reparsed_stories.extend(changed_stories)
+                updated = True
+        
+        if full_sweep:
+            with timed(perf, "story_scan"):
+                story_files = parser.find_all_story_files()
+        else:
+            artifact_index = ArtifactIndex.for_project(project_root)
+            story_files = [f for f in map(artifact_index.story_file, sorted(dirty.story_ids)) if f]
         
         for file_path in story_files:
             try:
@@ -407,48 +878,37 @@ class ProjectStateCache:
             # Check cache
             cached_story = self.cache_data.stories.get(story_id)
             
-            if cached_story:
-                # Compare mtime (float comparison with epsilon)
-                # mtime can be float, give some buffer
-                if abs(cached_story.mtime - mtime) < 0.5:
+            if cached_story and not (dirty and story_id in dirty.reviews):
+                if cached_story.file_fingerprint:
+                    # Content hash, recomputed only if (mtime_ns, size) moved
+                    with timed(perf, "fingerprint"):
+                        changed, current = content_hash.content_changed(file_path, cached_story.file_fingerprint)
+                    if not changed:
+                        if current != cached_story.file_fingerprint:
+                            # Touched but identical: remember the new stat so it is not hashed again
+                            cached_story.file_fingerprint = current
+                            cached_story.mtime = mtime
+                            updated = True
+                        continue
+                elif abs(cached_story.mtime - mtime) < 0.5:
+                    # Entries written before fingerprints: mtime with tolerance
                     continue
             
             # Reparse
             logger.info(f"Story {story_id} changed. Reparsing...")
-            new_story = parser.parse_story(story_key)
+            with timed(perf, "parse_story", story_id):
+                new_story = parser.parse_story(story_key)
             
             if new_story:
                 # Re-run evidence collection and inference for the changed story
                 # We do this because file changes might invalidate previous inference 
                 # or we might want new evidence status
                 # Lazy load collectors only if needed
-                if not git_correlator:
-                    from ..services.git_correlator import GitCorrelator
-                    git_correlator = GitCorrelator(project_root)
+                if collector is None:
+                    collector = EvidenceCollector(project_root, perf=perf)
                 
-                try:
-                    commits = git_correlator.get_commits_for_story(story_id)
-                    if commits:
-                        new_story.evidence = new_story.evidence or {}
-                        new_story.evidence["commits"] = [c.to_dict() for c in commits]
-                        new_story.evidence["commit_count"] = len(commits)
-                        last_commit = max(c.timestamp for c in commits) 
-                        new_story.evidence["last_commit"] = last_commit.isoformat()
-                        
-                        status, _ = git_correlator.calculate_status(commits)
-                        new_story.evidence["status"] = status
-                        
-                        # Infer task progress
-                        for commit in commits:
-                            completed_task_nums = git_correlator.extract_task_references(commit.message)
-                            for task_num in completed_task_nums:
-                                task_str_id = str(task_num)
-                                for task in new_story.tasks:
-                                    if task.task_id == task_str_id and task.status != "done":
-                                        task.status = "done"
-                                        task.inferred = True
-                except Exception as e:
-                    logger.warning(f"Git evidence collection failed for {story_id} during sync: {e}")
+                new_story.evidence = new_story.evidence or {}
+                collector.collect_git(new_story, new_story.evidence)
                 
                  # Preserve test evidence (expensive to re-run?) 
                  # Or maybe re-run it? For now, we'll preserve unless we implement TestDiscoverer in sync
@@ -459,27 +919,202 @@ class ProjectStateCache:
                              new_story.evidence[k] = v
 
                 self.cache_data.stories[new_story.story_id] = new_story
+                reparsed_stories.append(new_story)
                 
                 # Store in SmartCache after re-parsing (Story 5.55 Fix)
-                if self.smart_cache:
-                    story_file_path = new_story.file_path or os.path.join(
-                        project_root,
-                        "_bmad-output/implementation-artifacts",
-                        f"{new_story.story_key}.md"
-                    )
-                    self.smart_cache.set_story_evidence(
-                        new_story.story_id, 
-                        story_file_path, 
-                        new_story.status, 
-                        new_story.evidence, 
-                        new_story.title
-                    )
+                self._store_evidence(project_root, new_story)
                 
                 updated = True
         
+        # New commits or test changes reported by the watcher refresh active stories
+        if dirty is not None and dirty.evidence:
+            refreshed = self._refresh_active_evidence(
+                project_root, dirty.evidence, collector or EvidenceCollector(project_root, perf=perf),
+                skip={s.story_id for s in reparsed_stories}
+            )
+            reparsed_stories.extend(refreshed)
+            updated = updated or bool(refreshed)
+        
+        if reparsed_stories:
+            from ..services.gap_detector import GapDetector
+            with timed(perf, "gap_detection"):
+                GapDetector(project_root).detect(reparsed_stories)
+        
         if updated:
-            self.save()
+            changes.story_ids.update(s.story_id for s in reparsed_stories)
+            self.mark_changed(changes)
+            with timed(perf, "state_save"):
+                self._release_story_details()
+                self.save()
+
+        return {"full_sweep": full_sweep, "stories_checked": len(story_files),
+                "reparsed": len(reparsed_stories), "updated": updated}
+
+    def _store_evidence(self, project_root: str, story: Story):
+        """Write a story's evidence to the SmartCache, if configured"""
+        if not self.smart_cache:
+            return
+        story_file_path = story.file_path or os.path.join(
+            project_root,
+            "_bmad-output/implementation-artifacts",
+            f"{story.story_key}.md"
+        )
+        self.smart_cache.set_story_evidence(
+            story.story_id, 
+            story_file_path, 
+            story.status, 
+            story.evidence, 
+            story.title
+        )
+
+    def _refresh_active_evidence(self, project_root: str, kinds: set, collector=None, skip=()) -> list:
+        """
+        Re-collect evidence of in-progress/review stories after watched git refs
+        (EVIDENCE_GIT) or test files (EVIDENCE_TESTS) changed (test files are
+        only rediscovered, not re-run)
+
+        Returns:
+            Stories whose evidence was refreshed
+        """
+        active = [
+            story for story in self.cache_data.stories.values()
+            if story.status in ACTIVE_STATUSES and story.story_id not in skip
+        ]
+        if not active:
+            return []
+
+        collector = collector or EvidenceCollector(project_root)
+        for story in active:
+            self._collect_evidence_kinds(story, kinds, collector)
+            self._store_evidence(project_root, story)
+
+        logger.info(f"Refreshed {'/'.join(sorted(kinds))} evidence for {len(active)} active stories")
+        return active
+
+    @staticmethod
+    def _collect_evidence_kinds(story: Story, kinds: set, collector, run_tests: bool = False):
+        """
+        Re-collect EVIDENCE_GIT / EVIDENCE_TESTS evidence of one story in place
 
+        EVIDENCE_TESTS only rediscovers test files unless run_tests is set,
+        which re-runs them for fresh pass/fail counts.
+        """
+        if story.evidence is None:
+            story.evidence = _default_evidence()
+        if EVIDENCE_GIT in kinds:
+            collector.collect_git(story, story.evidence)
+        if EVIDENCE_TESTS in kinds and run_tests:
+            collector.collect_tests(story, story.evidence)
+        elif EVIDENCE_TESTS in kinds:
+            try:
+                with timed(collector.perf, "test_discovery", story.story_id):
+                    story.evidence["test_files"] = collector.test_discoverer.discover_tests_for_story(story.story_id)
+            except Exception as e:
+                logger.warning(f"Test discovery failed for {story.story_id} during sync: {e}")
+
+    def _sync_sprint_status(self, parser, changes: Optional[ChangeSet] = None) -> list:
+        """
+        Apply a sprint-status.yaml change by diffing development_status against
+        the snapshot from the last sync. Only story entries whose key or status
+        changed are re-parsed; unchanged Epic/Story objects stay in place.
+        
+        Args:
+            parser: BMADParser for the project
+            changes: Collects removed stories and changed epics (re-parsed
+                stories are in the returned list)
+            
+        Returns:
+            List of re-parsed Story objects
+        """
+        changes = changes if changes is not None else ChangeSet()
+        new_status = parser.read_development_status()
+        if new_status is None:
+            # Nested epics format or unreadable file: rebuild the epic map only
+            project_model = parser.parse_project()
+            if project_model:
+                self.cache_data.project["phase"] = project_model.phase
+                changes.epic_keys.update(self.cache_data.epics)
+                self.cache_data.epics = {
+                    (f"epic-{e.epic_id}" if not e.epic_id.startswith("epic-") else e.epic_id): e
+                    for e in project_model.epics
+                }
+                changes.epic_keys.update(self.cache_data.epics)
+            return []
+        
+        old_status = self.cache_data.development_status or {}
+        changed_keys = [k for k, v in new_status.items() if old_status.get(k) != v]
+        removed_keys = [k for k in old_status if k not in new_status]
+        self.cache_data.development_status = new_status
+        
+        affected_epics = set()
+        reparsed = []
+        
+        for key in removed_keys:
+            story_data = parser.story_entry(key, old_status[key])
+            if story_data:
+                story = self.cache_data.stories.get(story_data['story_id'])
+                if story and story.story_key == key:
+                    del self.cache_data.stories[story_data['story_id']]
+                    changes.story_ids.add(story_data['story_id'])
+                affected_epics.add(story_data['epic'])
+            elif parser.epic_entry(key) is not None:
+                self.cache_data.epics.pop(f"epic-{parser.epic_entry(key)}", None)
+                changes.epic_keys.add(f"epic-{parser.epic_entry(key)}")
+        
+        for key in changed_keys:
+            epic_num = parser.epic_entry(key)
+            if epic_num is not None:
+                epic = self.cache_data.epics.get(f"epic-{epic_num}")
+                changes.epic_keys.add(f"epic-{epic_num}")
+                if epic:
+                    epic.status = new_status[key]
+                else:
+                    affected_epics.add(epic_num)
+                continue
+            
+            story_data = parser.story_entry(key, new_status[key])
+            if not story_data:
+                continue
+            
+            new_story = parser._parse_story_file(story_data)
+            if not new_story:
+                continue
+            
+            # Keep collected evidence; the per-file pass below refreshes it when the file changed
+            old_story = self.cache_data.stories.get(new_story.story_id)
+            new_story.evidence = old_story.evidence if old_story and old_story.evidence else _default_evidence()
+            
+            self.cache_data.stories[new_story.story_id] = new_story
+            reparsed.append(new_story)
+            affected_epics.add(story_data['epic'])
+        
+        # Rebuild membership and progress for affected epics only
+        for epic_num in affected_epics:
+            epic_key = f"epic-{epic_num}"
+            changes.epic_keys.add(epic_key)
+            epic = self.cache_data.epics.get(epic_key)
+            if not epic:
+                epic = Epic(
+                    epic_id=str(epic_num),
+                    title=f"Epic {epic_num}",
+                    status=new_status.get(epic_key, 'backlog')
+                )
+                self.cache_data.epics[epic_key] = epic
+            epic.stories = sorted(
+                (s for s in self.cache_data.stories.values() if s.story_id.split('.')[0] == str(epic_num)),
+                key=lambda s: self._parse_story_id_for_sort(s.story_id)
+            )
+            epic.progress = {
+                "total": len(epic.stories),
+                "done": sum(1 for s in epic.stories if s.status == 'done')
+            }
+        
+        logger.info(
+            f"sprint-status.yaml diff: {len(changed_keys)} changed, {len(removed_keys)} removed, "
+            f"{len(reparsed)} stories re-parsed"
+        )
+        return reparsed
+    
     def summarize_for_ai(self) -> str:
         """
         Generate a concise summary of project state for AI context.
@@ -0,0 +1,306 @@
+"""
+BMAD Dash - Background Evidence Refresh Scheduler
+Periodically revalidates the evidence of in-progress/review stories of every
+shared project state (see ProjectStateCache.for_project), so dashboard reads
+find it already up to date instead of refreshing inside a request
+
+Each tick asks the project's FreshnessTracker which parts are stale and runs
+the same coalesced revalidation as the stale-while-revalidate dashboard.
+Ticks are spread with jitter and back off exponentially after failures. All
+evidence collection, by ticks and by stale-while-revalidate requests alike,
+shares one process-wide RefreshBudget: a cap on concurrent refreshes (each may
+spawn test subprocesses) and on the share of wall time spent refreshing.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config import Config
+from .evidence_collector import ACTIVE_STATUSES
+from .freshness import FRESHNESS_PARTS
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying a tick that found the budget exhausted (seconds)
+BUDGET_RETRY_DELAY = 1.0
+
+
+class RefreshBudget:
+    """
+    Process-wide limit on background evidence collection
+
+    At most max_concurrent refreshes run at once, and after a refresh that
+    took d seconds no new one starts for d * (1 / share - 1) seconds, so
+    refreshing takes at most `share` of wall time (subprocess time included).
+    Every revalidation takes a slot (ProjectStateCache.revalidate), whether
+    a scheduler tick or a stale-while-revalidate request started it.
+    """
+
+    _shared: Optional["RefreshBudget"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_concurrent: int = 1, share: float = 0.25, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_concurrent: Refreshes allowed at the same time
+            share: Fraction of wall time refreshes may use (0 < share <= 1)
+            clock: Monotonic time source
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.share = min(max(share, 0.01), 1.0)
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_use = 0
+        self._not_before = 0.0
+
+    @classmethod
+    def shared(cls) -> "RefreshBudget":
+        """Process-wide budget (Config.REFRESH_MAX_CONCURRENT / REFRESH_CPU_BUDGET)"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(Config.REFRESH_MAX_CONCURRENT, Config.REFRESH_CPU_BUDGET)
+            return cls._shared
+
+    def ready(self) -> bool:
+        """True if a refresh could start now"""
+        with self._cond:
+            return self._ready()
+
+    def try_acquire(self) -> bool:
+        """Take a slot if the budget allows a refresh now (never blocks)"""
+        with self._cond:
+            if not self._ready():
+                return False
+            self._in_use += 1
+            return True
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the budget allows a refresh, then take a slot
+
+        Args:
+            timeout: Longest wait in seconds (None = no limit)
+
+        Returns:
+            False if the timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._ready():
+                waits = [self._not_before - self._clock()] if self._in_use < self.max_concurrent else []
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    waits.append(remaining)
+                self._cond.wait(max(0.01, min(waits)) if waits else None)
+            self._in_use += 1
+            return True
+
+    def release(self, cost: float):
+        """
+        Return a slot
+
+        Args:
+            cost: Seconds the refresh took
+        """
+        with self._cond:
+            self._in_use -= 1
+            self._not_before = max(self._not_before, self._clock() + cost * (1 / self.share - 1))
+            self._cond.notify_all()
+
+    def _ready(self) -> bool:
+        return self._in_use < self.max_concurrent and self._clock() >= self._not_before
+
+
+@dataclass
+class _Entry:
+    """Schedule of one project"""
+    project_root: str
+    cache: Any  # ProjectStateCache
+    next_due: float
+    failures: int = 0
+    refreshes: int = 0
+    last_refresh_ms: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class RefreshScheduler:
+    """
+    Usage:
+        scheduler = RefreshScheduler.shared()   # Started on first register()
+        scheduler.register(project_root, state_cache)
+
+    Tests drive it without the thread through tick(project_root).
+    """
+
+    _shared: Optional["RefreshScheduler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, interval: Optional[float] = None, jitter: Optional[float] = None,
+                 max_backoff: Optional[float] = None, budget: Optional[RefreshBudget] = None,
+                 clock: Callable[[], float] = time.monotonic, rng: Optional[random.Random] = None):
+        """
+        Args:
+            interval: Seconds between ticks of a project (default: Config.REFRESH_INTERVAL)
+            jitter: Random spread of each delay, as a fraction (default: Config.REFRESH_JITTER)
+            max_backoff: Longest delay after repeated failures (default: Config.REFRESH_MAX_BACKOFF)
+            budget: RefreshBudget taken by each revalidation (default: RefreshBudget.shared())
+            clock: Monotonic time source
+            rng: Random source for jitter
+        """
+        self.interval = Config.REFRESH_INTERVAL if interval is None else interval
+        self.jitter = Config.REFRESH_JITTER if jitter is None else jitter
+        self.max_backoff = Config.REFRESH_MAX_BACKOFF if max_backoff is None else max_backoff
+        self.budget = budget or RefreshBudget.shared()
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def shared(cls) -> "RefreshScheduler":
+        """Process-wide scheduler"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def register(self, project_root: str, cache, start: bool = True):
+        """
+        Schedule a project's evidence refresh (first tick after one jittered interval)
+
+        Args:
+            project_root: Path to the project root directory
+            cache: The project's shared ProjectStateCache
+            start: Start the scheduler thread if not running
+        """
+        key = os.path.abspath(project_root)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = _Entry(project_root, cache, self._clock() + self._delay(self.interval))
+        self._wake.set()
+        if start:
+            self.start()
+
+    def unregister(self, project_root: str):
+        with self._lock:
+            self._entries.pop(os.path.abspath(project_root), None)
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="bmad-refresh-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def tick(self, project_root: str) -> Optional[List[str]]:
+        """
+        Refresh one project now, within the budget, and schedule its next tick
+
+        Args:
+            project_root: Registered project root
+
+        Returns:
+            Parts that were revalidated ([] if none was stale or nothing is
+            active), or None if the budget deferred the tick
+        """
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(project_root))
+        if entry is None:
+            raise ValueError(f"Project not scheduled: {project_root}")
+        return self._tick(entry)
+
+    def _tick(self, entry: _Entry) -> Optional[List[str]]:
+        # The revalidation itself takes the slot; a busy budget defers the tick instead of blocking the loop
+        if not self.budget.ready():
+            entry.next_due = self._clock() + self._delay(BUDGET_RETRY_DELAY)
+            return None
+
+        started = self._clock()
+        try:
+            parts = self._refresh(entry)
+        except Exception as e:
+            entry.failures += 1
+            entry.last_error = str(e)
+            delay = min(self.interval * 2 ** entry.failures, self.max_backoff)
+            logger.warning(f"Background refresh of {entry.project_root} failed "
+                           f"({entry.failures} in a row, next in ~{delay:.0f}s): {e}")
+            return []
+        else:
+            entry.failures = 0
+            entry.last_error = None
+            delay = self.interval
+            if parts:
+                entry.refreshes += 1
+            return parts
+        finally:
+            cost = self._clock() - started
+            entry.last_refresh_ms = round(cost * 1000, 3)
+            entry.next_due = self._clock() + self._delay(delay)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-project schedule state (for /api/perf/bootstrap)"""
+        now = self._clock()
+        with self._lock:
+            entries = list(self._entries.items())
+        return {
+            key: {
+                "next_in_ms": max(0, round((entry.next_due - now) * 1000)),
+                "failures": entry.failures,
+                "refreshes": entry.refreshes,
+                "last_refresh_ms": entry.last_refresh_ms,
+                "last_error": entry.last_error
+            }
+            for key, entry in entries
+        }
+
+    def _refresh(self, entry: _Entry) -> List[str]:
+        """Revalidate the stale parts of a project with active stories"""
+        cache, root = entry.cache, entry.project_root
+        with cache.lock:
+            state = cache.cache_data
+            if cache.bootstrap_in_progress or not (state and state.epics):
+                return []  # Requests bootstrap; the scheduler only keeps a loaded state fresh
+            if not any(story.status in ACTIVE_STATUSES for story in state.stories.values()):
+                return []
+            report = cache.freshness(root).check(state)
+        stale = [part for part in FRESHNESS_PARTS if report[part]["stale"]]
+        if stale:
+            cache.run_revalidation(root, stale, budget=self.budget)
+        return stale
+
+    def _delay(self, seconds: float) -> float:
+        return seconds * (1 + self._rng.uniform(-self.jitter, self.jitter))
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = self._clock()
+            with self._lock:
+                entries = list(self._entries.values())
+            for entry in entries:
+                if self._stop.is_set():
+                    return
+                if entry.next_due <= now:
+                    self._tick(entry)
+
+            with self._lock:
+                next_due = min((e.next_due for e in self._entries.values()), default=None)
+            timeout = None if next_due is None else max(0.05, next_due - self._clock())
+            self._wake.wait(timeout)
+            self._wake.clear()
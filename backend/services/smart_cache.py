@@ -4,19 +4,42 @@ Story 5.55: Smart Per-Project Cache Layer - Selective Bootstrap & Persistence
 
 This service provides intelligent caching for story evidence data:
 - Stores cache in {project_root}/.bmad-cache/stories.json
-- Uses file modification time (mtime) for invalidation
+- Uses a content hash of the story file for invalidation (hashed only when
+  (mtime_ns, size) changes; legacy entries fall back to mtime)
 - Skips expensive git/test correlation for unchanged done stories
 - Always refreshes in-progress stories for real-time accuracy
+- Optional write-behind mode: mutations are flushed in one write per batch,
+  after a debounce interval, or at interpreter shutdown
+- Reads take a shared and writes an exclusive advisory lock on
+  stories.json.lock; entries changed by another process since our last read
+  are merged in before writing, so concurrent workers do not lose writes
 """
-import json
+import atexit
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional, Any, Tuple
+from typing import Dict, Optional, Any, Set, Tuple
+
+from backend.config import Config
+from backend.utils import cache_codec, content_hash
+from backend.utils.file_lock import FileLock, LockTimeout, get_lock_stats
+from backend.utils.indexed_cache import INDEX_MAGIC, IndexedStoryMap, encode_indexed, read_indexed
 
 logger = logging.getLogger(__name__)
 
+# Write-behind caches with unflushed changes, flushed at interpreter shutdown.
+# Strong references: a dropped cache must not lose its changes (removed once flushed)
+_pending_caches: Set["SmartCache"] = set()
+
+
+@atexit.register
+def _flush_pending_caches():
+    for cache in list(_pending_caches):
+        cache.flush()
+
 
 class SmartCache:
     """
@@ -52,34 +75,128 @@ class SmartCache:
     CACHE_FILE = "stories.json"
     LOCK_FILE = "stories.json.lock"
     
-    def __init__(self, project_root: str):
+    _instances: Dict[str, "SmartCache"] = {}
+    _instances_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        project_root: str,
+        write_behind: Optional[bool] = None,
+        flush_interval: Optional[float] = None,
+        codec: Optional[str] = None,
+        layout: Optional[str] = None
+    ):
         """
         Initialize SmartCache for a project.
         
         Args:
             project_root: Path to the project root directory
+            write_behind: Collect mutations in memory until flush()
+                (default: Config.SMART_CACHE_WRITE_BEHIND)
+            flush_interval: Write-behind debounce in seconds; 0 flushes only on
+                flush(), batch() exit or shutdown (default: Config.SMART_CACHE_FLUSH_INTERVAL)
+            codec: File codec for stories.json (default: Config.CACHE_CODEC)
+            layout: "json" (single document) or "indexed" (header index + per-story
+                blobs read on demand via mmap) (default: Config.SMART_CACHE_LAYOUT)
         """
         self.project_root = Path(project_root)
         self.cache_dir = self.project_root / self.CACHE_DIR
         self.cache_file = self.cache_dir / self.CACHE_FILE
         self.lock_file = self.cache_dir / self.LOCK_FILE
         self._cache_data: Optional[Dict[str, Any]] = None
+        self.write_behind = Config.SMART_CACHE_WRITE_BEHIND if write_behind is None else write_behind
+        self.flush_interval = Config.SMART_CACHE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._dirty = False
+        self._dirty_ids: set = set()  # Stories set or removed since the last successful save
+        self._batch_depth = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._write_lock = threading.RLock()
+        self.codec = codec or Config.CACHE_CODEC
+        self.layout = layout or Config.SMART_CACHE_LAYOUT
+        self._file_signature: Optional[Tuple[int, int]] = None  # (mtime_ns, size) at last load/save
+        self._file_lock = FileLock(str(self.lock_file), timeout=Config.LOCK_TIMEOUT)
+    
+    @classmethod
+    def for_project(cls, project_root: str) -> "SmartCache":
+        """
+        Shared SmartCache for a project root (one per process).
+        
+        Args:
+            project_root: Path to the project root directory
+            
+        Returns:
+            SmartCache instance
+        """
+        key = os.path.abspath(project_root)
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls(key)
+                cls._instances[key] = cache
+            return cache
+    
+    def _current_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.cache_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Drop the in-memory cache if stories.json was rewritten or removed by
+        someone else since we last loaded or saved it (pending writes win).
+        
+        Returns:
+            True if the cache will be reloaded on next access
+        """
+        with self._write_lock:
+            if self._cache_data is None or self._dirty:
+                return False
+            if self._current_signature() == self._file_signature:
+                return False
+            stories = self._cache_data.get("stories")
+            if isinstance(stories, IndexedStoryMap):
+                stories.release()
+            self._cache_data = None
+            logger.info(f"{self.cache_file} changed on disk - reloading SmartCache")
+            return True
         
     def _load_cache(self) -> Dict[str, Any]:
-        """Load cache from disk, returning empty dict if missing or corrupted."""
+        """Load cache from disk under a shared lock, returning empty dict if missing or corrupted."""
+        try:
+            with self._file_lock.shared():
+                return self._read_cache_file()
+        except LockTimeout as e:
+            # Writers replace the file atomically, so an unlocked read is still consistent
+            logger.warning(f"{e} - reading without lock")
+            return self._read_cache_file()
+    
+    def _read_cache_file(self) -> Dict[str, Any]:
+        """Read and decode stories.json (caller holds the lock if needed)."""
+        self._file_signature = self._current_signature()
         if not self.cache_file.exists():
             return self._empty_cache()
         
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                prefix = f.read(len(INDEX_MAGIC))
+                indexed = prefix == INDEX_MAGIC
+                raw = None if indexed else prefix + f.read()
+            
+            if indexed:
+                # Only the header index is decoded; stories are decoded on access
+                metadata, stories = read_indexed(str(self.cache_file), use_mmap=Config.SMART_CACHE_MMAP)
+                data = {"metadata": metadata, "stories": stories}
+            else:
+                data = cache_codec.decode(raw)
                 
             # Validate cache version
             if data.get("metadata", {}).get("cache_version") != self.CACHE_VERSION:
                 return self._empty_cache()
                 
             return data
-        except (json.JSONDecodeError, IOError):
+        except (cache_codec.CodecError, IOError):
             return self._empty_cache()
     
     def _empty_cache(self) -> Dict[str, Any]:
@@ -93,46 +210,141 @@ class SmartCache:
             "stories": {}
         }
     
-    def _save_cache(self, cache_data: Dict[str, Any]):
-        """Save cache to disk with atomic write and basic locking."""
-        import time
-        lock_acquired = False
-        max_retries = 5
+    def _save_cache(self, cache_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Save cache to disk with an atomic write under an exclusive lock.
         
+        Returns:
+            The data that was written (merged with concurrent changes from
+            other processes), or None if the save failed
+        """
         try:
             # Ensure cache directory exists
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Basic lock file check (cooperative)
-            for _ in range(max_retries):
-                if not self.lock_file.exists():
-                    try:
-                        self.lock_file.touch(exist_ok=False)
-                        lock_acquired = True
-                        break
-                    except FileExistsError:
-                        pass
-                time.sleep(0.1)
+            with self._file_lock.exclusive():
+                cache_data = self._merge_concurrent_changes(cache_data)
 
-            # Update metadata
-            cache_data["metadata"]["cached_at"] = datetime.now(timezone.utc).isoformat()
-            
-            # Atomic write: write to temp file, then rename
-            temp_file = self.cache_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+                # Update metadata
+                cache_data["metadata"]["cached_at"] = datetime.now(timezone.utc).isoformat()
+                
+                # Atomic write: write to temp file, then rename
+                temp_file = self.cache_file.with_suffix('.tmp')
+                stories = cache_data.get("stories", {})
+                if self.layout == "indexed":
+                    payload = encode_indexed(cache_data["metadata"], stories, self.codec)
+                else:
+                    payload = cache_codec.encode({**cache_data, "stories": dict(stories)}, self.codec)
+                with open(temp_file, 'wb') as f:
+                    f.write(payload)
+
+                # A mapped file cannot be replaced on Windows: stop referencing it first
+                if isinstance(stories, IndexedStoryMap):
+                    stories.release()
 
-            # Atomic rename
-            temp_file.replace(self.cache_file)
+                # Atomic rename
+                temp_file.replace(self.cache_file)
+                self._file_signature = self._current_signature()
+                if isinstance(stories, IndexedStoryMap) and self.layout == "indexed":
+                    try:
+                        stories.remap(str(self.cache_file), use_mmap=Config.SMART_CACHE_MMAP)
+                    except (cache_codec.CodecError, OSError) as e:
+                        logger.debug(f"Keeping previous mapping of {self.cache_file}: {e}")
+            return cache_data
             
+        except LockTimeout as e:
+            logger.warning(f"Cache save deferred: {e}")
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
+        return None
+    
+    def _merge_concurrent_changes(self, cache_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        If another process rewrote stories.json since we last read or wrote it,
+        apply our changed entries on top of its version instead of overwriting it.
+        Caller holds the exclusive lock.
+        """
+        if self._current_signature() == self._file_signature:
+            return cache_data
+        
+        disk_data = self._read_cache_file()
+        ours = cache_data.get("stories", {})
+        theirs = disk_data["stories"]
+        for story_id in self._dirty_ids:
+            if story_id in ours:
+                theirs[story_id] = ours[story_id]
+            elif story_id in theirs:
+                del theirs[story_id]
+        if isinstance(ours, IndexedStoryMap):
+            ours.release()
+        logger.info(f"Merged {len(self._dirty_ids)} cache entries into concurrently updated {self.cache_file}")
+        return disk_data
+    
+    def _mark_dirty(self, *story_ids: str):
+        """Persist a mutation now, or defer it in write-behind / batch mode."""
+        with self._write_lock:
+            self._dirty = True
+            self._dirty_ids.update(story_ids)
+            if self._batch_depth > 0:
+                return
+            if not self.write_behind:
+                self.flush()
+                return
+            _pending_caches.add(self)
+            if self.flush_interval > 0 and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self, force: bool = False):
+        """
+        Write pending mutations to disk in one save.
+        
+        Args:
+            force: Write even if nothing is pending
+        """
+        with self._write_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not (self._dirty or force) or self._cache_data is None:
+                return
+            saved = self._save_cache(self._cache_data)
+            if saved is None:
+                _pending_caches.add(self)  # Keep the changes; retried on next flush or at shutdown
+                return
+            self._cache_data = saved
+            self._dirty = False
+            self._dirty_ids.clear()
+            _pending_caches.discard(self)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer writes until the outermost batch exits, then flush once.
+        
+        Usage:
+            with smart_cache.batch():
+                for story in changed:
+                    smart_cache.set_story_evidence(...)
+        """
+        with self._write_lock:
+            self._batch_depth += 1
+        try:
+            yield self
         finally:
-            if lock_acquired:
-                try:
-                    self.lock_file.unlink(missing_ok=True)
-                except:
-                    pass
+            with self._write_lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    if self.write_behind and self.flush_interval > 0:
+                        self._mark_dirty()  # Debounced flush
+                    else:
+                        self.flush()
+    
+    @property
+    def has_pending_writes(self) -> bool:
+        """True if mutations are waiting to be flushed."""
+        return self._dirty
     
     def get_story_evidence(
         self,
@@ -140,7 +352,7 @@ class SmartCache:
         story_file_path: str
     ) -> Tuple[Optional[Dict[str, Any]], bool]:
         """
-        Get cached evidence for a story if valid based on mtime.
+        Get cached evidence for a story if the story file content is unchanged.
         Now status-agnostic (caller decides what to cache).
         
         Args:
@@ -160,7 +372,19 @@ class SmartCache:
         if not cached_story:
             return None, False
         
-        # Check file modification time
+        stored_fingerprint = cached_story.get("file_fingerprint")
+        if stored_fingerprint:
+            changed, current = content_hash.content_changed(story_file_path, stored_fingerprint)
+            if changed:
+                return None, False
+            if current != stored_fingerprint:
+                # Touched but identical content: keep the new stat so it is not hashed again
+                cached_story["file_fingerprint"] = current
+                cached_story["file_mtime"] = current["mtime_ns"] / 1e9
+                self._mark_dirty(story_id)
+            return cached_story.get("evidence", {}), True
+        
+        # Entries written before fingerprints: modification time with 10ms tolerance
         try:
             if not os.path.exists(story_file_path):
                 return None, False
@@ -168,7 +392,6 @@ class SmartCache:
             current_mtime = os.path.getmtime(story_file_path)
             cached_mtime = cached_story.get("file_mtime", 0)
             
-            # Use 10ms tolerance
             if abs(current_mtime - cached_mtime) < 0.01:
                 return cached_story.get("evidence", {}), True
             return None, False
@@ -197,23 +420,23 @@ class SmartCache:
         if not self._cache_data:
             self._cache_data = self._load_cache()
         
-        try:
-            file_mtime = os.path.getmtime(story_file_path)
-        except OSError as e:
-            logger.warning(f"Error getting mtime for {story_file_path}: {e}")
-            file_mtime = 0
+        file_fingerprint = content_hash.fingerprint(story_file_path)
+        if file_fingerprint is None:
+            logger.debug(f"Story file not readable, caching without fingerprint: {story_file_path}")
+        file_mtime = file_fingerprint["mtime_ns"] / 1e9 if file_fingerprint else 0
         
         # Store story cache entry
         self._cache_data["stories"][story_id] = {
             "title": title,
             "status": story_status,
             "file_mtime": file_mtime,
+            "file_fingerprint": file_fingerprint,
             "evidence": evidence,
             "cached_at": datetime.now(timezone.utc).isoformat()
         }
         
-        # Save to disk
-        self._save_cache(self._cache_data)
+        # Save to disk (deferred in write-behind / batch mode)
+        self._mark_dirty(story_id)
     
     def invalidate_story(self, story_id: str):
         """
@@ -227,14 +450,22 @@ class SmartCache:
         
         if story_id in self._cache_data.get("stories", {}):
             del self._cache_data["stories"][story_id]
-            self._save_cache(self._cache_data)
+            self._mark_dirty(story_id)
             logger.info(f"Invalidated cache for story {story_id}")
     
     def clear_project_cache(self):
         """Clear all cached data for this project."""
+        with self._write_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+            self._dirty_ids.clear()
+            _pending_caches.discard(self)
         try:
             if self.cache_file.exists():
-                self.cache_file.unlink()
+                with self._file_lock.exclusive():
+                    self.cache_file.unlink(missing_ok=True)
                 logger.info(f"Cleared cache file: {self.cache_file}")
             
             # Also clear the cache directory if empty
@@ -259,10 +490,10 @@ class SmartCache:
         stories = self._cache_data.get("stories", {})
         metadata = self._cache_data.get("metadata", {})
         
-        # Count stories by status
+        # Count stories by status (indexed files answer this from the header)
         status_counts: Dict[str, int] = {}
-        for story_data in stories.values():
-            status = story_data.get("status", "unknown")
+        for _, status in self._story_statuses(stories):
+            status = status or "unknown"
             status_counts[status] = status_counts.get(status, 0) + 1
         
         # Get cache age
@@ -282,7 +513,8 @@ class SmartCache:
             "total_stories": len(stories),
             "status_counts": status_counts,
             "cache_age_ms": cache_age_ms,
-            "cache_file_exists": self.cache_file.exists()
+            "cache_file_exists": self.cache_file.exists(),
+            "lock": get_lock_stats(self.lock_file.name)
         }
     
     def get_done_story_ids(self) -> list[str]:
@@ -298,9 +530,16 @@ class SmartCache:
         stories = self._cache_data.get("stories", {})
         return [
             story_id
-            for story_id, data in stories.items()
-            if data.get("status") == "done"
+            for story_id, status in self._story_statuses(stories)
+            if status == "done"
         ]
+    
+    @staticmethod
+    def _story_statuses(stories):
+        """(story_id, status) pairs without decoding indexed entries."""
+        if isinstance(stories, IndexedStoryMap):
+            return stories.statuses()
+        return ((sid, data.get("status")) for sid, data in stories.items())
 
     def prune(self, valid_story_ids: list[str]):
         """
@@ -318,5 +557,5 @@ class SmartCache:
         if orphan_ids:
             for sid in orphan_ids:
                 del stories[sid]
-            self._save_cache(self._cache_data)
+            self._mark_dirty(*orphan_ids)
             logger.info(f"Pruned {len(orphan_ids)} orphaned stories from cache")
@@ -0,0 +1,395 @@
+"""
+BMAD Dash - Project State Storage Backends
+Persistence for ProjectStateCache: project-state.json (default) or a SQLite
+database with one row per story (Story 5.4 cache, BMAD_STATE_BACKEND=sqlite)
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..models.epic import Epic
+from ..models.project_state import ProjectState
+from ..config import Config
+from ..utils import cache_codec
+from ..utils.cache_codec import CodecError
+from ..utils.file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SCHEMA_VERSION = "1"
+
+FileSignature = Optional[Tuple[int, int]]
+
+# project table keys (everything in ProjectState except epics/stories)
+PROJECT_KEYS = (
+    "version", "project", "current", "workflow_validation",
+    "sprint_status_mtime", "development_status"
+)
+
+
+def file_signature(path) -> FileSignature:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class JSONStateStore:
+    """
+    Stores the whole project state in project-state.json (rewritten on every save)
+    using a pluggable codec (plain JSON, orjson or msgpack/zstd, see cache_codec).
+    Binary codecs write project-state.msgpack instead.
+
+    Loads hold a shared and saves an exclusive lock on project-state.json.lock,
+    and saves replace the file atomically, so other workers never read a
+    partially written file. If another worker rewrote the file since we last
+    read or wrote it, save merges under the same lock (like SmartCache): the
+    stories, epics and project keys we changed since then replace theirs, and
+    everything else is kept from disk.
+    """
+
+    def __init__(self, json_path: str, codec: str = "auto"):
+        """
+        Args:
+            json_path: Path to project-state.json
+            codec: Cache codec used for writing (any supported format is read)
+        """
+        self.json_path = Path(json_path)
+        self.path = cache_codec.codec_path(json_path, codec)  # project-state.msgpack for binary codecs
+        self.codec = codec
+        self._file_lock = FileLock(f"{self.path}.lock", timeout=Config.LOCK_TIMEOUT)
+        self._written: Optional[Dict[str, Dict[str, str]]] = None  # Serialized sections last read or written
+        self._written_signature: FileSignature = None
+
+    def exists(self) -> bool:
+        return self.path.exists() or self.json_path.exists()
+
+    def signature(self):
+        """Changes whenever the state file is rewritten or removed"""
+        return file_signature(self.path)
+
+    def load(self) -> ProjectState:
+        """
+        Raises:
+            CodecError / IOError if the file is unreadable (LockTimeout is an IOError)
+        """
+        with self._file_lock.shared():
+            # A project-state.json written before switching to a binary codec still loads
+            path = self.path if self.path.exists() or not self.json_path.exists() else self.json_path
+            with open(path, 'rb') as f:
+                raw = f.read()
+            signature = file_signature(self.path)
+        data = cache_codec.decode(raw)
+        self._written, self._written_signature = _serialized_sections(data), signature
+        return ProjectState.from_dict(data)
+
+    def save(self, state: ProjectState, include_story_details: bool = True) -> bool:
+        """
+        Write the state, merging concurrent changes of other workers
+
+        Returns:
+            True if another worker's changes were merged in (the in-memory
+            state no longer matches the file and should be reloaded)
+
+        Raises:
+            IOError if the file cannot be written (LockTimeout is an IOError)
+            CodecError if the state cannot be encoded (nothing is written)
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = state.to_dict(include_story_details=include_story_details)
+        temp_path = self.path.with_suffix('.tmp')
+        merged = False
+        with self._file_lock.exclusive():
+            signature = file_signature(self.path)
+            if self._written is not None and signature is not None and signature != self._written_signature:
+                try:
+                    with open(self.path, 'rb') as f:
+                        theirs = cache_codec.decode(f.read())
+                except CodecError as e:
+                    logger.warning(f"Overwriting unreadable {self.path}: {e}")
+                else:
+                    data = self._merge(theirs, data)
+                    merged = True
+
+            payload = cache_codec.encode(data, self.codec)
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+            temp_path.replace(self.path)
+            if self.path != self.json_path and self.json_path.exists():
+                self.json_path.unlink()  # Superseded by the binary file, must not load again after a codec switch
+            self._written, self._written_signature = _serialized_sections(data), file_signature(self.path)
+
+        if merged:
+            logger.debug(f"Merged concurrent changes into {self.path}")
+        return merged
+
+    def _merge(self, theirs: Dict, ours: Dict) -> Dict:
+        """Apply what we changed since our last load/save on top of the state on disk"""
+        written = self._written
+        current = _serialized_sections(ours)
+        result = dict(theirs)
+
+        for key in PROJECT_KEYS:
+            if key in ours and current["project"].get(key) != written["project"].get(key):
+                result[key] = ours[key]
+
+        stories = dict(theirs.get("stories") or {})
+        for sid, text in current["stories"].items():
+            if written["stories"].get(sid) != text:
+                stories[sid] = ours["stories"][sid]
+        for sid in written["stories"].keys() - current["stories"].keys():
+            stories.pop(sid, None)
+        result["stories"] = stories
+
+        epics = dict(theirs.get("epics") or {})
+        for key, text in current["epics"].items():
+            if written["epics"].get(key) != text:
+                epics[key] = ours["epics"][key]
+        for key in written["epics"].keys() - current["epics"].keys():
+            epics.pop(key, None)
+        # Epics embed story copies: point them at the merged stories
+        result["epics"] = {
+            key: {**epic, "stories": [
+                stories.get(story.get("story_id"), story) for story in epic.get("stories") or []
+            ]}
+            for key, epic in epics.items()
+        }
+        return result
+
+
+def _serialized_sections(data: Dict) -> Dict[str, Dict[str, str]]:
+    """
+    Canonical JSON text of each project key, story and epic (epics without
+    their embedded story copies) of a serialized ProjectState, used to detect
+    what changed between two saves
+    """
+    def dump(value) -> str:
+        return json.dumps(value, sort_keys=True, default=str)
+
+    epics = {}
+    for key, epic in (data.get("epics") or {}).items():
+        shape = {k: v for k, v in epic.items() if k != "stories"}
+        shape["story_ids"] = [story.get("story_id") for story in epic.get("stories") or []]
+        epics[key] = dump(shape)
+    return {
+        "project": {key: dump(data[key]) for key in PROJECT_KEYS if key in data},
+        "stories": {sid: dump(story) for sid, story in (data.get("stories") or {}).items()},
+        "epics": epics,
+    }
+
+
+class SQLiteStateStore:
+    """
+    Stores project state in SQLite (WAL mode) next to project-state.json
+
+    Tables:
+        project: key/value JSON for project metadata and sync snapshots
+        epics:   one row per epic (without nested stories, membership by story ID)
+        stories: one row per story
+
+    Saves compare each row's serialized JSON with what was last read or written
+    and only touch changed rows, so a save costs O(changed stories). Every save
+    is one transaction, so concurrent readers never see a partial state;
+    cross-process locking is SQLite's own (WAL readers never block the writer).
+    If the database does not exist yet, load() imports project-state.json once.
+    """
+
+    DB_FILENAME = "project-state.db"
+
+    def __init__(self, json_path: str, codec: str = "auto"):
+        """
+        Args:
+            json_path: Path to project-state.json (the database lives alongside it)
+            codec: Unused; rows are JSON text so unchanged rows can be detected
+        """
+        self.json_path = Path(json_path)
+        self.path = self.json_path.with_name(self.DB_FILENAME)
+        self._written_stories: Dict[str, str] = {}
+        self._written_epics: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return self.path.exists() or self.json_path.exists()
+
+    def signature(self):
+        """Changes whenever a transaction is committed (database or WAL file) or the files are removed"""
+        return (
+            file_signature(self.path),
+            file_signature(f"{self.path}-wal"),
+            None if self.path.exists() else file_signature(self.json_path)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS project (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS epics (
+                epic_key TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS stories (
+                story_id TEXT PRIMARY KEY,
+                epic_key TEXT,
+                status TEXT,
+                data TEXT NOT NULL
+            );
+        """)
+        return conn
+
+    def load(self) -> ProjectState:
+        """
+        Load state from the database, importing project-state.json on first use
+
+        Raises:
+            sqlite3.Error / CodecError / IOError if storage is unreadable
+        """
+        if not self.path.exists() and self.json_path.exists():
+            return self._import_json()
+
+        with self._lock, closing(self._connect()) as conn:
+            project_rows = dict(conn.execute("SELECT key, value FROM project").fetchall())
+            epic_rows = conn.execute("SELECT epic_key, data FROM epics").fetchall()
+            story_rows = conn.execute("SELECT story_id, data FROM stories").fetchall()
+
+            self._written_epics = {key: data for key, data in epic_rows}
+            self._written_stories = {sid: data for sid, data in story_rows}
+
+        data = {key: json.loads(value) for key, value in project_rows.items() if key in PROJECT_KEYS}
+        data["stories"] = {sid: json.loads(text) for sid, text in story_rows}
+        state = ProjectState.from_dict(data)
+
+        # Epics reference the loaded Story objects instead of carrying copies
+        for epic_key, text in epic_rows:
+            epic_data = json.loads(text)
+            story_ids = epic_data.pop("story_ids", [])
+            epic = Epic.from_dict(epic_data)
+            epic.stories = [state.stories[sid] for sid in story_ids if sid in state.stories]
+            state.epics[epic_key] = epic
+
+        return state
+
+    def save(self, state: ProjectState, include_story_details: bool = True):
+        """
+        Write changed project/epic/story rows in a single transaction
+
+        Raises:
+            sqlite3.Error if the database cannot be written
+        """
+        stories = {
+            sid: json.dumps(story.to_dict(include_tasks=include_story_details), sort_keys=True)
+            for sid, story in state.stories.items()
+        }
+        epics = {}
+        for epic_key, epic in state.epics.items():
+            epic_data = epic.to_dict(include_tasks=False)
+            epic_data.pop("stories", None)
+            epic_data["story_ids"] = [s.story_id for s in epic.stories]
+            epics[epic_key] = json.dumps(epic_data, sort_keys=True)
+
+        with self._lock:
+            changed_stories = [
+                (sid, state.stories[sid].epic, state.stories[sid].status, text)
+                for sid, text in stories.items()
+                if self._written_stories.get(sid) != text
+            ]
+            changed_epics = [(key, text) for key, text in epics.items() if self._written_epics.get(key) != text]
+
+            project_rows = [("schema_version", json.dumps(SQLITE_SCHEMA_VERSION))]
+            project_rows.extend((key, json.dumps(getattr(state, key))) for key in PROJECT_KEYS)
+
+            with closing(self._connect()) as conn:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO project (key, value) VALUES (?, ?)", project_rows
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO stories (story_id, epic_key, status, data) VALUES (?, ?, ?, ?)",
+                        [(sid, str(epic), status, text) for sid, epic, status, text in changed_stories]
+                    )
+                    # Removals are computed against the database, not against what this
+                    # instance last read (it may never have loaded, or be behind another process)
+                    removed_stories = conn.execute(
+                        "DELETE FROM stories WHERE story_id NOT IN (SELECT value FROM json_each(?))",
+                        (json.dumps(list(stories)),)
+                    ).rowcount
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO epics (epic_key, data) VALUES (?, ?)", changed_epics
+                    )
+                    conn.execute(
+                        "DELETE FROM epics WHERE epic_key NOT IN (SELECT value FROM json_each(?))",
+                        (json.dumps(list(epics)),)
+                    )
+
+            self._written_stories = stories
+            self._written_epics = epics
+
+        if changed_stories or removed_stories:
+            logger.debug(
+                f"SQLite state save: {len(changed_stories)} stories written, {removed_stories} removed"
+            )
+
+    def _import_json(self) -> ProjectState:
+        """One-time import of project-state.json into the database"""
+        with open(self.json_path, 'rb') as f:
+            state = ProjectState.from_dict(cache_codec.decode(f.read()))
+        self.save(state)
+        logger.info(f"Imported {self.json_path} into {self.path} ({len(state.stories)} stories)")
+        return state
+
+
+STATE_STORES = {
+    "json": JSONStateStore,
+    "sqlite": SQLiteStateStore,
+}
+
+
+def create_state_store(json_path: str, backend: str = "json", codec: str = "auto"):
+    """
+    Create the storage backend for a project-state.json path
+
+    Args:
+        json_path: Path to project-state.json
+        backend: "json" or "sqlite" (unknown values fall back to "json")
+        codec: File codec for the JSON store (see cache_codec)
+
+    Returns:
+        JSONStateStore or SQLiteStateStore
+    """
+    store_cls = STATE_STORES.get((backend or "json").lower())
+    if store_cls is None:
+        logger.warning(f"Unknown state backend '{backend}', using json")
+        store_cls = JSONStateStore
+    return store_cls(json_path, codec)
+
+
+def remove_state_files(json_path: str) -> bool:
+    """
+    Delete all persisted project state (JSON file and SQLite database files)
+
+    Args:
+        json_path: Path to project-state.json
+
+    Returns:
+        True if any file was deleted
+    """
+    db_path = str(Path(json_path).with_name(SQLiteStateStore.DB_FILENAME))
+    binary_path = str(Path(json_path).with_suffix(cache_codec.BINARY_SUFFIX))
+    deleted = False
+    for path in (json_path, binary_path, db_path, db_path + "-wal", db_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+            deleted = True
+    return deleted
@@ -7,6 +7,8 @@ import os
 import re
 from typing import Optional, Dict, List, Any
 import logging
+from backend.parsers.story_tokenizer import StorySections, load_story_document
+from backend.utils.artifact_index import ArtifactIndex
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +28,13 @@ class StoryDetailFetcher:
             project_root, "_bmad-output", "implementation-artifacts"
         )
 
-    def get_story_details(self, story_id: str) -> Optional[Dict[str, Any]]:
+    def get_story_details(self, story_id: str, include_raw_content: bool = True) -> Optional[Dict[str, Any]]:
         """
         Fetch complete story details including tasks, AC, and metadata
 
         Args:
             story_id: Story ID in format "5.2"
+            include_raw_content: Include the full markdown as 'raw_content'
 
         Returns:
             Dict with story details or None if not found
@@ -47,18 +50,18 @@ class StoryDetailFetcher:
             return None
 
         try:
-            with open(story_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = load_story_document(story_file)
+            content = document.content
 
             # Parse frontmatter
             frontmatter = self._parse_frontmatter(content)
 
-            # Extract sections
-            tasks = self._extract_tasks(content)
-            acceptance_criteria = self._extract_acceptance_criteria(content)
-            summary = self._extract_summary(content)
+            # Extract sections from the shared tokenized document
+            tasks = self._extract_tasks(document.sections)
+            acceptance_criteria = self._extract_acceptance_criteria(document.sections)
+            summary = self._extract_summary(document.sections)
 
-            return {
+            details = {
                 'story_id': story_id,
                 'title': frontmatter.get('title', 'Unknown'),
                 'status': frontmatter.get('status', 'unknown'),
@@ -69,9 +72,12 @@ class StoryDetailFetcher:
                 'acceptance_criteria': acceptance_criteria,
                 'summary': summary,
                 'total_tasks': len(tasks),
-                'completed_tasks': sum(1 for t in tasks if t['status'] == 'done'),
-                'raw_content': content
+                'completed_tasks': sum(1 for t in tasks if t['status'] == 'done')
             }
+            if include_raw_content:
+                details['raw_content'] = content
+
+            return details
 
         except Exception as e:
             logger.error(f"Error reading story file {story_file}: {e}")
@@ -87,15 +93,7 @@ class StoryDetailFetcher:
         Returns:
             Full path to story file or None
         """
-        if not os.path.exists(self.implementation_artifacts):
-            return None
-
-        # Look for files matching pattern
-        import glob
-        pattern = os.path.join(self.implementation_artifacts, f"{story_key}-*.md")
-        matches = glob.glob(pattern)
-
-        return matches[0] if matches else None
+        return ArtifactIndex.for_project(self.project_root).story_file(story_key)
 
     def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
         """
@@ -121,12 +119,12 @@ class StoryDetailFetcher:
 
         return frontmatter
 
-    def _extract_tasks(self, content: str) -> List[Dict[str, str]]:
+    def _extract_tasks(self, sections: StorySections) -> List[Dict[str, str]]:
         """
         Extract task list from markdown
 
         Args:
-            content: Markdown content
+            sections: Tokenized story sections
 
         Returns:
             List of task dicts with title and status
@@ -134,26 +132,22 @@ class StoryDetailFetcher:
         tasks = []
 
         # Find Tasks section (flexible: "Tasks", "Implementation Tasks", etc.)
-        tasks_match = re.search(r'## .*?Tasks\n(.*?)(?=\n## |\Z)', content, re.DOTALL | re.IGNORECASE)
-        if not tasks_match:
+        index = sections.find_heading(
+            lambda h: h.level >= 2 and h.text.lower().endswith('tasks')
+        )
+        if index < 0:
             return tasks
 
-        tasks_section = tasks_match.group(1)
-
-        # Extract all task items (checkbox format)
-        # Pattern: "- [x] Task name" or "* [ ] Task name"
-        task_pattern = r'^\s*[-*]\s+\[([ xX])\]\s+(.+?)(?=\r?\n\s*[-*]|\Z)'
-
-        for match in re.finditer(task_pattern, tasks_section, re.MULTILINE):
-            checkbox = match.group(1)
-            title = match.group(2).strip()
+        # All checkbox items in the section, including nested ones
+        for item in sections.checkboxes_in(index):
+            title = item.text
 
             # Clean up title (remove markdown links, bold, etc.)
             title = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', title)  # Remove markdown links
             title = re.sub(r'\*\*(.+?)\*\*', r'\1', title)      # Remove bold
             title = re.sub(r'__(.+?)__', r'\1', title)          # Remove alt bold
 
-            status = 'done' if checkbox.lower() == 'x' else 'pending'
+            status = 'done' if item.checked else 'pending'
             tasks.append({
                 'title': title,
                 'status': status
@@ -161,12 +155,12 @@ class StoryDetailFetcher:
 
         return tasks
 
-    def _extract_acceptance_criteria(self, content: str) -> List[str]:
+    def _extract_acceptance_criteria(self, sections: StorySections) -> List[str]:
         """
         Extract acceptance criteria from markdown
 
         Args:
-            content: Markdown content
+            sections: Tokenized story sections
 
         Returns:
             List of AC descriptions
@@ -174,18 +168,19 @@ class StoryDetailFetcher:
         criteria = []
 
         # Find Acceptance Criteria section
-        ac_match = re.search(r'## Acceptance Criteria\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
-        if not ac_match:
+        index = sections.find_heading(
+            lambda h: h.level == 2 and h.text == 'Acceptance Criteria'
+        )
+        if index < 0:
             return criteria
 
-        ac_section = ac_match.group(1)
-
         # Extract AC items (ACx: headers and content)
-        ac_pattern = r'### (AC\d+:.*?)\n(.*?)(?=\n###|### AC|\Z)'
+        for child in sections.children(index):
+            ac_title = sections.headings[child].text
+            if not re.match(r'AC\d+:', ac_title):
+                continue
 
-        for match in re.finditer(ac_pattern, ac_section, re.DOTALL):
-            ac_title = match.group(1).strip()
-            ac_content = match.group(2).strip()
+            ac_content = '\n'.join(sections.section_lines(child, own_text_only=True)).strip()
 
             # Clean up content
             ac_content = re.sub(r'\*\*Given\*\*', 'Given', ac_content)
@@ -197,19 +192,21 @@ class StoryDetailFetcher:
 
         return criteria
 
-    def _extract_summary(self, content: str) -> str:
+    def _extract_summary(self, sections: StorySections) -> str:
         """
         Extract user story summary from markdown
 
         Args:
-            content: Markdown content
+            sections: Tokenized story sections
 
         Returns:
             User story text
         """
         # Find User Story section
-        summary_match = re.search(r'## User Story\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
-        if summary_match:
-            return summary_match.group(1).strip()
+        index = sections.find_heading(
+            lambda h: h.level == 2 and h.text == 'User Story'
+        )
+        if index >= 0:
+            return sections.section_text(index).strip()
 
         return ""
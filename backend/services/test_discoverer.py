@@ -10,6 +10,7 @@ from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from backend.models.test_evidence import TestEvidence
+from backend.utils.single_flight import flight_key, single_flight
 
 
 logger = logging.getLogger(__name__)
@@ -18,16 +19,57 @@ logger = logging.getLogger(__name__)
 MAX_TEST_AGE_HOURS = 24
 TEST_EXECUTION_TIMEOUT = 30  # seconds
 
+# Test roots searched for story tests (relative to project root)
+TEST_DIRS = [
+    "tests",
+    os.path.join("backend", "tests"),
+    os.path.join("frontend", "tests"),
+    # Support colocated tests (Vite/React convention: tests next to source files)
+    "src",
+    # Support Tauri/Rust projects
+    os.path.join("src-tauri", "tests"),
+    os.path.join("src-tauri", "src"),
+]
+
 
 class TestDiscoverer:
     """
     Discovers test files for stories and parses their results
     """
     
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, cache_scans: bool = False):
+        """
+        Args:
+            project_path: Path to project root directory
+            cache_scans: Memoize directory globs, test file contents and test
+                results for the lifetime of this instance, so answering many
+                stories walks and reads each test file once (see
+                EvidenceBatch). Leave off for long-lived instances.
+        """
         self.project_path = project_path
         self.manual_entries: Dict[str, TestEvidence] = {}
+        self._glob_cache: Optional[Dict[Tuple[str, str], List[Path]]] = {} if cache_scans else None
+        self._content_cache: Optional[Dict[str, str]] = {} if cache_scans else None
+        self._results_cache: Optional[Dict[str, Optional[Dict]]] = {} if cache_scans else None
         logger.info(f"TestDiscoverer initialized for project: {project_path}")
+
+    def _rglob(self, test_dir: str, pattern: str) -> List[Path]:
+        """Recursive glob under test_dir (memoized when scans are cached)"""
+        if self._glob_cache is None:
+            return list(Path(test_dir).rglob(pattern))
+        key = (test_dir, pattern)
+        if key not in self._glob_cache:
+            self._glob_cache[key] = list(Path(test_dir).rglob(pattern))
+        return self._glob_cache[key]
+
+    def _read_test_file(self, test_file: Path) -> str:
+        """Test file content (memoized when scans are cached)"""
+        if self._content_cache is None:
+            return test_file.read_text(encoding='utf-8', errors='ignore')
+        file_path = str(test_file)
+        if file_path not in self._content_cache:
+            self._content_cache[file_path] = test_file.read_text(encoding='utf-8', errors='ignore')
+        return self._content_cache[file_path]
     
     def discover_tests_for_story(self, story_id: str) -> List[str]:
         """
@@ -53,16 +95,7 @@ class TestDiscoverer:
         patterns = self._build_test_file_patterns(epic, story)
         
         # Search directories
-        test_dirs = [
-            os.path.join(self.project_path, "tests"),
-            os.path.join(self.project_path, "backend", "tests"),
-            os.path.join(self.project_path, "frontend", "tests"),
-            # Support colocated tests (Vite/React convention: tests next to source files)
-            os.path.join(self.project_path, "src"),
-            # Support Tauri/Rust projects
-            os.path.join(self.project_path, "src-tauri", "tests"),
-            os.path.join(self.project_path, "src-tauri", "src"),
-        ]
+        test_dirs = [os.path.join(self.project_path, d) for d in TEST_DIRS]
         
         matching_files = []
         
@@ -73,8 +106,7 @@ class TestDiscoverer:
             
             # Search recursively by filename pattern
             for pattern in patterns:
-                matches = list(Path(test_dir).rglob(pattern))
-                for match in matches:
+                for match in self._rglob(test_dir, pattern):
                     file_path = str(match)
                     if file_path not in matching_files:
                         matching_files.append(file_path)
@@ -97,13 +129,13 @@ class TestDiscoverer:
                 continue
             
             # Search all test files for content matches
-            for test_file in Path(test_dir).rglob("test_*.py"):
+            for test_file in self._rglob(test_dir, "test_*.py"):
                 file_path = str(test_file)
                 if file_path in matching_files:
                     continue  # Already found by filename
                 
                 try:
-                    content = test_file.read_text(encoding='utf-8', errors='ignore')
+                    content = self._read_test_file(test_file)
                     for pattern in content_patterns:
                         if re.search(pattern, content, re.IGNORECASE):
                             matching_files.append(file_path)
@@ -114,13 +146,13 @@ class TestDiscoverer:
             
             # Also check JavaScript/TypeScript test files (including JSX/TSX)
             for ext in ['*.test.js', '*.test.ts', '*.test.jsx', '*.test.tsx', '*.spec.js', '*.spec.ts', '*.spec.jsx', '*.spec.tsx']:
-                for test_file in Path(test_dir).rglob(ext):
+                for test_file in self._rglob(test_dir, ext):
                     file_path = str(test_file)
                     if file_path in matching_files:
                         continue
 
                     try:
-                        content = test_file.read_text(encoding='utf-8', errors='ignore')
+                        content = self._read_test_file(test_file)
                         for pattern in content_patterns:
                             if re.search(pattern, content, re.IGNORECASE):
                                 matching_files.append(file_path)
@@ -131,13 +163,13 @@ class TestDiscoverer:
 
             # Also check Rust test files (*_test.rs, test_*.rs)
             for ext in ['*_test.rs', 'test_*.rs']:
-                for test_file in Path(test_dir).rglob(ext):
+                for test_file in self._rglob(test_dir, ext):
                     file_path = str(test_file)
                     if file_path in matching_files:
                         continue
 
                     try:
-                        content = test_file.read_text(encoding='utf-8', errors='ignore')
+                        content = self._read_test_file(test_file)
                         for pattern in content_patterns:
                             if re.search(pattern, content, re.IGNORECASE):
                                 matching_files.append(file_path)
@@ -525,18 +557,7 @@ class TestDiscoverer:
         most_recent_time = None
         
         for test_file in test_files:
-            # Determine file type
-            if test_file.endswith('.py'):
-                results = self.parse_pytest_results(test_file)
-            elif any(test_file.endswith(ext) for ext in ['.js', '.ts', '.jsx', '.tsx']):
-                results = self.parse_jest_results(test_file)
-            elif test_file.endswith('.rs'):
-                # For Rust, use static counting (cargo test is project-specific)
-                results = self.parse_rust_results_static(test_file)
-            else:
-                logger.warning(f"Unknown test file type: {test_file}")
-                continue
-            
+            results = self._test_file_results(test_file)
             if results:
                 total_passing += results["passing_tests"]
                 total_failing += results["failing_tests"]
@@ -564,6 +585,44 @@ class TestDiscoverer:
         logger.info(f"Test evidence for story {story_id}: {total_passing} passing, {total_failing} failing")
         return test_evidence
     
+    def _test_file_results(self, test_file: str) -> Optional[Dict]:
+        """
+        Run/parse one test file by type (memoized when scans are cached, so a
+        file shared by several stories is executed once per batch)
+
+        Concurrent runs of the same file - from any discoverer of this
+        project - are coalesced into one execution.
+
+        Args:
+            test_file: Path to test file
+
+        Returns:
+            Results dict (see parse_pytest_results) or None
+        """
+        if self._results_cache is not None and test_file in self._results_cache:
+            return self._results_cache[test_file]
+
+        results = single_flight.do(
+            flight_key(self.project_path, "test-run", test_file),
+            lambda: self._run_test_file(test_file)
+        )
+
+        if self._results_cache is not None:
+            self._results_cache[test_file] = results
+        return results
+
+    def _run_test_file(self, test_file: str) -> Optional[Dict]:
+        # Determine file type
+        if test_file.endswith('.py'):
+            return self.parse_pytest_results(test_file)
+        elif any(test_file.endswith(ext) for ext in ['.js', '.ts', '.jsx', '.tsx']):
+            return self.parse_jest_results(test_file)
+        elif test_file.endswith('.rs'):
+            # For Rust, use static counting (cargo test is project-specific)
+            return self.parse_rust_results_static(test_file)
+        logger.warning(f"Unknown test file type: {test_file}")
+        return None
+
     def set_manual_test_status(
         self,
         story_id: str,
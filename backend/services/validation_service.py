@@ -10,6 +10,7 @@ from datetime import datetime
 from backend.parsers.bmad_parser import BMADParser
 from backend.services.git_correlator import GitCorrelator
 from backend.services.test_discoverer import TestDiscoverer
+from backend.services.gap_detector import GapDetector
 
 
 @dataclass
@@ -145,7 +146,8 @@ class ValidationService:
         if result.has_dev_story_workflow and not result.has_code_review_workflow:
             result.issues.append("Missing code-review workflow execution")
 
-        # 5. Include workflow gaps from BMADParser
+        # 5. Include workflow gaps from BMADParser plus the evidence-based test gap
+        GapDetector(self.project_root, self.test_discoverer).detect([story])
         result.workflow_gaps = story.gaps
 
         # 6. Determine overall completion status
@@ -181,6 +183,10 @@ class ValidationService:
         if not project:
             return gaps
 
+        # Evidence-based gaps in one batched pass (shared TestDiscoverer)
+        all_stories = [story for epic in project.epics for story in epic.stories]
+        GapDetector(self.project_root, self.test_discoverer).detect(all_stories)
+
         # Iterate through all epics and stories
         for epic in project.epics:
             for story in epic.stories:
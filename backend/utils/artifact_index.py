@@ -0,0 +1,227 @@
+"""
+BMAD Dash - Artifact Directory Index
+Maps story IDs to story files and code-review files from a single directory scan
+"""
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+
+# Artifact directories in lookup priority order (relative to project root)
+ARTIFACT_DIRS = [
+    os.path.join("_bmad-output", "implementation-artifacts"),
+    os.path.join("_bmad-output", "implementation"),
+    "stories",
+]
+
+STORY_FILE_RE = re.compile(r'^(\d+)-(\d+)-.+\.md$')  # "1-3-story-name.md"
+CODE_REVIEW_FILE_RE = re.compile(r'^code-review-(\d+)-(\d+)\.md$')  # "code-review-1-3.md"
+STORY_ID_RE = re.compile(r'(\d+)[.\-_\s](\d+)')
+
+
+@dataclass
+class ArtifactEntry:
+    """A file found during the directory scan"""
+    path: str
+    name: str
+    mtime: float
+    size: int
+
+
+@dataclass
+class _DirectorySnapshot:
+    """Scan result for one artifact directory"""
+    mtime_ns: int = -1  # -1 = directory missing
+    markdown: List[ArtifactEntry] = field(default_factory=list)
+    by_path: Dict[str, ArtifactEntry] = field(default_factory=dict)
+    stories: Dict[str, List[ArtifactEntry]] = field(default_factory=dict)
+    code_reviews: Dict[str, ArtifactEntry] = field(default_factory=dict)
+
+
+class ArtifactIndex:
+    """
+    Index of story and code-review files under a project's artifact directories
+
+    Each directory is read with one os.scandir and rescanned only when its
+    mtime changes (files added, removed or renamed). Lookups are dict hits.
+    Stat info reflects the last scan; use os.stat when content freshness matters.
+    """
+
+    _instances: Dict[str, "ArtifactIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, project_root: str):
+        """
+        Initialize index for a project root
+
+        Args:
+            project_root: Path to project root directory
+        """
+        self.project_root = project_root
+        self.directories = [os.path.join(project_root, d) for d in ARTIFACT_DIRS]
+        self._snapshots: Dict[str, _DirectorySnapshot] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, project_root: str) -> "ArtifactIndex":
+        """
+        Shared index for a project root (one per process)
+
+        Args:
+            project_root: Path to project root directory
+
+        Returns:
+            ArtifactIndex instance
+        """
+        key = os.path.abspath(project_root)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls(project_root)
+                cls._instances[key] = index
+            return index
+
+    @staticmethod
+    def normalize_story_id(story_id: str) -> Optional[str]:
+        """
+        Normalize "1.3", "1-3", "story-1.3" to "1.3"
+
+        Returns:
+            Normalized ID or None if invalid
+        """
+        if not story_id:
+            return None
+        match = STORY_ID_RE.search(str(story_id))
+        if not match:
+            return None
+        return f"{match.group(1)}.{match.group(2)}"
+
+    def story_file(self, story_id: str) -> Optional[str]:
+        """
+        Story markdown file for a story (first directory with a match wins)
+
+        Args:
+            story_id: Story identifier (e.g., "1.3", "1-3")
+
+        Returns:
+            Full path or None
+        """
+        normalized = self.normalize_story_id(story_id)
+        if not normalized:
+            return None
+        for snapshot in self._fresh_snapshots():
+            entries = snapshot.stories.get(normalized)
+            if entries:
+                return entries[0].path
+        return None
+
+    def code_review_file(self, story_id: str) -> Optional[str]:
+        """
+        code-review-X-Y.md file for a story in implementation-artifacts
+
+        Args:
+            story_id: Story identifier (e.g., "1.3")
+
+        Returns:
+            Full path or None
+        """
+        normalized = self.normalize_story_id(story_id)
+        if not normalized:
+            return None
+        entry = self._fresh_snapshots()[0].code_reviews.get(normalized)
+        return entry.path if entry else None
+
+    def code_review_ids(self) -> Set[str]:
+        """Story IDs with a code-review-X-Y.md file in implementation-artifacts"""
+        return set(self._fresh_snapshots()[0].code_reviews)
+
+    def story_files(self) -> List[str]:
+        """
+        All "*-*-*.md" files in implementation-artifacts, sorted by name
+
+        Returns:
+            List of file paths
+        """
+        snapshot = self._fresh_snapshots()[0]
+        return [e.path for e in snapshot.markdown if e.name.count('-') >= 2]
+
+    def stat(self, path: str) -> Optional[ArtifactEntry]:
+        """
+        Stat info recorded for an indexed file
+
+        Args:
+            path: Full path as returned by this index
+
+        Returns:
+            ArtifactEntry or None if the file is not indexed
+        """
+        for snapshot in self._fresh_snapshots():
+            entry = snapshot.by_path.get(path)
+            if entry:
+                return entry
+        return None
+
+    def invalidate(self):
+        """Force a rescan on next lookup"""
+        with self._lock:
+            self._snapshots.clear()
+
+    def _fresh_snapshots(self) -> List[_DirectorySnapshot]:
+        """Return one snapshot per directory, rescanning directories whose mtime changed"""
+        with self._lock:
+            snapshots = []
+            for directory in self.directories:
+                mtime_ns = self._dir_mtime_ns(directory)
+                snapshot = self._snapshots.get(directory)
+                if snapshot is None or snapshot.mtime_ns != mtime_ns:
+                    snapshot = self._scan(directory, mtime_ns)
+                    self._snapshots[directory] = snapshot
+                snapshots.append(snapshot)
+            return snapshots
+
+    @staticmethod
+    def _dir_mtime_ns(directory: str) -> int:
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return -1
+
+    @staticmethod
+    def _scan(directory: str, mtime_ns: int) -> _DirectorySnapshot:
+        """Single os.scandir pass over a directory"""
+        snapshot = _DirectorySnapshot(mtime_ns=mtime_ns)
+        if mtime_ns == -1:
+            return snapshot
+
+        try:
+            with os.scandir(directory) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    if name.startswith('.') or not name.endswith('.md') or not dir_entry.is_file():
+                        continue
+                    stat = dir_entry.stat()
+                    snapshot.markdown.append(ArtifactEntry(
+                        path=os.path.join(directory, name),
+                        name=name,
+                        mtime=stat.st_mtime,
+                        size=stat.st_size
+                    ))
+        except OSError:
+            return _DirectorySnapshot(mtime_ns=mtime_ns)
+
+        snapshot.markdown.sort(key=lambda e: e.name)
+        for entry in snapshot.markdown:
+            snapshot.by_path[entry.path] = entry
+            story_match = STORY_FILE_RE.match(entry.name)
+            if story_match:
+                key = f"{story_match.group(1)}.{story_match.group(2)}"
+                snapshot.stories.setdefault(key, []).append(entry)
+                continue
+            review_match = CODE_REVIEW_FILE_RE.match(entry.name)
+            if review_match:
+                key = f"{review_match.group(1)}.{review_match.group(2)}"
+                snapshot.code_reviews[key] = entry
+
+        return snapshot
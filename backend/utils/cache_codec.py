@@ -0,0 +1,188 @@
+"""
+BMAD Dash - Cache File Codecs
+Pluggable serialization for project-state and SmartCache files
+
+Formats:
+- json:          stdlib json, indented (legacy format, no header)
+- orjson:        orjson, compact JSON (no header, readable by any JSON loader)
+- msgpack:       binary msgpack with a format header
+- msgpack+zstd:  zstd-compressed msgpack with a format header
+
+Binary files start with MAGIC + a one-byte format id; anything else is
+decoded as JSON, so files written before a codec change still load. Every
+codec turns non-string dict keys into strings the way json does, so data
+decodes the same whichever codec wrote it.
+orjson, msgpack and zstandard are optional dependencies.
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BMADC"
+FORMAT_MSGPACK = 1
+FORMAT_MSGPACK_ZSTD = 2
+
+CODECS = ("auto", "json", "orjson", "msgpack", "msgpack+zstd")
+BINARY_CODECS = ("msgpack", "msgpack+zstd")
+
+# Suffix of files written with a binary codec in place of a .json file (see codec_path)
+BINARY_SUFFIX = ".msgpack"
+
+
+class CodecError(ValueError):
+    """Raised when data cannot be encoded or a cache file cannot be decoded"""
+
+
+def available_codec(name: Optional[str]) -> str:
+    """
+    Resolve a requested codec to one whose dependencies are installed
+
+    Args:
+        name: "auto", "json", "orjson", "msgpack" or "msgpack+zstd"
+
+    Returns:
+        Codec name that can be used for encoding
+    """
+    name = (name or "auto").lower()
+    if name not in CODECS:
+        logger.warning(f"Unknown cache codec '{name}', using auto")
+        name = "auto"
+
+    if name == "msgpack+zstd" and (msgpack is None or zstandard is None):
+        name = "msgpack"
+    if name == "msgpack" and msgpack is None:
+        name = "auto"
+    if name == "orjson" and orjson is None:
+        name = "json"
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    return name
+
+
+def codec_path(json_path: Union[str, Path], codec: str = "auto") -> Path:
+    """
+    File a codec writes in place of a .json file: binary codecs use
+    BINARY_SUFFIX, so no .json file ever holds msgpack
+
+    Args:
+        json_path: Path of the JSON file
+        codec: Codec name (see CODECS)
+    """
+    path = Path(json_path)
+    if available_codec(codec) in BINARY_CODECS:
+        return path.with_suffix(BINARY_SUFFIX)
+    return path
+
+
+def encode(data: Any, codec: str = "auto") -> bytes:
+    """
+    Serialize data with the given codec (falls back if a dependency is missing)
+
+    Args:
+        data: JSON-compatible data (non-string dict keys are stringified like json does)
+        codec: Codec name (see CODECS)
+
+    Returns:
+        Encoded bytes, including a format header for binary codecs
+
+    Raises:
+        CodecError if the data is not JSON-compatible
+    """
+    codec = available_codec(codec)
+    try:
+        if codec == "msgpack+zstd":
+            payload = zstandard.ZstdCompressor().compress(msgpack.packb(_json_keys(data), use_bin_type=True))
+            return MAGIC + bytes([FORMAT_MSGPACK_ZSTD]) + payload
+        if codec == "msgpack":
+            return MAGIC + bytes([FORMAT_MSGPACK]) + msgpack.packb(_json_keys(data), use_bin_type=True)
+        if codec == "orjson":
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, indent=2).encode("utf-8")
+    except CodecError:
+        raise
+    except (TypeError, ValueError, OverflowError) as e:
+        raise CodecError(f"Cannot encode cache data with {codec}: {e}") from e
+
+
+def _json_key(key: Any) -> str:
+    """Dict key as json.dumps writes it"""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return str(key)
+    if isinstance(key, float):
+        return json.dumps(key)
+    raise CodecError(f"Unsupported dict key type: {type(key).__name__}")
+
+
+def _json_keys(value: Any) -> Any:
+    """Copy of nested data with JSON (string) dict keys, for msgpack"""
+    if isinstance(value, dict):
+        return {_json_key(k): _json_keys(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_keys(v) for v in value]
+    return value
+
+
+def decode(raw: bytes) -> Any:
+    """
+    Deserialize bytes written by encode() or a plain JSON file
+
+    Args:
+        raw: File contents
+
+    Returns:
+        Decoded data
+
+    Raises:
+        CodecError if the data is corrupt or needs a missing dependency
+    """
+    if raw.startswith(MAGIC):
+        fmt = raw[len(MAGIC)] if len(raw) > len(MAGIC) else None
+        payload = raw[len(MAGIC) + 1:]
+        try:
+            if fmt == FORMAT_MSGPACK_ZSTD:
+                if msgpack is None or zstandard is None:
+                    raise CodecError("msgpack+zstd cache file requires msgpack and zstandard")
+                payload = zstandard.ZstdDecompressor().decompress(payload)
+                return msgpack.unpackb(payload, raw=False)
+            if fmt == FORMAT_MSGPACK:
+                if msgpack is None:
+                    raise CodecError("msgpack cache file requires msgpack")
+                return msgpack.unpackb(payload, raw=False)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Corrupt cache file: {e}") from e
+        raise CodecError(f"Unknown cache file format id: {fmt}")
+
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise CodecError(f"Invalid JSON cache file: {e}") from e
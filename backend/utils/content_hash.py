@@ -0,0 +1,120 @@
+"""
+BMAD Dash - File Content Fingerprints
+Change detection keyed on file content instead of mtime tolerance windows
+
+A fingerprint is {"mtime_ns", "size", "hash"}. The content hash (xxh3-128 if
+xxhash is installed, else blake2b-128) is recomputed only when (mtime_ns, size)
+differs from the stored fingerprint, so unchanged files cost one stat().
+A touch, editor save-without-change or git checkout of identical content
+keeps the same hash and does not count as a change.
+"""
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+DEFAULT_ALGORITHM = "xxh3" if xxhash is not None else "blake2b"
+
+_CHUNK_SIZE = 1 << 20
+
+# Process-wide memo: path -> (mtime_ns, size, hash), shared by all callers
+_memo: Dict[str, Tuple[int, int, str]] = {}
+_memo_lock = threading.Lock()
+
+
+def _hasher(algorithm: str):
+    if algorithm == "xxh3" and xxhash is not None:
+        return xxhash.xxh3_128()
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=16)
+    return None
+
+
+def hash_file(path: str, algorithm: str = DEFAULT_ALGORITHM) -> Optional[str]:
+    """
+    Hash a file's content
+
+    Args:
+        path: File path
+        algorithm: "xxh3" or "blake2b"
+
+    Returns:
+        "<algorithm>:<hexdigest>", or None if the algorithm is unavailable
+
+    Raises:
+        OSError if the file cannot be read
+    """
+    hasher = _hasher(algorithm)
+    if hasher is None:
+        return None
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def fingerprint(path: str, previous: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    Current fingerprint of a file, hashing only if (mtime_ns, size) changed
+
+    Args:
+        path: File path
+        previous: Previously stored fingerprint; its algorithm is reused when
+            available so hashes stay comparable
+
+    Returns:
+        {"mtime_ns", "size", "hash"} or None if the file is missing/unreadable
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    revision = (stat.st_mtime_ns, stat.st_size)
+
+    if previous and (previous.get("mtime_ns"), previous.get("size")) == revision and previous.get("hash"):
+        return previous
+
+    algorithm = DEFAULT_ALGORITHM
+    if previous and previous.get("hash"):
+        stored_algorithm = previous["hash"].split(":", 1)[0]
+        if _hasher(stored_algorithm) is not None:
+            algorithm = stored_algorithm
+
+    with _memo_lock:
+        memo = _memo.get(path)
+    if memo and memo[:2] == revision and memo[2].startswith(algorithm + ":"):
+        digest = memo[2]
+    else:
+        try:
+            digest = hash_file(path, algorithm)
+        except OSError:
+            return None
+        with _memo_lock:
+            _memo[path] = (revision[0], revision[1], digest)
+
+    return {"mtime_ns": revision[0], "size": revision[1], "hash": digest}
+
+
+def content_changed(path: str, previous: Optional[Dict]) -> Tuple[bool, Optional[Dict]]:
+    """
+    Compare a file against a stored fingerprint
+
+    Args:
+        path: File path
+        previous: Stored fingerprint (None counts as changed)
+
+    Returns:
+        (changed, current fingerprint) - current is None if the file is missing
+    """
+    current = fingerprint(path, previous)
+    if current is None or not previous:
+        return True, current
+    return current["hash"] != previous.get("hash"), current
@@ -0,0 +1,182 @@
+"""
+BMAD Dash - Advisory File Locks
+Reader/writer locks shared by all processes (gunicorn workers, CLI) that
+update the same project's on-disk caches
+
+Uses fcntl.flock (shared locks for readers, exclusive locks for writers) on a
+dedicated lock file next to the protected file. Cache files are replaced by
+atomic rename, so the lock file must never be the data file itself.
+Where fcntl is unavailable (Windows), msvcrt byte-range locking is used and
+both modes are exclusive.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+logger = logging.getLogger(__name__)
+
+SHARED = "shared"
+EXCLUSIVE = "exclusive"
+
+_POLL_INITIAL = 0.005
+_POLL_MAX = 0.1
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a file lock cannot be acquired within the timeout"""
+
+
+class _LockStats:
+    """Process-wide lock contention counters, keyed by lock file name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, name: str, waited: float, contended: bool, timed_out: bool):
+        with self._lock:
+            entry = self._stats.setdefault(name, {
+                "acquired": 0,
+                "contended": 0,
+                "timeouts": 0,
+                "wait_ms_total": 0.0,
+                "wait_ms_max": 0.0
+            })
+            if timed_out:
+                entry["timeouts"] += 1
+            else:
+                entry["acquired"] += 1
+            if contended:
+                entry["contended"] += 1
+                wait_ms = waited * 1000
+                entry["wait_ms_total"] = round(entry["wait_ms_total"] + wait_ms, 3)
+                entry["wait_ms_max"] = round(max(entry["wait_ms_max"], wait_ms), 3)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: dict(entry) for name, entry in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+lock_stats = _LockStats()
+
+
+def get_lock_stats(name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Lock contention metrics for this process
+
+    Args:
+        name: Lock file name (e.g., "stories.json.lock"); None returns all locks
+
+    Returns:
+        {"acquired", "contended", "timeouts", "wait_ms_total", "wait_ms_max"}
+        for one lock, or a dict of those keyed by lock file name
+    """
+    stats = lock_stats.snapshot()
+    if name is None:
+        return stats
+    return stats.get(name, {"acquired": 0, "contended": 0, "timeouts": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0})
+
+
+class FileLock:
+    """
+    Advisory reader/writer lock on a lock file
+
+    Usage:
+        lock = FileLock(".bmad-cache/stories.json.lock")
+        with lock.shared():
+            data = read()
+        with lock.exclusive():
+            write(data)
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Args:
+            path: Lock file path (created on first use, never deleted)
+            timeout: Seconds to wait for the lock before raising LockTimeout
+        """
+        self.path = str(path)
+        self.name = os.path.basename(self.path)
+        self.timeout = timeout
+
+    def shared(self, timeout: Optional[float] = None):
+        """Context manager holding a shared (reader) lock"""
+        return self._hold(SHARED, timeout)
+
+    def exclusive(self, timeout: Optional[float] = None):
+        """Context manager holding an exclusive (writer) lock"""
+        return self._hold(EXCLUSIVE, timeout)
+
+    @contextmanager
+    def _hold(self, mode: str, timeout: Optional[float]):
+        timeout = self.timeout if timeout is None else timeout
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            self._acquire(fd, mode, timeout)
+            try:
+                yield self
+            finally:
+                self._release(fd)
+        finally:
+            os.close(fd)
+
+    def _acquire(self, fd: int, mode: str, timeout: float):
+        """Poll a non-blocking lock with backoff until acquired or timed out"""
+        start = time.monotonic()
+        delay = _POLL_INITIAL
+        contended = False
+        while True:
+            if self._try_lock(fd, mode):
+                lock_stats.record(self.name, time.monotonic() - start, contended, timed_out=False)
+                return
+            contended = True
+            waited = time.monotonic() - start
+            if waited >= timeout:
+                lock_stats.record(self.name, waited, contended, timed_out=True)
+                raise LockTimeout(f"Timed out after {timeout:.1f}s waiting for {mode} lock on {self.path}")
+            time.sleep(min(delay, max(timeout - waited, 0)))
+            delay = min(delay * 2, _POLL_MAX)
+
+    @staticmethod
+    def _try_lock(fd: int, mode: str) -> bool:
+        if fcntl is not None:
+            flags = (fcntl.LOCK_SH if mode == SHARED else fcntl.LOCK_EX) | fcntl.LOCK_NB
+            try:
+                fcntl.flock(fd, flags)
+                return True
+            except (BlockingIOError, PermissionError):
+                return False
+        if msvcrt is not None:  # pragma: no cover - Windows
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                return False
+        return True  # pragma: no cover - no locking primitive available
+
+    @staticmethod
+    def _release(fd: int):
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        elif msvcrt is not None:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
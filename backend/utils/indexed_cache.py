@@ -0,0 +1,203 @@
+"""
+BMAD Dash - Offset-Indexed Cache File Layout
+Story entries stored as separately encoded blobs behind a small header index,
+so one entry can be read (via mmap) without decoding the rest of the file
+
+File layout:
+    INDEX_MAGIC | header length (4 bytes, big-endian) | header | blobs...
+
+    header = JSON {"metadata": {...}, "index": {key: [offset, length, status]}}
+    Offsets are relative to the first blob. Each blob is encoded with
+    cache_codec, so entries written with different codecs can coexist.
+"""
+import json
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import cache_codec
+
+INDEX_MAGIC = b"BMADI1\n"
+_HEADER_LEN = struct.Struct(">I")
+
+
+def is_indexed(raw_prefix: bytes) -> bool:
+    """True if the data starts with the indexed layout magic"""
+    return raw_prefix.startswith(INDEX_MAGIC)
+
+
+class IndexedStoryMap(MutableMapping):
+    """
+    Mapping of story_id -> entry backed by an indexed cache file
+
+    Entries are decoded on first access. Entries that were never accessed
+    keep their encoded bytes and are copied verbatim when the file is rewritten.
+    """
+
+    def __init__(self, buffer=None, data_offset: int = 0, index: Optional[Dict[str, List]] = None):
+        """
+        Args:
+            buffer: bytes or mmap holding the file
+            data_offset: Offset of the first blob in buffer
+            index: key -> [offset, length, status]
+        """
+        self._buffer = buffer
+        self._data_offset = data_offset
+        self._index: Dict[str, List] = dict(index or {})
+        self._decoded: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._decoded:
+            return self._decoded[key]
+        if key not in self._index:
+            raise KeyError(key)
+        value = cache_codec.decode(self._slice(key))
+        self._decoded[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        self._decoded[key] = value
+        self._index.pop(key, None)
+
+    def __delitem__(self, key: str):
+        if key not in self._decoded and key not in self._index:
+            raise KeyError(key)
+        self._decoded.pop(key, None)
+        self._index.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._index
+        for key in self._decoded:
+            if key not in self._index:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._index) + sum(1 for k in self._decoded if k not in self._index)
+
+    def __contains__(self, key) -> bool:
+        return key in self._decoded or key in self._index
+
+    def raw(self, key: str) -> Optional[bytes]:
+        """
+        Encoded bytes of an entry that was never decoded, else None
+        (decoded entries may have been mutated in place and must be re-encoded)
+        """
+        if key in self._decoded:
+            return None
+        return self._slice(key)
+
+    def _slice(self, key: str) -> Optional[bytes]:
+        entry = self._index.get(key)
+        if entry is None or self._buffer is None:
+            return None
+        start = self._data_offset + entry[0]
+        return bytes(self._buffer[start:start + entry[1]])
+
+    def status(self, key: str) -> Optional[str]:
+        """Entry status from the header index, without decoding the entry"""
+        if key in self._decoded:
+            value = self._decoded[key]
+            return value.get("status") if isinstance(value, dict) else None
+        entry = self._index.get(key)
+        return entry[2] if entry and len(entry) > 2 else None
+
+    def statuses(self) -> Iterator[Tuple[str, Optional[str]]]:
+        """(key, status) pairs for all entries without decoding them"""
+        for key in self:
+            yield key, self.status(key)
+
+    def release(self):
+        """
+        Prepare for the backing file being replaced. A mapped file cannot be
+        replaced on Windows, so there the buffer is copied into memory and the
+        mmap closed. Elsewhere the mapping stays valid after the replace (the
+        old file lives on until unmapped) and nothing is copied; see remap().
+        """
+        if os.name == "nt" and isinstance(self._buffer, mmap.mmap):
+            mapped = self._buffer
+            self._buffer = mapped[:]
+            mapped.close()
+
+    def remap(self, path: str, use_mmap: bool = True):
+        """
+        Back the map by the indexed file just written from it (by
+        encode_indexed) instead of the file it was read from
+
+        Args:
+            path: The rewritten file
+            use_mmap: Map the file instead of reading it into memory
+        """
+        _, written = read_indexed(path, use_mmap=use_mmap)
+        previous = self._buffer
+        self._buffer, self._data_offset, self._index = written._buffer, written._data_offset, written._index
+        if isinstance(previous, mmap.mmap):
+            previous.close()
+
+
+def read_indexed(path: str, use_mmap: bool = True) -> Tuple[Dict[str, Any], IndexedStoryMap]:
+    """
+    Read the header of an indexed cache file
+
+    Args:
+        path: File path
+        use_mmap: Map the file instead of reading it into memory
+
+    Returns:
+        (metadata, IndexedStoryMap) - entries are decoded on access
+
+    Raises:
+        CodecError if the file is not a valid indexed cache file
+        OSError if the file cannot be read
+    """
+    with open(path, 'rb') as f:
+        buffer = None
+        if use_mmap:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                buffer = None  # Empty file or mmap unsupported
+        if buffer is None:
+            buffer = f.read()
+
+    prefix_end = len(INDEX_MAGIC) + _HEADER_LEN.size
+    if len(buffer) < prefix_end or not is_indexed(bytes(buffer[:len(INDEX_MAGIC)])):
+        raise cache_codec.CodecError("Not an indexed cache file")
+
+    (header_len,) = _HEADER_LEN.unpack(buffer[len(INDEX_MAGIC):prefix_end])
+    try:
+        header = json.loads(bytes(buffer[prefix_end:prefix_end + header_len]))
+    except ValueError as e:
+        raise cache_codec.CodecError(f"Corrupt cache index: {e}") from e
+
+    stories = IndexedStoryMap(buffer, prefix_end + header_len, header.get("index", {}))
+    return header.get("metadata", {}), stories
+
+
+def encode_indexed(metadata: Dict[str, Any], stories, codec: str = "auto") -> bytes:
+    """
+    Encode metadata and story entries into the indexed layout
+
+    Args:
+        metadata: Cache metadata
+        stories: dict or IndexedStoryMap of story_id -> entry
+        codec: cache_codec name used for entries that must be (re-)encoded
+
+    Returns:
+        File contents
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for key in stories:
+        blob = stories.raw(key) if isinstance(stories, IndexedStoryMap) else None
+        if blob is None:
+            blob = cache_codec.encode(stories[key], codec)
+        status = stories.status(key) if isinstance(stories, IndexedStoryMap) else stories[key].get("status")
+        index[key] = [offset, len(blob), status]
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = json.dumps({"metadata": metadata, "index": index}, separators=(",", ":")).encode("utf-8")
+    return INDEX_MAGIC + _HEADER_LEN.pack(len(header)) + header + b"".join(blobs)
@@ -0,0 +1,156 @@
+"""
+BMAD Dash - Bootstrap/Sync Instrumentation
+Per-phase wall time, call counts and slowest stories for bootstrap and sync
+runs, kept in per-kind ring buffers (see /api/perf/bootstrap)
+
+Phases timed inside the evidence thread pool (git correlation, test discovery,
+static counts, test execution) are summed across worker threads, so their
+totals can exceed the run's wall time; compare them with each other, and the
+run's total_ms with the sequential phases.
+"""
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from ..config import Config
+
+# Slowest (phase, story) samples kept per run
+MAX_OUTLIERS = 10
+
+
+class PerfRun:
+    """
+    Timings for one bootstrap or sync run
+
+    Usage:
+        run = PerfRun("bootstrap", project_root)
+        with run.phase("parse_project"):
+            ...
+        with run.phase("git_correlation", story_id="5.4"):
+            ...
+        perf_log.record(run.finish(stories=12))
+    """
+
+    def __init__(self, kind: str, project_root: str):
+        """
+        Args:
+            kind: Run kind ("bootstrap", "sync")
+            project_root: Path to project root directory
+        """
+        self.kind = kind
+        self.project_root = os.path.abspath(project_root)
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._phases: Dict[str, Dict[str, Any]] = {}
+        self._outliers: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def phase(self, name: str, story_id: Optional[str] = None):
+        """Time a block as one call of `name` (attributed to story_id, if given)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, story_id)
+
+    def add(self, name: str, seconds: float, story_id: Optional[str] = None):
+        """Record one call of a phase that was timed elsewhere"""
+        ms = seconds * 1000
+        with self._lock:
+            entry = self._phases.setdefault(name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["calls"] += 1
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            if story_id is not None:
+                self._outliers.append({"phase": name, "story_id": story_id, "ms": round(ms, 3)})
+                if len(self._outliers) > MAX_OUTLIERS * 4:
+                    self._trim_outliers()
+
+    def _trim_outliers(self):
+        self._outliers.sort(key=lambda o: o["ms"], reverse=True)
+        del self._outliers[MAX_OUTLIERS:]
+
+    def finish(self, **summary) -> Dict[str, Any]:
+        """
+        Close the run
+
+        Args:
+            **summary: Extra run-level fields (e.g., stories, cache_hits)
+
+        Returns:
+            Report dict: kind, project_root, started_at, total_ms, phases, outliers, plus summary
+        """
+        total_ms = (time.perf_counter() - self._start) * 1000
+        with self._lock:
+            self._trim_outliers()
+            phases = {
+                name: {"calls": e["calls"], "total_ms": round(e["total_ms"], 3), "max_ms": round(e["max_ms"], 3)}
+                for name, e in self._phases.items()
+            }
+            outliers = list(self._outliers)
+        report = {
+            "kind": self.kind,
+            "project_root": self.project_root,
+            "started_at": self.started_at.isoformat(),
+            "total_ms": round(total_ms, 3),
+            "phases": phases,
+            "outliers": outliers
+        }
+        report.update(summary)
+        return report
+
+
+@contextmanager
+def timed(run: Optional[PerfRun], name: str, story_id: Optional[str] = None):
+    """PerfRun.phase that does nothing when run is None"""
+    if run is None:
+        yield
+    else:
+        with run.phase(name, story_id):
+            yield
+
+
+class PerfLog:
+    """Process-wide ring buffers of finished run reports, one per run kind"""
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = max(1, size or Config.PERF_HISTORY)
+        self._lock = threading.Lock()
+        self._runs: Dict[str, Deque[Dict[str, Any]]] = {}
+
+    def record(self, report: Dict[str, Any]):
+        with self._lock:
+            runs = self._runs.setdefault(report["kind"], deque(maxlen=self.size))
+            runs.append(report)
+
+    def snapshot(self, kind: Optional[str] = None, project_root: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Recorded runs, newest first
+
+        Args:
+            kind: Only this run kind (default: all kinds)
+            project_root: Only runs for this project root
+
+        Returns:
+            Dict of kind -> list of run reports
+        """
+        if project_root is not None:
+            project_root = os.path.abspath(project_root)
+        with self._lock:
+            kinds = [kind] if kind else list(self._runs)
+            return {
+                k: [r for r in reversed(self._runs.get(k, ())) if project_root is None or r["project_root"] == project_root]
+                for k in kinds
+            }
+
+    def reset(self):
+        with self._lock:
+            self._runs.clear()
+
+
+perf_log = PerfLog()
@@ -0,0 +1,105 @@
+"""
+BMAD Dash - Single-Flight Request Coalescing
+Concurrent callers of the same computation, keyed by (project_root, operation,
+...), wait on the one in-flight execution and share its result (or exception)
+
+Keys only live while a computation runs: a call made after it finished starts
+a new one. Never call do() while holding a lock the computation itself needs -
+a follower holding it would deadlock the leader.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def flight_key(project_root: str, operation: str, *parts: Hashable) -> Tuple[Hashable, ...]:
+    """Key for an operation on a project (the root is made absolute)"""
+    return (os.path.abspath(project_root), operation) + parts
+
+
+class SingleFlight:
+    """
+    Usage:
+        state = single_flight.do(flight_key(root, "bootstrap"), lambda: cache.bootstrap(root))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._executed: Dict[str, int] = {}
+        self._shared: Dict[str, int] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for the running call with the same key
+
+        Args:
+            key: Computation key (see flight_key)
+            fn: Computation; runs in the first caller's thread
+
+        Returns:
+            fn's result (the leader's result for followers)
+
+        Raises:
+            Whatever fn raised, in the leader and all followers
+        """
+        operation = self._operation(key)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self._executed[operation] = self._executed.get(operation, 0) + 1
+                leader = True
+            else:
+                self._shared[operation] = self._shared.get(operation, 0) + 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._flights
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-operation counts of executions and of callers that shared one"""
+        with self._lock:
+            return {
+                operation: {"executed": executed, "shared": self._shared.get(operation, 0)}
+                for operation, executed in self._executed.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._executed.clear()
+            self._shared.clear()
+
+    @staticmethod
+    def _operation(key: Hashable) -> str:
+        if isinstance(key, tuple) and len(key) > 1:
+            return str(key[1])
+        return str(key)
+
+
+single_flight = SingleFlight()
@@ -2,11 +2,11 @@
 BMAD Dash - Story Test Count Parser
 Parses test counts from story markdown files
 """
-import os
 import re
-import glob
 import logging
 from typing import Optional, Dict
+from backend.parsers.story_tokenizer import load_story_document
+from backend.utils.artifact_index import ArtifactIndex
 
 logger = logging.getLogger(__name__)
 
@@ -50,62 +50,31 @@ def parse_test_counts_from_story_file(story_id: str, project_root: str) -> Optio
         logger.debug(f"Invalid story_id format: {story_id}")
         return None
 
-    # Convert "1.3" to "1-3" for filename
-    story_key = normalized.replace('.', '-')
-
-    # Search for story file
-    possible_paths = [
-        os.path.join(project_root, "_bmad-output", "implementation-artifacts", f"{story_key}-*.md"),
-        os.path.join(project_root, "_bmad-output", "implementation", f"{story_key}-*.md"),
-        os.path.join(project_root, "stories", f"{story_key}-*.md"),
-    ]
-
-    story_file = None
-    for pattern in possible_paths:
-        matches = glob.glob(pattern)
-        if matches:
-            story_file = matches[0]
-            break
+    # Search for story file (implementation-artifacts, implementation, stories)
+    story_file = ArtifactIndex.for_project(project_root).story_file(normalized)
 
     if not story_file:
         logger.debug(f"Story file not found for {story_id}")
         return None
 
     try:
-        with open(story_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-
-        # Look for test count patterns like:
-        # "22/22 passing" or "Tests: 22/22" or "Test Results: 22/22 passing"
-        patterns = [
-            r'(\d+)/(\d+)\s+passing',            # "22/22 passing"
-            r'passing\s*\((\d+)/(\d+)',          # "passing (22/22 tests)"
-            r'Tests?:\s*(\d+)/(\d+)',            # "Tests: 22/22"
-            r'Test Results?:\s*(\d+)/(\d+)',     # "Test Results: 22/22"
-            r'All\s+(\d+)\s+tests?\s+passing',   # "All 101 tests passing"
-            r'(\d+)\s+tests?,\s*all passing',    # "22 tests, all passing"
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 2:
-                    passing = int(match.group(1))
-                    total = int(match.group(2))
-                    failing = total - passing
-                else:
-                    # Pattern like "22 tests, all passing"
-                    passing = int(match.group(1))
-                    total = passing
-                    failing = 0
-
-                logger.info(f"Parsed test counts from story file {story_id}: {passing}/{total}")
-                return {
-                    "pass_count": passing,
-                    "fail_count": failing,
-                    "total_tests": total,
-                    "status": "green" if failing == 0 else "red"
-                }
+        document = load_story_document(story_file)
+
+        # Test count lines ("22/22 passing", "Tests: 22/22", "All 101 tests passing", ...)
+        # are collected by the shared tokenizer; take the highest-priority match
+        best = document.sections.best_test_count()
+        if best:
+            passing = best.pass_count
+            total = best.total
+            failing = total - passing
+
+            logger.info(f"Parsed test counts from story file {story_id}: {passing}/{total}")
+            return {
+                "pass_count": passing,
+                "fail_count": failing,
+                "total_tests": total,
+                "status": "green" if failing == 0 else "red"
+            }
 
         logger.debug(f"No test count patterns found in story file {story_id}")
         return None
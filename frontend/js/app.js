@@ -173,7 +173,8 @@ function setupRoutes() {
  * @returns {Promise<Object>} Dashboard data
  */
 async function fetchDashboardData(projectRoot) {
-    const url = `/api/dashboard?project_root=${encodeURIComponent(projectRoot)}`;
+    // progressive=1: a cold project returns its skeleton at once, evidence is streamed (views/dashboard.js)
+    const url = `/api/dashboard?project_root=${encodeURIComponent(projectRoot)}&progressive=1`;
 
     const response = await fetch(url);
 
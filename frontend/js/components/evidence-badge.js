@@ -29,6 +29,16 @@ export function renderBadgesFromData(containerId, evidenceData, storyId, project
     const container = document.getElementById(containerId);
     if (!container) return;
 
+    // Evidence still being collected by a progressive bootstrap (streamed in later)
+    if (evidenceData.pending) {
+        container.className = 'mt-3 flex gap-2 animate-pulse';
+        container.innerHTML = `
+            <div class="h-6 w-20 bg-bmad-surface rounded"></div>
+            <div class="h-6 w-20 bg-bmad-surface rounded"></div>
+        `;
+        return;
+    }
+
     // Pass the full rich evidence data directly
     // Check for commits array, commit_count, or status field to determine if git evidence exists
     const gitData = (evidenceData.commits || evidenceData.commit_count !== undefined || evidenceData.status) ? evidenceData : null;
@@ -44,26 +54,49 @@ export function renderBadgesFromData(containerId, evidenceData, storyId, project
  * @param {string} projectRoot - Project root path
  */
 export async function updateBadges(containerId, storyId, projectRoot) {
-    const container = document.getElementById(containerId);
-    if (!container) return;
-
-    try {
-        // Fetch evidences in parallel
-        const [gitRes, testRes, reviewRes] = await Promise.all([
-            fetch(`/api/git-evidence/${storyId}?project_root=${encodeURIComponent(projectRoot)}`),
-            fetch(`/api/test-evidence/${storyId}?project_root=${encodeURIComponent(projectRoot)}`),
-            fetch(`/api/review-evidence/${storyId}?project_root=${encodeURIComponent(projectRoot)}`)
-        ]);
+    return updateBadgesBatch([{ containerId, storyId }], projectRoot);
+}
 
-        const gitData = gitRes.ok ? await gitRes.json() : null;
-        const testData = testRes.ok ? await testRes.json() : null;
-        const reviewData = reviewRes.ok ? await reviewRes.json() : null;
+/**
+ * Fetch git/test/review evidence for many badge containers in one request
+ * (POST /api/evidence/batch) and render each of them
+ * @param {Array<{containerId: string, storyId: string}>} targets - Badge containers to fill
+ * @param {string} projectRoot - Project root path
+ */
+export async function updateBadgesBatch(targets, projectRoot) {
+    const pending = targets.filter(t => document.getElementById(t.containerId));
+    if (pending.length === 0) return;
 
-        renderBadges(container, gitData, testData, reviewData, storyId, projectRoot);
+    try {
+        const response = await fetch('/api/evidence/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                project_root: projectRoot,
+                story_ids: [...new Set(pending.map(t => t.storyId))],
+                types: ['git', 'test', 'review']
+            })
+        });
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const { results } = await response.json();
+
+        // Entries carrying an "error" are rendered like a failed single-story fetch
+        const ok = (entry) => (entry && !entry.error ? entry : null);
+        pending.forEach(({ containerId, storyId }) => {
+            const container = document.getElementById(containerId);
+            if (!container) return;
+            const evidence = results[storyId] || {};
+            renderBadges(container, ok(evidence.git), ok(evidence.test), ok(evidence.review), storyId, projectRoot);
+        });
 
     } catch (error) {
         console.error('Failed to load evidence badges:', error);
-        container.innerHTML = `<div class="text-xs text-red-400">Failed to load evidence</div>`;
+        pending.forEach(({ containerId }) => {
+            const container = document.getElementById(containerId);
+            if (container) container.innerHTML = `<div class="text-xs text-red-400">Failed to load evidence</div>`;
+        });
     }
 }
 
@@ -7,6 +7,16 @@ let modalContainer = null;
 let modalContent = null;
 let currentAbortController = null;
 
+// Commits fetched per page; the next page loads when the list is scrolled
+// within COMMIT_SCROLL_MARGIN pixels of its end
+const COMMIT_PAGE_SIZE = 20;
+const COMMIT_SCROLL_MARGIN = 200;
+const COMMIT_MORE_HTML = `
+    <div data-commit-more class="flex justify-center py-3">
+        <div class="animate-spin rounded-full h-5 w-5 border-b-2 border-bmad-purple"></div>
+    </div>
+`;
+
 /**
  * Initialize the modal component
  * Creates the DOM structure if it doesn't exist
@@ -84,19 +94,24 @@ export async function openGitEvidence(storyId, projectRoot, preFetchedData = nul
         return;
     }
 
-    showLoading();
-    try {
-        if (currentAbortController) currentAbortController.abort();
-        currentAbortController = new AbortController();
-
-        const response = await fetch(`/api/git-evidence/${storyId}?project_root=${encodeURIComponent(projectRoot)}`, {
-            signal: currentAbortController.signal
-        });
+    // Summary-only evidence (dashboard payload): show the header right away,
+    // then fetch commits page by page
+    if (preFetchedData && preFetchedData.commit_count !== undefined) {
+        renderGitContent({ ...preFetchedData, commits: [], total_count: preFetchedData.commit_count, has_more: true });
+    } else {
+        showLoading();
+    }
 
-        if (!response.ok) throw new Error('Failed to fetch evidence');
+    if (currentAbortController) currentAbortController.abort();
+    currentAbortController = new AbortController();
+    const signal = currentAbortController.signal;
 
-        const data = await response.json();
+    try {
+        const data = await fetchCommitPage(storyId, projectRoot, null, signal);
         renderGitContent(data);
+        if (data.has_more) {
+            attachCommitPager(storyId, projectRoot, data.next_cursor, signal);
+        }
     } catch (error) {
         if (error.name !== 'AbortError') {
             renderError(error.message);
@@ -104,6 +119,60 @@ export async function openGitEvidence(storyId, projectRoot, preFetchedData = nul
     }
 }
 
+/**
+ * Fetch one page of a story's commits (with file lists)
+ * @param {string} storyId - Story ID
+ * @param {string} projectRoot - Project root path
+ * @param {string|null} cursor - next_cursor of the previous page
+ * @param {AbortSignal} signal - Abort signal of the open modal
+ * @returns {Promise<Object>} Page with commits, total_count, next_cursor, has_more
+ */
+async function fetchCommitPage(storyId, projectRoot, cursor, signal) {
+    const params = new URLSearchParams({ project_root: projectRoot, limit: COMMIT_PAGE_SIZE, expand: 'files' });
+    if (cursor) params.set('cursor', cursor);
+
+    const response = await fetch(`/api/git-evidence/${storyId}?${params}`, { signal });
+    if (!response.ok) throw new Error('Failed to fetch evidence');
+    return response.json();
+}
+
+/**
+ * Load the next page of commits whenever the list is scrolled near its end
+ */
+function attachCommitPager(storyId, projectRoot, cursor, signal) {
+    const list = document.getElementById('git-commit-list');
+    if (!list) return;
+
+    let nextCursor = cursor;
+    let loading = false;
+
+    const loadMore = async () => {
+        if (loading || !nextCursor || signal.aborted) return;
+        if (list.scrollTop + list.clientHeight < list.scrollHeight - COMMIT_SCROLL_MARGIN) return;
+
+        loading = true;
+        try {
+            const page = await fetchCommitPage(storyId, projectRoot, nextCursor, signal);
+            list.querySelector('[data-commit-more]')?.remove();
+            list.insertAdjacentHTML('beforeend', page.commits.map(renderCommit).join(''));
+            nextCursor = page.has_more ? page.next_cursor : null;
+            if (nextCursor) {
+                list.insertAdjacentHTML('beforeend', COMMIT_MORE_HTML);
+                loadMore(); // Short pages may not fill the list
+            } else {
+                list.removeEventListener('scroll', loadMore);
+            }
+        } catch (error) {
+            if (error.name !== 'AbortError') console.error('Failed to load more commits:', error);
+        } finally {
+            loading = false;
+        }
+    };
+
+    list.addEventListener('scroll', loadMore);
+    loadMore();
+}
+
 /**
  * Open the modal and load Test evidence
  * @param {string} storyId - Story ID to fetch evidence for
@@ -145,7 +214,8 @@ export async function openTestEvidence(storyId, projectRoot, preFetchedData = nu
  * @param {Object} data - Git evidence data
  */
 function renderGitContent(data) {
-    if (!data.commits || data.commits.length === 0) {
+    const total = data.total_count !== undefined ? data.total_count : (data.commits || []).length;
+    if (total === 0) {
         modalContent.innerHTML = `
             <div class="text-center py-8">
                 <div class="text-bmad-gray-light text-xl mb-2">No Commits Found</div>
@@ -155,20 +225,6 @@ function renderGitContent(data) {
         return;
     }
 
-    const commitsHTML = data.commits.map(commit => `
-        <div class="border-l-2 border-bmad-purple pl-4 mb-4 last:mb-0 relative">
-            <div class="absolute -left-[5px] top-1.5 w-2 h-2 rounded-full bg-bmad-purple"></div>
-            <div class="flex justify-between items-start mb-1">
-                <div class="font-mono text-xs text-bmad-purple-light">${commit.sha.substring(0, 7)}</div>
-                <div class="text-xs text-bmad-muted" title="${commit.timestamp}">${formatRelativeTime(commit.timestamp)}</div>
-            </div>
-            <div class="text-bmad-text text-sm font-medium mb-1">${escapeHtml(commit.message)}</div>
-            <div class="text-xs text-bmad-muted">
-                ${commit.files_changed} file${commit.files_changed !== 1 ? 's' : ''} changed
-            </div>
-        </div>
-    `).join('');
-
     modalContent.innerHTML = `
         <div class="space-y-4">
             <div class="flex items-center justify-between pb-4 border-b border-bmad-gray">
@@ -180,12 +236,32 @@ function renderGitContent(data) {
                 </div>
                 <div class="text-right">
                     <div class="text-sm text-bmad-muted">Commits Detected</div>
-                    <div class="font-mono text-xl text-white">${data.commits.length}</div>
+                    <div class="font-mono text-xl text-white">${total}</div>
                 </div>
             </div>
-            <div class="max-h-[60vh] overflow-y-auto pr-2 custom-scrollbar">
-                ${commitsHTML}
+            <div id="git-commit-list" class="max-h-[60vh] overflow-y-auto pr-2 custom-scrollbar">
+                ${(data.commits || []).map(renderCommit).join('')}
+                ${data.has_more ? COMMIT_MORE_HTML : ''}
+            </div>
+        </div>
+    `;
+}
+
+function renderCommit(commit) {
+    const files = Array.isArray(commit.files_changed) ? commit.files_changed.length : null;
+    return `
+        <div class="border-l-2 border-bmad-purple pl-4 mb-4 last:mb-0 relative">
+            <div class="absolute -left-[5px] top-1.5 w-2 h-2 rounded-full bg-bmad-purple"></div>
+            <div class="flex justify-between items-start mb-1">
+                <div class="font-mono text-xs text-bmad-purple-light">${commit.sha.substring(0, 7)}</div>
+                <div class="text-xs text-bmad-muted" title="${commit.timestamp}">${formatRelativeTime(commit.timestamp)}</div>
             </div>
+            <div class="text-bmad-text text-sm font-medium mb-1">${escapeHtml(commit.message)}</div>
+            ${files !== null ? `
+                <div class="text-xs text-bmad-muted">
+                    ${files} file${files !== 1 ? 's' : ''} changed
+                </div>
+            ` : ''}
         </div>
     `;
 }
@@ -6,12 +6,63 @@
 
 import { render as renderBreadcrumb } from '../components/breadcrumb.js';
 import { render as renderQuickGlance } from '../components/quick-glance.js';
-import { getBadgesSkeletonHTML, renderBadgesFromData } from '../components/evidence-badge.js';
+import { getBadgesSkeletonHTML, renderBadgesFromData, updateBadgesBatch } from '../components/evidence-badge.js';
 import { renderActionCard, attachActionCardListeners } from '../components/action-card.js';
 import { render as renderCacheStatus, attachListeners as attachCacheListeners } from '../components/cache-status.js';
 import { getBMADSync } from '../components/bmad-sync.js';
 import { openStoryDetail } from '../components/story-modal.js';
 
+// EventSource of the progressive bootstrap currently being displayed
+let evidenceStream = null;
+
+/**
+ * Subscribe to streamed evidence while the backend is still bootstrapping
+ * Updates the story objects (so re-renders keep the evidence) and their badges,
+ * then reloads the project once the bootstrap completes (gap warnings, inferred tasks)
+ * @param {Object} data - Dashboard data from API
+ * @param {Array} allStories - Flattened kanban stories
+ * @param {string} projectRoot - Project root path
+ */
+function streamBootstrapEvidence(data, allStories, projectRoot) {
+    if (evidenceStream) {
+        evidenceStream.close();
+        evidenceStream = null;
+    }
+    if (!data.bootstrap?.in_progress || !data.bootstrap.stream_url) return;
+
+    const storiesById = new Map(allStories.map(story => [story.id, story]));
+    const source = new EventSource(data.bootstrap.stream_url);
+    evidenceStream = source;
+
+    source.onmessage = (event) => {
+        let message;
+        try {
+            message = JSON.parse(event.data);
+        } catch (e) {
+            console.error('Invalid evidence stream event:', e);
+            return;
+        }
+
+        if (message.type === 'evidence') {
+            const story = storiesById.get(message.story_id);
+            if (story) story.evidence = message.evidence;
+            data.bootstrap.completed = message.completed;
+            renderBadgesFromData(`board-badges-${message.story_id}`, message.evidence, message.story_id, projectRoot);
+        } else if (message.type === 'complete') {
+            source.close();
+            if (evidenceStream === source) evidenceStream = null;
+            if (message.error) console.error('Bootstrap failed:', message.error);
+            const loadButton = document.getElementById('load-project-btn');
+            if (loadButton) loadButton.click();
+        }
+    };
+
+    source.onerror = () => {
+        // EventSource reconnects on its own (resuming after Last-Event-ID)
+        console.warn('Evidence stream interrupted, reconnecting...');
+    };
+}
+
 /**
  * Render the Dashboard View
  * @param {Object} data - Dashboard data from API
@@ -57,19 +108,24 @@ export async function render(data) {
     const bmadSync = getBMADSync();
     bmadSync.init(projectRoot).catch(err => console.error('BMAD sync init failed:', err));
 
-    // Initialize badges for all stories using pre-fetched evidence data
+    // Initialize badges for all stories using pre-fetched evidence data;
+    // stories shipped without any are fetched together in one batch request
+    const missingEvidence = [];
     allStories.forEach(story => {
         // Update Board Card badge
         const boardBadgeId = `board-badges-${story.id}`;
         if (document.getElementById(boardBadgeId)) {
-            renderBadgesFromData(
-                boardBadgeId,
-                story.evidence || {},
-                story.id,
-                projectRoot
-            );
+            if (story.evidence && Object.keys(story.evidence).length > 0) {
+                renderBadgesFromData(boardBadgeId, story.evidence, story.id, projectRoot);
+            } else {
+                missingEvidence.push({ containerId: boardBadgeId, storyId: story.id });
+            }
         }
     });
+    updateBadgesBatch(missingEvidence, projectRoot);
+
+    // Progressive bootstrap: fill in badges as evidence arrives
+    streamBootstrapEvidence(data, allStories, projectRoot);
 
     // Attach delegated click listener for story cards
     container.addEventListener('click', (e) => {
@@ -126,7 +182,6 @@ function renderStoryCard(story, projectRoot) {
     // However, usually current story is "in-progress".
     // Let's render it in both places but use a slightly different logic for the ID if needed?
     // Actually, document.getElementById returns the first one. 
-    // updateBadges does not support multiple targets yet.
     // To handle this, let's just make the ID unique in the board: 'board-badges-{id}'
     // And we update both loops.
 
@@ -140,9 +195,11 @@ function renderStoryCard(story, projectRoot) {
         formattedEpic = epicStr.startsWith('epic-') ? epicStr : `epic-${epicStr}`;
     }
 
-    const totalTasks = story.tasks ? story.tasks.length : 0;
-    const officialDone = story.tasks ? story.tasks.filter(t => t.status === 'done' && !t.inferred).length : 0;
-    const inferredDone = story.tasks ? story.tasks.filter(t => t.inferred).length : 0;
+    // Prefer server-side counters (lazy stories ship no task items on the board)
+    const counts = story.task_counts;
+    const totalTasks = counts ? counts.total : (story.tasks ? story.tasks.length : 0);
+    const inferredDone = counts ? counts.inferred : (story.tasks ? story.tasks.filter(t => t.inferred).length : 0);
+    const officialDone = counts ? counts.done - inferredDone : (story.tasks ? story.tasks.filter(t => t.status === 'done' && !t.inferred).length : 0);
     const totalDone = officialDone + inferredDone;
 
     let progressHtml = '';
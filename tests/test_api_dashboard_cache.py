@@ -18,3 +18,351 @@ def test_dashboard_returns_cache_age(client):
     assert response.status_code == 200
     data = response.get_json()
     assert 'cache_age_ms' in data
+
+def test_evidence_stream_without_bootstrap_completes_immediately(client):
+    """The SSE endpoint sends only the complete event when nothing is bootstrapping"""
+    response = client.get('/api/dashboard/evidence-stream?project_root=.')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    body = response.get_data(as_text=True)
+    assert body.startswith('data: ') and '"type": "complete"' in body
+
+def test_dashboard_etag_answers_304_until_state_changes(client, tmp_path):
+    """If-None-Match with the current generation skips building the response"""
+    from unittest.mock import patch
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    url = f'/api/dashboard?project_root={tmp_path}'
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+    assert etag and not etag.startswith('W/')
+
+    with patch('backend.api.dashboard.build_dashboard_response') as build:
+        cached = client.get(url, headers={'If-None-Match': etag})
+        build.assert_not_called()
+    assert cached.status_code == 304
+    assert cached.headers['ETag'] == etag
+
+    state_cache = ProjectStateCache.for_project(str(tmp_path))
+    with state_cache.lock:
+        state_cache.update_story("1.1", {"title": "Renamed"})
+    changed = client.get(url, headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+def test_dashboard_view_is_built_once_per_generation(client, tmp_path):
+    """Repeated polls share one view model; a state change rebuilds it"""
+    from unittest.mock import patch
+    from backend.api import dashboard
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    url = f'/api/dashboard?project_root={tmp_path}'
+
+    with patch('backend.api.dashboard.build_dashboard_response',
+               wraps=dashboard.build_dashboard_response) as build:
+        first = client.get(url).get_json()
+        second = client.get(url).get_json()
+        assert build.call_count == 1
+        assert second["kanban"] == first["kanban"]
+        assert "cache_age_ms" in second
+
+        state_cache = ProjectStateCache.for_project(str(tmp_path))
+        with state_cache.lock:
+            state_cache.update_story("1.1", {"title": "Renamed"})
+        third = client.get(url).get_json()
+        assert build.call_count == 2
+    assert third["kanban"]["in_progress"][0]["title"] == "Renamed"
+
+def test_dashboard_memo_holds_only_the_current_generation(client, tmp_path):
+    """Path spellings share one view; older generations' views are dropped"""
+    from unittest.mock import patch
+    from backend.api import dashboard
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    other_spelling = f"{tmp_path}/_bmad-output/.."
+
+    with patch('backend.api.dashboard.build_dashboard_response',
+               wraps=dashboard.build_dashboard_response) as build:
+        first = client.get(f'/api/dashboard?project_root={tmp_path}').get_json()
+        second = client.get(f'/api/dashboard?project_root={other_spelling}').get_json()
+        assert build.call_count == 1
+    assert first["project"]["root_path"] == str(tmp_path)
+    assert second["project"]["root_path"] == other_spelling
+
+    state_cache = ProjectStateCache.for_project(str(tmp_path))
+    client.get(f'/api/dashboard?project_root={tmp_path}&fields=commits')
+    with state_cache.lock:
+        assert len(state_cache._memo) == 2
+        state_cache.update_story("1.1", {"title": "Renamed"})
+        assert state_cache._memo == {}
+
+def test_dashboard_delta_returns_changed_stories_or_full_snapshot(client, tmp_path):
+    """Delta carries only changed stories; unknown generations fall back to a snapshot"""
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+        "  1-2-second: backlog\n"
+    )
+    base = client.get(f'/api/dashboard?project_root={tmp_path}').get_json()
+    delta_url = f'/api/dashboard/delta?project_root={tmp_path}&epoch={base["epoch"]}'
+
+    unchanged = client.get(f'{delta_url}&since={base["generation"]}').get_json()
+    assert unchanged["full"] is False
+    assert unchanged["stories"] == [] and unchanged["epics"] == []
+    assert "quick_glance" not in unchanged
+
+    state_cache = ProjectStateCache.for_project(str(tmp_path))
+    with state_cache.lock:
+        state_cache.update_story("1.2", {"title": "Renamed"})
+
+    delta = client.get(f'{delta_url}&since={base["generation"]}').get_json()
+    assert delta["full"] is False
+    assert delta["generation"] == base["generation"] + 1
+    assert [(s["story_id"], s["column"], s["title"]) for s in delta["stories"]] == [("1.2", "todo", "Renamed")]
+    assert [e["id"] for e in delta["epics"]] == ["epic-1"]
+    assert delta["epics"][0]["story_ids"] == ["1.1", "1.2"]
+    assert delta["counts"] == {"todo": 1, "in_progress": 1, "review": 0, "done": 0}
+    assert "quick_glance" in delta
+
+    stale_epoch = client.get(f'/api/dashboard/delta?project_root={tmp_path}&epoch=other&since=1').get_json()
+    assert stale_epoch["full"] is True and "kanban" in stale_epoch["snapshot"]
+    assert client.get(f'{delta_url}&since=0').get_json()["full"] is True  # Bootstrap replaced everything
+    assert client.get(f'{delta_url}&since=abc').status_code == 400
+
+def test_dashboard_sends_evidence_summaries_with_projection(client, tmp_path):
+    """Commit lists are left to the per-story endpoints unless requested"""
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    url = f'/api/dashboard?project_root={tmp_path}'
+    client.get(url)
+
+    commits = [{"sha": f"{i:040x}", "message": f"feat: 1.1 part {i}", "files_changed": ["a.py"]} for i in range(3)]
+    state_cache = ProjectStateCache.for_project(str(tmp_path))
+    with state_cache.lock:
+        state_cache.update_story("1.1", {"evidence": {
+            "commits": commits, "commit_count": 3, "status": "green",
+            "test_files": ["tests/test_a.py"], "failing_tests": ["test_x"], "tests_total": 2, "tests_passed": 1
+        }})
+
+    summary = client.get(url)
+    evidence = summary.get_json()["kanban"]["in_progress"][0]["evidence"]
+    assert evidence == {"commit_count": 3, "status": "green", "tests_total": 2, "tests_passed": 1,
+                        "failing_count": 1, "test_file_count": 1}
+
+    with_commits = client.get(f'{url}&fields=commits')
+    assert with_commits.get_json()["kanban"]["in_progress"][0]["evidence"]["commits"] == commits
+    assert with_commits.headers['ETag'] != summary.headers['ETag']
+
+    full = client.get(f'{url}&detail=full').get_json()["kanban"]["in_progress"][0]["evidence"]
+    assert full["failing_tests"] == ["test_x"] and len(full["commits"]) == 3
+    assert client.get(f'{url}&detail=everything').status_code == 400
+    assert client.get(f'{url}&fields=commits,x%22y').status_code == 400
+    assert client.get(f'/api/dashboard/delta?project_root={tmp_path}&since=0&fields=nope').status_code == 400
+
+def test_unknown_project_root_is_not_registered(client, tmp_path):
+    """Story details 404 for a missing root without creating a shared cache for it"""
+    from backend.services.project_state_cache import ProjectStateCache
+
+    missing = tmp_path / "no-such-project"
+    before = len(ProjectStateCache._instances)
+    assert client.get(f'/api/dashboard/story/1.1?project_root={missing}').status_code == 404
+    with pytest.raises(FileNotFoundError):
+        ProjectStateCache.for_project(str(missing))
+    assert len(ProjectStateCache._instances) == before
+
+def test_story_details_paginate_evidence_commits(client, tmp_path):
+    """Story details page through cached commits with cursors"""
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    client.get(f'/api/dashboard?project_root={tmp_path}')
+
+    commits = [{"sha": f"{i:040x}", "message": f"feat: 1.1 part {i}", "timestamp": f"2026-01-0{i + 1}T10:00:00",
+                "files_changed": ["a.py"]} for i in range(5)]
+    state_cache = ProjectStateCache.for_project(str(tmp_path))
+    with state_cache.lock:
+        state_cache.update_story("1.1", {"evidence": {"commits": commits, "commit_count": 5, "status": "green"}})
+
+    url = f'/api/dashboard/story/1.1?project_root={tmp_path}'
+    assert len(client.get(url).get_json()["evidence"]["commits"]) == 5
+
+    first = client.get(f'{url}&limit=2').get_json()["evidence"]
+    assert [c["sha"] for c in first["commits"]] == [commits[4]["sha"], commits[3]["sha"]]
+    assert "files_changed" not in first["commits"][0]
+    assert first["commits_page"]["total_count"] == 5 and first["commits_page"]["has_more"] is True
+
+    shas = [c["sha"] for c in first["commits"]]
+    cursor = first["commits_page"]["next_cursor"]
+    while cursor:
+        page = client.get(f'{url}&limit=2&expand=files&cursor={cursor}').get_json()["evidence"]
+        assert all(c["files_changed"] == ["a.py"] for c in page["commits"])
+        shas += [c["sha"] for c in page["commits"]]
+        cursor = page["commits_page"]["next_cursor"]
+    assert shas == [c["sha"] for c in reversed(commits)]
+
+    assert client.get(f'{url}&cursor=bogus').status_code == 400
+    assert client.get(f'{url}&limit=0').status_code == 400
+
+def test_dashboard_swr_serves_last_state_and_revalidates_stale_parts(client, tmp_path):
+    """?swr=1 answers immediately and reports per-part staleness while revalidating"""
+    import time
+    from git import Actor, Repo
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    (artifacts / "1-1-first.md").write_text("# Story 1.1: First\n\nStatus: in-progress\n")
+    repo = Repo.init(tmp_path)
+    author = Actor("Test Author", "test@example.com")
+    repo.index.add([str(artifacts / "1-1-first.md")])
+    repo.index.commit("feat(story-1.1): start", author=author, committer=author)
+
+    state_cache = ProjectStateCache.for_project(str(tmp_path))
+    url = f'/api/dashboard?project_root={tmp_path}&swr=1'
+
+    def settle():
+        deadline = time.time() + 10
+        while state_cache.bootstrap_in_progress or state_cache.revalidating(str(tmp_path)):
+            assert time.time() < deadline
+            time.sleep(0.02)
+
+    cold = client.get(url).get_json()
+    assert cold["freshness"]["mode"] == "stale-while-revalidate"
+    settle()
+
+    warm = client.get(url)
+    parts = warm.get_json()["freshness"]["parts"]
+    assert not any(report["stale"] for report in parts.values())
+    assert warm.get_etag()[0].endswith('-swr:fresh')
+    settle()
+
+    repo.index.commit("feat(story-1.1): more work", author=author, committer=author)
+    stale = client.get(url).get_json()
+    assert stale["freshness"]["parts"]["git"] == {
+        "stale": True, "reason": "refs-changed", "age_ms": stale["freshness"]["parts"]["git"]["age_ms"]
+    }
+    assert stale["freshness"]["revalidating"] is True
+    settle()
+
+    with state_cache.lock:
+        assert len(state_cache.get_story("1.1").evidence["commits"]) == 2
+    fresh = client.get(url).get_json()
+    assert not fresh["freshness"]["parts"]["git"]["stale"]
+    settle()
+
+def test_dashboard_without_swr_has_no_freshness(client, tmp_path):
+    """The blocking mode stays the default"""
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text("development_status:\n  epic-1: backlog\n")
+
+    data = client.get(f'/api/dashboard?project_root={tmp_path}').get_json()
+    assert "freshness" not in data
+
+def test_dashboard_swr_read_does_not_wait_for_a_running_revalidation(client, tmp_path):
+    """Evidence is collected without the state lock: reads return while git/tests run"""
+    import threading
+    import time
+    from unittest.mock import patch
+    from git import Actor, Repo
+    from backend.services.evidence_collector import EvidenceCollector
+    from backend.services.project_state_cache import ProjectStateCache
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    (artifacts / "1-1-first.md").write_text("# Story 1.1: First\n\nStatus: in-progress\n")
+    repo = Repo.init(tmp_path)
+    author = Actor("Test Author", "test@example.com")
+    repo.index.add([str(artifacts / "1-1-first.md")])
+    repo.index.commit("feat(story-1.1): start", author=author, committer=author)
+
+    root = str(tmp_path)
+    state_cache = ProjectStateCache.for_project(root)
+    url = f'/api/dashboard?project_root={tmp_path}&swr=1'
+
+    def settle():
+        deadline = time.time() + 10
+        while state_cache.bootstrap_in_progress or state_cache.revalidating(root):
+            assert time.time() < deadline
+            time.sleep(0.02)
+
+    client.get(url)
+    settle()
+    repo.index.commit("feat(story-1.1): more work", author=author, committer=author)
+
+    collecting, release = threading.Event(), threading.Event()
+    collect_git = EvidenceCollector.collect_git
+
+    def slow_collect_git(self, story, evidence):
+        collecting.set()
+        release.wait(10)
+        collect_git(self, story, evidence)
+
+    with patch.object(EvidenceCollector, 'collect_git', slow_collect_git):
+        client.get(url)  # Starts the revalidation
+        assert collecting.wait(5)
+
+        started = time.time()
+        during = client.get(url).get_json()
+        assert time.time() - started < 2
+        assert during["freshness"]["revalidating"] is True
+        assert during["freshness"]["parts"]["git"]["stale"] is True
+        assert state_cache.revalidating(root)
+
+        release.set()
+        settle()
+
+    with state_cache.lock:
+        assert len(state_cache.get_story("1.1").evidence["commits"]) == 2
+    assert not client.get(url).get_json()["freshness"]["parts"]["git"]["stale"]
@@ -0,0 +1,118 @@
+"""
+Integration tests for the batched evidence endpoint (POST /api/evidence/batch)
+"""
+import pytest
+from unittest.mock import patch
+from git import Actor, Repo
+from backend.app import create_app
+from backend.services.git_correlator import GitCorrelator
+
+
+@pytest.fixture
+def client():
+    """Create test client"""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Git project with two stories, one code review and one (static) test file"""
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "1-1-first-story.md").write_text("# Story 1.1\n\nStatus: done\n")
+    (artifacts / "1-2-second-story.md").write_text("# Story 1.2\n\nStatus: review\n")
+    (artifacts / "code-review-1-1.md").write_text("# Code Review 1.1\n")
+
+    tests_dir = tmp_path / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_story_1_2.rs").write_text("#[test]\nfn a() {}\n#[test]\nfn b() {}\n")
+
+    repo = Repo.init(tmp_path)
+    author = Actor("Test Author", "test@example.com")
+    repo.index.add([str(artifacts / "1-1-first-story.md")])
+    repo.index.commit("feat(story-1.1): first story", author=author, committer=author)
+    repo.index.add([str(artifacts / "1-2-second-story.md")])
+    repo.index.commit("feat: stories 1.1 and 1.2", author=author, committer=author)
+    return tmp_path
+
+
+def _post(client, body):
+    return client.post('/api/evidence/batch', json=body)
+
+
+class TestEvidenceBatchAPI:
+    """Test suite for POST /api/evidence/batch"""
+
+    def test_batch_returns_keyed_results(self, client, project):
+        """Every requested story gets every requested evidence type"""
+        response = _post(client, {
+            "project_root": str(project),
+            "story_ids": ["1.1", "1.2", "9.9"],
+            "types": ["git", "test", "review"]
+        })
+
+        assert response.status_code == 200
+        results = response.get_json()["results"]
+        assert set(results) == {"1.1", "1.2", "9.9"}
+
+        assert len(results["1.1"]["git"]["commits"]) == 2
+        assert len(results["1.2"]["git"]["commits"]) == 1
+        assert results["1.1"]["git"]["status"] == "green"
+        assert results["9.9"]["git"]["commits"] == []
+
+        assert results["1.2"]["test"]["pass_count"] == 2
+        assert results["9.9"]["test"]["error"] == "StoryNotFound"
+        assert results["9.9"]["test"]["status"] == 404
+
+        assert results["1.1"]["review"]["status"] == "reviewed"
+        assert results["1.1"]["review"]["file"] == "code-review-1-1.md"
+        assert results["1.2"]["review"] == {"status": "pending"}
+
+    def test_batch_matches_single_story_endpoints(self, client, project):
+        """A batch entry is what the single-story endpoint returns"""
+        root = str(project)
+        results = _post(client, {"project_root": root, "story_ids": ["1.1"]}).get_json()["results"]
+
+        git = client.get(f'/api/git-evidence/1.1?project_root={root}').get_json()
+        review = client.get(f'/api/review-evidence/1.1?project_root={root}').get_json()
+        assert results["1.1"]["git"] == git
+        assert results["1.1"]["review"] == review
+
+    def test_batch_walks_history_once(self, client, project):
+        """Git evidence for all stories comes from a single history walk"""
+        with patch.object(GitCorrelator, 'get_commits_for_story', side_effect=AssertionError("per-story walk")):
+            with patch.object(GitCorrelator, 'get_commits_for_stories', autospec=True,
+                              side_effect=GitCorrelator.get_commits_for_stories) as walk:
+                response = _post(client, {
+                    "project_root": str(project),
+                    "story_ids": ["1.1", "1.2"],
+                    "types": ["git"]
+                })
+
+        assert response.status_code == 200
+        assert walk.call_count == 1
+        assert set(response.get_json()["results"]["1.2"]) == {"git"}
+
+    @pytest.mark.parametrize("body", [
+        None,
+        {"story_ids": ["1.1"]},
+        {"project_root": "/fake/repo"},
+        {"project_root": "/fake/repo", "story_ids": "1.1"},
+        {"project_root": "/fake/repo", "story_ids": ["1.1"], "types": ["git", "coverage"]},
+    ])
+    def test_batch_rejects_invalid_body(self, client, body):
+        """Malformed requests are 400s"""
+        response = _post(client, body)
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "ValueError"
+
+    def test_batch_size_limit(self, client):
+        """More than EVIDENCE_BATCH_MAX story IDs is rejected"""
+        with patch('backend.api.evidence_batch.Config.EVIDENCE_BATCH_MAX', 2):
+            response = _post(client, {"project_root": "/fake/repo", "story_ids": ["1.1", "1.2", "1.3"]})
+
+        assert response.status_code == 400
@@ -170,3 +170,28 @@ class TestGitEvidenceAPI:
         finally:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
+
+    def test_get_git_evidence_paginated(self, client, tmp_path):
+        """Test limit/cursor return pages with a total count and next cursor"""
+        from git import Actor, Repo
+
+        repo = Repo.init(tmp_path)
+        author = Actor("Test Author", "test@example.com")
+        for i in range(3):
+            (tmp_path / f"f{i}.py").write_text(f"# {i}\n")
+            repo.index.add([str(tmp_path / f"f{i}.py")])
+            repo.index.commit(f"feat(story-1.3): part {i}", author=author, committer=author)
+
+        url = f'/api/git-evidence/1.3?project_root={tmp_path}&limit=2&expand=files'
+        first = client.get(url).get_json()
+        assert first['total_count'] == 3 and first['has_more'] is True
+        assert len(first['commits']) == 2 and first['status'] == 'green'
+        assert first['commits'][0]['files_changed']
+
+        second = client.get(f"{url}&cursor={first['next_cursor']}").get_json()
+        assert len(second['commits']) == 1 and second['next_cursor'] is None
+        assert {c['sha'] for c in first['commits'] + second['commits']} == {c.hexsha for c in repo.iter_commits()}
+
+        response = client.get(f'/api/git-evidence/1.3?project_root={tmp_path}&cursor=nope')
+        assert response.status_code == 400
+        assert response.get_json()['error'] == 'InvalidParameter'
@@ -0,0 +1,77 @@
+"""
+BMAD Dash - Artifact Index Tests
+Tests for story / code-review file lookup from directory scans
+"""
+import os
+from unittest.mock import patch
+
+from backend.utils.artifact_index import ArtifactIndex
+
+
+def make_artifacts(tmp_path):
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "1-3-story-name.md").write_text("# Story 1.3")
+    (artifacts / "code-review-1-3.md").write_text("# Review")
+    (artifacts / "sprint-status.yaml").write_text("development_status: {}")
+    legacy = tmp_path / "stories"
+    legacy.mkdir()
+    (legacy / "2-1-legacy.md").write_text("# Story 2.1")
+    return artifacts
+
+
+class TestArtifactIndex:
+    """Test ArtifactIndex functionality"""
+
+    def test_story_and_review_lookup(self, tmp_path):
+        artifacts = make_artifacts(tmp_path)
+        index = ArtifactIndex(str(tmp_path))
+
+        assert index.story_file("1.3") == str(artifacts / "1-3-story-name.md")
+        assert index.story_file("story-1.3") == str(artifacts / "1-3-story-name.md")
+        assert index.story_file("2.1") == str(tmp_path / "stories" / "2-1-legacy.md")
+        assert index.story_file("9.9") is None
+        assert index.code_review_file("1.3") == str(artifacts / "code-review-1-3.md")
+        assert index.code_review_file("2.1") is None
+
+    def test_story_files_matches_story_pattern(self, tmp_path):
+        artifacts = make_artifacts(tmp_path)
+        index = ArtifactIndex(str(tmp_path))
+
+        names = [os.path.basename(p) for p in index.story_files()]
+        assert "1-3-story-name.md" in names
+        assert "sprint-status.yaml" not in names
+
+    def test_stat_info(self, tmp_path):
+        artifacts = make_artifacts(tmp_path)
+        index = ArtifactIndex(str(tmp_path))
+
+        entry = index.stat(index.story_file("1.3"))
+        assert entry.size == len("# Story 1.3")
+
+    def test_rescans_only_when_directory_changes(self, tmp_path):
+        artifacts = make_artifacts(tmp_path)
+        index = ArtifactIndex(str(tmp_path))
+        index.story_file("1.3")
+
+        with patch.object(ArtifactIndex, "_scan", wraps=ArtifactIndex._scan) as scan:
+            index.story_file("1.3")
+            index.code_review_file("1.3")
+            assert scan.call_count == 0
+
+            new_file = artifacts / "1-4-new.md"
+            new_file.write_text("# Story 1.4")
+            # Force a distinct directory mtime regardless of filesystem granularity
+            stat = os.stat(artifacts)
+            os.utime(artifacts, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert index.story_file("1.4") == str(new_file)
+            assert scan.call_count == 1
+
+    def test_missing_directories(self, tmp_path):
+        index = ArtifactIndex(str(tmp_path / "missing"))
+        assert index.story_file("1.1") is None
+        assert index.story_files() == []
+
+    def test_shared_instance_per_project(self, tmp_path):
+        assert ArtifactIndex.for_project(str(tmp_path)) is ArtifactIndex.for_project(str(tmp_path))
@@ -0,0 +1,97 @@
+"""
+BMAD Dash - Cache Codec Tests
+Tests for pluggable cache file serialization
+"""
+import json
+
+import pytest
+
+from backend.models.project_state import ProjectState
+from backend.utils import cache_codec
+from backend.services.smart_cache import SmartCache
+from backend.services.state_store import JSONStateStore
+
+DATA = {"stories": {"1.1": {"title": "Story", "evidence": {"commits": [{"sha": "abc"}], "healthy": True}}}}
+
+
+def test_json_codec_round_trip():
+    raw = cache_codec.encode(DATA, "json")
+    assert json.loads(raw) == DATA
+    assert cache_codec.decode(raw) == DATA
+
+
+def test_legacy_indented_json_still_loads():
+    assert cache_codec.decode(json.dumps(DATA, indent=2).encode("utf-8")) == DATA
+
+
+def test_orjson_codec_writes_plain_json():
+    pytest.importorskip("orjson")
+    raw = cache_codec.encode(DATA, "orjson")
+    assert json.loads(raw) == DATA
+
+
+@pytest.mark.parametrize("codec", ["msgpack", "msgpack+zstd"])
+def test_binary_codecs_carry_header(codec):
+    pytest.importorskip("msgpack")
+    if codec == "msgpack+zstd":
+        pytest.importorskip("zstandard")
+    raw = cache_codec.encode(DATA, codec)
+    assert raw.startswith(cache_codec.MAGIC)
+    assert cache_codec.decode(raw) == DATA
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgpack", "msgpack+zstd"])
+def test_non_string_keys_decode_like_json(codec):
+    if codec != "json":
+        pytest.importorskip("orjson" if codec == "orjson" else "msgpack")
+    if codec == "msgpack+zstd":
+        pytest.importorskip("zstandard")
+    data = {"workflow_validation": {1: "ok", 2.5: [{3: None}], True: "yes", None: "none"}}
+    expected = json.loads(json.dumps(data))
+    assert cache_codec.decode(cache_codec.encode(data, codec)) == expected
+
+
+def test_unencodable_data_raises_codec_error():
+    with pytest.raises(cache_codec.CodecError):
+        cache_codec.encode({"value": object()}, "json")
+    with pytest.raises(cache_codec.CodecError):
+        cache_codec.encode({(1, 2): "tuple key"}, "auto")
+
+
+def test_binary_state_store_does_not_write_json_file(tmp_path):
+    pytest.importorskip("msgpack")
+    json_path = tmp_path / "project-state.json"
+    json_path.write_text(json.dumps({"project": {"name": "legacy"}, "current": {}}))
+
+    store = JSONStateStore(str(json_path), codec="msgpack")
+    state = store.load()
+    assert state.project == {"name": "legacy"}
+
+    store.save(ProjectState(project={"name": "binary"}, current={}))
+    assert store.path == tmp_path / "project-state.msgpack"
+    assert store.path.read_bytes().startswith(cache_codec.MAGIC)
+    assert not json_path.exists()
+    assert JSONStateStore(str(json_path), codec="msgpack").load().project == {"name": "binary"}
+
+
+def test_invalid_data_raises_codec_error():
+    with pytest.raises(cache_codec.CodecError):
+        cache_codec.decode(b"not json")
+    with pytest.raises(cache_codec.CodecError):
+        cache_codec.decode(cache_codec.MAGIC + bytes([99]) + b"payload")
+
+
+def test_unknown_codec_falls_back():
+    assert cache_codec.available_codec("bogus") in ("json", "orjson")
+
+
+def test_smart_cache_reads_file_written_with_other_codec(tmp_path):
+    story = tmp_path / "story.md"
+    story.write_text("# Story")
+    writer = SmartCache(str(tmp_path), write_behind=False, codec="msgpack+zstd")
+    writer.set_story_evidence("1.1", str(story), "done", {"commits": 2}, "Story")
+
+    reader = SmartCache(str(tmp_path), codec="json")
+    evidence, hit = reader.get_story_evidence("1.1", str(story))
+    assert hit
+    assert evidence == {"commits": 2}
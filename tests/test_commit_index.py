@@ -0,0 +1,72 @@
+"""
+Unit tests for CommitIndex (paginated per-story commit lists)
+"""
+import pytest
+from unittest.mock import patch
+from git import Actor, Repo
+from backend.services.commit_index import CommitIndex, decode_cursor, encode_cursor, paginate
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with five commits for story 1.1 and one for story 2.1"""
+    repo = Repo.init(tmp_path)
+    author = Actor("Test Author", "test@example.com")
+    for i in range(5):
+        path = tmp_path / f"file_{i}.py"
+        path.write_text(f"# {i}\n")
+        repo.index.add([str(path)])
+        repo.index.commit(f"feat(story-1.1): part {i}", author=author, committer=author,
+                          author_date=f"2026-01-0{i + 1}T10:00:00", commit_date=f"2026-01-0{i + 1}T10:00:00")
+    (tmp_path / "other.py").write_text("# other\n")
+    repo.index.add([str(tmp_path / "other.py")])
+    repo.index.commit("feat(story-2.1): other", author=author, committer=author)
+    return repo
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor((1700000000, "abc"))) == (1700000000, "abc")
+    for bad in ("", "abc", "12.", "x.abc"):
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+
+
+def test_paginate_resumes_after_cursor():
+    items = [(5, "e"), (4, "d"), (4, "c"), (1, "a")]
+    page, cursor = paginate(items, lambda i: i, None, 2)
+    assert page == [(5, "e"), (4, "d")]
+    page, cursor = paginate(items, lambda i: i, cursor, 2)
+    assert page == [(4, "c"), (1, "a")] and cursor is None
+
+
+def test_pages_cover_story_commits_newest_first(repo):
+    index = CommitIndex(repo.working_dir)
+
+    first = index.page("1.1", limit=2)
+    assert first["total_count"] == 5 and first["has_more"] is True
+    assert [c["message"] for c in first["commits"]] == ["feat(story-1.1): part 4", "feat(story-1.1): part 3"]
+    assert "files_changed" not in first["commits"][0]
+
+    messages = [c["message"] for c in first["commits"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = index.page("1.1", cursor=cursor, limit=2, expand_files=True)
+        assert all(len(c["files_changed"]) == 1 for c in page["commits"])
+        messages += [c["message"] for c in page["commits"]]
+        cursor = page["next_cursor"]
+    assert messages == [f"feat(story-1.1): part {i}" for i in reversed(range(5))]
+
+
+def test_history_is_reindexed_only_when_head_moves(repo):
+    index = CommitIndex(repo.working_dir)
+    index.commits_for_story("1.1")
+
+    with patch.object(index.correlator.repo, 'iter_commits', wraps=index.correlator.repo.iter_commits) as walk:
+        index.commits_for_story("1.1")
+        index.commits_for_story("2.1")
+        assert walk.call_count == 0
+
+        author = Actor("Test Author", "test@example.com")
+        repo.index.commit("fix(story-1.1): follow-up", author=author, committer=author)
+        assert len(index.commits_for_story("1.1")) == 6
+        assert walk.call_count == 1
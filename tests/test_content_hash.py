@@ -0,0 +1,54 @@
+"""
+BMAD Dash - Content Fingerprint Tests
+Tests for content-hash based change detection
+"""
+import os
+from unittest.mock import patch
+
+from backend.utils import content_hash
+from backend.services.smart_cache import SmartCache
+
+
+def _bump_mtime(path, seconds=5):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_touch_keeps_hash_and_edit_changes_it(tmp_path):
+    path = tmp_path / "story.md"
+    path.write_text("# Story")
+    first = content_hash.fingerprint(str(path))
+
+    _bump_mtime(path)
+    changed, touched = content_hash.content_changed(str(path), first)
+    assert not changed
+    assert touched["mtime_ns"] != first["mtime_ns"]
+
+    # Same mtime, different size: still detected
+    stat = os.stat(path)
+    path.write_text("# Story, edited")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    changed, _ = content_hash.content_changed(str(path), touched)
+    assert changed
+
+
+def test_unchanged_stat_is_not_rehashed(tmp_path):
+    path = tmp_path / "story.md"
+    path.write_text("# Story")
+    stored = content_hash.fingerprint(str(path))
+
+    with patch.object(content_hash, "hash_file", side_effect=AssertionError("rehashed")):
+        assert content_hash.content_changed(str(path), stored) == (False, stored)
+
+
+def test_smart_cache_hit_survives_touch(tmp_path):
+    story = tmp_path / "story.md"
+    story.write_text("# Story")
+    cache = SmartCache(str(tmp_path), write_behind=False)
+    cache.set_story_evidence("1.1", str(story), "done", {"commits": 2}, "Story")
+
+    _bump_mtime(story)
+    assert cache.get_story_evidence("1.1", str(story)) == ({"commits": 2}, True)
+
+    story.write_text("# Story changed")
+    assert cache.get_story_evidence("1.1", str(story)) == (None, False)
@@ -0,0 +1,87 @@
+"""
+BMAD Dash - Evidence Collector Tests
+Tests for concurrent, per-story isolated evidence collection
+"""
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend.models.story import Story
+from backend.services.evidence_collector import EvidenceCollector
+
+
+def _stories(count):
+    return [Story(story_id=f"1.{i}", story_key=f"1-{i}-s", title=f"S{i}", status="done", epic=1)
+            for i in range(1, count + 1)]
+
+
+def test_collects_concurrently_in_order_with_isolated_failures():
+    stories = _stories(6)
+    threads = set()
+
+    def fake_collect(story):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05 if story.story_id == "1.1" else 0.01)
+        if story.story_id == "1.3":
+            raise RuntimeError("git exploded")
+        return {"story": story.story_id}
+
+    collector = EvidenceCollector("/tmp/project", max_workers=4)
+    with patch.object(collector, "collect", side_effect=fake_collect):
+        failures = collector.collect_all(stories)
+
+    assert failures == 1
+    assert len(threads) > 1
+    assert stories[0].evidence == {"story": "1.1"}
+    assert stories[2].evidence["commit_count"] == 0  # default evidence for the failed story
+    assert [s.evidence.get("story") for s in stories] == ["1.1", "1.2", None, "1.4", "1.5", "1.6"]
+
+
+def test_each_thread_gets_its_own_git_correlator():
+    collector = EvidenceCollector("/tmp/project", max_workers=2)
+    with patch("backend.services.git_correlator.GitCorrelator", side_effect=lambda root: object()):
+        main = collector.git_correlator
+        assert collector.git_correlator is main
+        other = []
+        worker = threading.Thread(target=lambda: other.append(collector.git_correlator))
+        worker.start()
+        worker.join()
+    assert other[0] is not main
+
+
+class _TaskCommitCorrelator:
+    """Git correlator stub: one commit that completes Task 2"""
+
+    def __init__(self, root):
+        pass
+
+    def get_commits_for_story(self, story_id):
+        return [SimpleNamespace(message="feat: Task 2 second", timestamp=datetime(2026, 1, 2),
+                                to_dict=lambda: {"sha": "abc"})]
+
+    def calculate_status(self, commits):
+        return "active", None
+
+    def extract_task_references(self, message):
+        return [2]
+
+
+def test_git_task_inference_updates_an_unloaded_lazy_story(tmp_path):
+    story_file = tmp_path / "1-1-lazy.md"
+    story_file.write_text("## Tasks\n\n- [x] Task 1: First\n- [ ] Task 2: Second\n- [ ] Task 3: Third\n")
+    story = Story.from_dict({"story_id": "1.1", "story_key": "1-1-lazy", "title": "Lazy", "status": "in-progress",
+                             "epic": 1, "file_path": str(story_file), "tasks": {"done": 1, "total": 3}})
+    assert not story.details_loaded
+
+    collector = EvidenceCollector(str(tmp_path))
+    evidence = {}
+    with patch("backend.services.git_correlator.GitCorrelator", _TaskCommitCorrelator):
+        collector.collect_git(story, evidence)
+
+    assert evidence["commit_count"] == 1
+    assert not story.details_loaded  # Still lazy, with the inference in its counters
+    assert story.task_progress() == {"done": 2, "total": 3, "inferred": 1, "inferred_ids": ["task-2"]}
+    assert [t.status for t in story.with_details().tasks] == ["done", "done", "todo"]
+
@@ -0,0 +1,46 @@
+"""
+BMAD Dash - Evidence Stream Tests
+Tests for the progressive bootstrap event log and its subscribers
+"""
+import threading
+
+from backend.services.evidence_stream import EvidenceStream
+
+
+def test_late_subscriber_replays_events_and_resumes_after_id():
+    stream = EvidenceStream(total=2)
+    stream.publish("1.1", {"commit_count": 1})
+    stream.publish("1.2", {"commit_count": 2})
+    stream.close()
+
+    events = list(stream.subscribe())
+    assert [seq for seq, _ in events] == [1, 2, 3]
+    assert [event["type"] for _, event in events] == ["evidence", "evidence", "complete"]
+    assert events[1][1]["completed"] == 2 and events[1][1]["total"] == 2
+
+    resumed = list(stream.subscribe(after=2))
+    assert [event["type"] for _, event in resumed] == ["complete"]
+
+
+def test_subscriber_blocks_until_published_and_gets_keep_alives():
+    stream = EvidenceStream(total=1)
+    received = []
+
+    def consume():
+        for item in stream.subscribe(timeout=0.01):
+            received.append(item)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    threading.Event().wait(0.05)
+    stream.publish("1.1", {})
+    stream.close(error="boom")
+    stream.publish("1.2", {})  # Ignored after close
+    consumer.join(timeout=2)
+
+    assert not consumer.is_alive()
+    assert None in received  # Keep-alive ticks while waiting
+    events = [item[1] for item in received if item is not None]
+    assert [e["type"] for e in events] == ["evidence", "complete"]
+    assert events[-1]["error"] == "boom"
+    assert stream.completed == 1
@@ -0,0 +1,99 @@
+"""
+BMAD Dash - File Lock Tests
+Tests for advisory reader/writer locks on cache files
+"""
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from backend.utils import file_lock
+from backend.utils.file_lock import FileLock, LockTimeout, get_lock_stats
+from backend.models.epic import Epic
+from backend.models.project_state import ProjectState
+from backend.models.story import Story
+from backend.services.smart_cache import SmartCache
+from backend.services.state_store import JSONStateStore
+
+pytestmark = pytest.mark.skipif(file_lock.fcntl is None, reason="shared locks require fcntl")
+
+
+def test_shared_locks_coexist_and_exclusive_times_out(tmp_path):
+    lock = FileLock(str(tmp_path / "a.lock"), timeout=0.05)
+    with lock.shared():
+        with lock.shared():
+            pass
+        with pytest.raises(LockTimeout):
+            with lock.exclusive():
+                pass
+
+    stats = get_lock_stats("a.lock")
+    assert stats["timeouts"] == 1
+    assert stats["contended"] >= 1
+
+
+def test_writer_waits_for_reader(tmp_path):
+    lock = FileLock(str(tmp_path / "b.lock"), timeout=2.0)
+    acquired = threading.Event()
+
+    def writer():
+        with lock.exclusive():
+            acquired.set()
+
+    with lock.shared():
+        thread = threading.Thread(target=writer)
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+    thread.join(2.0)
+    assert acquired.is_set()
+    assert get_lock_stats("b.lock")["wait_ms_max"] > 0
+
+
+def test_concurrent_smart_caches_do_not_lose_writes(tmp_path):
+    story = tmp_path / "story.md"
+    story.write_text("# Story")
+    worker_a = SmartCache(str(tmp_path), write_behind=False)
+    worker_b = SmartCache(str(tmp_path), write_behind=False)
+
+    worker_a.set_story_evidence("1.1", str(story), "done", {"commits": 1})
+    worker_b.set_story_evidence("1.2", str(story), "done", {"commits": 2})
+    worker_a.set_story_evidence("1.3", str(story), "done", {"commits": 3})
+
+    reader = SmartCache(str(tmp_path))
+    assert sorted(reader.get_done_story_ids()) == ["1.1", "1.2", "1.3"]
+
+
+def _update_story_in_other_process(path, story_id, status, barrier):
+    store = JSONStateStore(path, codec="json")
+    state = store.load()
+    barrier.wait(10)  # Both workers hold the same stale state before either saves
+    state.stories[story_id].status = status
+    store.save(state)
+
+
+def test_concurrent_state_stores_merge_story_changes(tmp_path):
+    path = str(tmp_path / "project-state.json")
+    stories = [Story(story_id=f"1.{i}", story_key=f"1-{i}-s", title=f"S{i}", status="ready-for-dev", epic=1)
+               for i in (1, 2)]
+    state = ProjectState(project={"name": "demo"}, current={},
+                         epics={"epic-1": Epic(epic_id="1", title="E", status="in-progress", stories=stories)},
+                         stories={s.story_id: s for s in stories})
+    JSONStateStore(path, codec="json").save(state)
+
+    barrier = multiprocessing.Barrier(2)
+    workers = [
+        multiprocessing.Process(target=_update_story_in_other_process, args=(path, sid, status, barrier))
+        for sid, status in (("1.1", "done"), ("1.2", "review"))
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(20)
+    assert [worker.exitcode for worker in workers] == [0, 0]
+
+    merged = JSONStateStore(path).load()
+    assert merged.stories["1.1"].status == "done"
+    assert merged.stories["1.2"].status == "review"
+    assert [s["status"] for s in merged.to_dict()["epics"]["epic-1"]["stories"]] == ["done", "review"]
@@ -0,0 +1,131 @@
+"""
+BMAD Dash - File Watcher Tests
+Tests for the dirty set that drives incremental sync
+"""
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.models.project_state import ProjectState
+from backend.services.file_watcher import EVIDENCE_GIT, EVIDENCE_TESTS, ProjectWatcher
+from backend.services.project_state_cache import ProjectStateCache
+
+
+@pytest.fixture
+def project(tmp_path):
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "1-1-first.md").write_text("# Story 1.1")
+    (artifacts / "sprint-status.yaml").write_text("development_status: {}\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / ".git" / "refs" / "heads").mkdir(parents=True)
+    return tmp_path
+
+
+@pytest.fixture
+def watcher(project):
+    watcher = ProjectWatcher(str(project), mode="polling", poll_interval=3600)
+    watcher.start()
+    yield watcher
+    watcher.stop()
+
+
+def _touch(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_first_drain_is_full_then_empty(watcher):
+    assert watcher.drain().full
+    assert watcher.drain().is_empty()
+
+
+def test_classifies_story_sprint_test_and_git_changes(project, watcher):
+    watcher.drain()
+    artifacts = project / "_bmad-output" / "implementation-artifacts"
+    _touch(artifacts / "1-1-first.md", "# Story 1.1 changed")
+    (artifacts / "code-review-2-3.md").write_text("review")
+    _touch(artifacts / "sprint-status.yaml", "development_status: {1-1-first: done}\n")
+    (project / "tests" / "test_story_1_1.py").write_text("def test_x(): pass")
+    (project / ".git" / "refs" / "heads" / "main").write_text("abc")
+    (artifacts / "project-state.json").write_text("{}")
+    watcher.poll()
+
+    dirty = watcher.drain()
+    assert dirty.story_ids == {"1.1", "2.3"}
+    assert dirty.reviews == {"2.3"}
+    assert dirty.sprint_status
+    assert dirty.evidence == {EVIDENCE_GIT, EVIDENCE_TESTS}
+    assert not dirty.full
+    assert watcher.take_state_change()
+    assert not watcher.take_state_change()
+
+
+def test_ignores_own_state_files_unrelated_artifacts_and_plain_source(project, watcher):
+    watcher.drain()
+    artifacts = project / "_bmad-output" / "implementation-artifacts"
+    for name in ("project-state.db", "project-state.db-wal", "project-state.db-shm", "project-state.db-journal"):
+        (artifacts / name).write_text("sqlite")
+    (artifacts / "retrospective-epic-1.md").write_text("notes")
+    (artifacts / "coverage.json").write_text("{}")
+    (project / "src" / "components").mkdir(parents=True)
+    (project / "src" / "components" / "Orb.tsx").write_text("export const Orb = 1")
+    watcher.poll()
+
+    assert watcher.drain().is_empty()
+    assert watcher.take_state_change()
+
+    (project / "src" / "components" / "Orb.test.tsx").write_text("it('renders', () => {})")
+    watcher.poll()
+    dirty = watcher.drain()
+    assert dirty.evidence == {EVIDENCE_TESTS}
+    assert not dirty.full
+
+
+def test_sync_without_changes_touches_no_files(project, watcher):
+    cache = ProjectStateCache(str(project / "_bmad-output" / "implementation-artifacts" / "project-state.json"))
+    cache.cache_data = ProjectState(project={}, current={}, epics={}, stories={})
+    cache.watcher = watcher
+    watcher.drain()
+    watcher.take_state_change()
+
+    with patch("os.stat", side_effect=AssertionError("filesystem access")), \
+            patch.object(cache.store, "exists", side_effect=AssertionError("filesystem access")):
+        assert cache.load_if_changed() is cache.cache_data
+        cache.sync(str(project))
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+def test_watchdog_watches_targets_created_after_start(tmp_path):
+    pytest.importorskip("watchdog")
+    watcher = ProjectWatcher(str(tmp_path), mode="auto")
+    watcher.start()
+    try:
+        assert watcher.backend == "watchdog"
+        watcher.drain()
+        watcher.take_state_change()
+
+        (tmp_path / "tests").mkdir()
+        (tmp_path / ".bmad-cache").mkdir()
+        # A new target is scheduled and the next sync sweeps (files may predate the watch)
+        assert _wait_for(lambda: watcher._dirty.full)
+        watcher.drain()
+        watcher.take_state_change()
+
+        (tmp_path / "tests" / "test_x.py").write_text("def test_x(): pass")
+        (tmp_path / ".bmad-cache" / "stories.json").write_text("{}")
+        assert _wait_for(lambda: EVIDENCE_TESTS in watcher._dirty.evidence and watcher._state_changed)
+        assert watcher.take_state_change()
+        assert watcher.drain().evidence == {EVIDENCE_TESTS}
+    finally:
+        watcher.stop()
+
@@ -0,0 +1,83 @@
+"""
+Unit tests for the per-part evidence freshness policies
+"""
+import os
+import time
+import pytest
+from git import Actor, Repo
+from backend.models.project_state import ProjectState
+from backend.models.story import Story
+from backend.services.freshness import FreshnessTracker
+
+
+def _bump(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path):
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "1-1-first.md").write_text("# Story 1.1\n")
+    test_file = tmp_path / "tests" / "test_story_1_1.py"
+    test_file.parent.mkdir()
+    test_file.write_text("def test_a(): pass\n")
+
+    repo = Repo.init(tmp_path)
+    author = Actor("Test Author", "test@example.com")
+    repo.index.add([str(artifacts / "1-1-first.md")])
+    repo.index.commit("feat(story-1.1): start", author=author, committer=author)
+    return tmp_path
+
+
+@pytest.fixture
+def state(project):
+    story = Story(story_id="1.1", title="First", status="in-progress", epic=1, story_key="1-1-first")
+    story.evidence = {"test_files": [str(project / "tests" / "test_story_1_1.py")]}
+    return ProjectState(project={}, current={}, epics={}, stories={"1.1": story})
+
+
+def _stale(tracker, state):
+    return {part: report["reason"] for part, report in tracker.check(state).items() if report["stale"]}
+
+
+def test_unrefreshed_parts_are_stale(project, state):
+    tracker = FreshnessTracker(str(project), test_ttl=0)
+    assert _stale(tracker, state) == {"git": "never-checked", "tests": "never-checked", "review": "never-checked"}
+
+    tracker.mark_fresh(tracker.signatures(state))
+    assert _stale(tracker, state) == {}
+
+
+def test_git_is_stale_after_a_ref_change(project, state):
+    tracker = FreshnessTracker(str(project), test_ttl=0)
+    tracker.mark_fresh(tracker.signatures(state))
+
+    author = Actor("Test Author", "test@example.com")
+    Repo(project).index.commit("feat(story-1.1): more", author=author, committer=author)
+    assert _stale(tracker, state) == {"git": "refs-changed"}
+
+
+def test_tests_are_stale_after_a_file_change_or_the_ttl(project, state):
+    tracker = FreshnessTracker(str(project), test_ttl=0)
+    tracker.mark_fresh(tracker.signatures(state))
+    _bump(project / "tests" / "test_story_1_1.py")
+    assert _stale(tracker, state) == {"tests": "files-changed"}
+
+    ttl_tracker = FreshnessTracker(str(project), test_ttl=60)
+    ttl_tracker.mark_fresh(ttl_tracker.signatures(state), at=time.monotonic() - 61)
+    assert _stale(ttl_tracker, state)["tests"] == "ttl-expired"
+
+
+def test_review_is_stale_only_when_code_reviews_change(project, state):
+    tracker = FreshnessTracker(str(project), test_ttl=0)
+    tracker.mark_fresh(tracker.signatures(state))
+    artifacts = project / "_bmad-output" / "implementation-artifacts"
+
+    (artifacts / "project-state.json").write_text("{}")  # Our own writes are no review change
+    assert _stale(tracker, state) == {}
+
+    (artifacts / "code-review-1-1.md").write_text("# Review\n")
+    assert _stale(tracker, state) == {"review": "reviews-changed"}
+    assert tracker.last_signature("review") == frozenset()
@@ -0,0 +1,64 @@
+"""
+BMAD Dash - Gap Detector Tests
+Tests for batched, evidence-based workflow gap detection
+"""
+from unittest.mock import Mock
+
+from backend.models.story import Story
+from backend.services.gap_detector import GapDetector
+
+
+def make_story(story_id, status="done", evidence=None, gaps=None, file_path=""):
+    return Story(
+        story_id=story_id,
+        story_key=f"{story_id.replace('.', '-')}-story",
+        title="Story",
+        status=status,
+        epic=int(story_id.split('.')[0]),
+        file_path=file_path,
+        workflow_history=[{"name": "dev-story"}, {"name": "code-review"}],
+        evidence=evidence if evidence is not None else {},
+        gaps=gaps or []
+    )
+
+
+def test_uses_collected_evidence_without_discovery(tmp_path):
+    discoverer = Mock()
+    detector = GapDetector(str(tmp_path), discoverer)
+
+    healthy = make_story("1.1", evidence={"test_files": ["t.py"], "tests_total": 4})
+    empty = make_story("1.2", evidence={"test_files": ["t.py"], "tests_total": 0})
+
+    assert detector.detect([healthy, empty]) == 1
+    assert healthy.gaps == []
+    assert empty.gaps[0]["type"] == "test-gap"
+    discoverer.discover_tests_for_story.assert_not_called()
+
+
+def test_manual_test_counts_in_story_file(tmp_path):
+    story_file = tmp_path / "1-1-story.md"
+    story_file.write_text("## Dev Notes\n\nTests: 12/12 passing\n")
+    detector = GapDetector(str(tmp_path), Mock())
+
+    story = make_story("1.1", evidence={"test_files": []}, file_path=str(story_file))
+    assert detector.detect([story]) == 0
+    assert story.gaps == []
+
+
+def test_discovers_once_per_story_without_evidence(tmp_path):
+    discoverer = Mock()
+    discoverer.discover_tests_for_story.return_value = ["t.py"]
+    discoverer.count_tests_static.return_value = 0
+    detector = GapDetector(str(tmp_path), discoverer)
+
+    story = make_story("2.1")
+    detector.detect([story])
+    detector.detect([story])  # idempotent: gap is not duplicated
+
+    assert [g["type"] for g in story.gaps] == ["test-gap"]
+
+
+def test_skips_stories_not_done():
+    story = make_story("3.1", status="review", gaps=[{"type": "missing-code-review"}])
+    GapDetector("/unused", Mock()).detect([story])
+    assert story.gaps == [{"type": "missing-code-review"}]
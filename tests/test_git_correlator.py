@@ -295,6 +295,35 @@ class TestGitCorrelator:
             assert elapsed_time < 200, f"Correlation took {elapsed_time:.2f}ms, exceeds 100ms requirement"
             assert len(commits) == 100
     
+    def test_get_commits_for_stories_single_walk(self):
+        """Test get_commits_for_stories walks history once and shares matching commits"""
+        shared = Mock()
+        shared.hexsha = "abc123"
+        shared.message = "feat: stories 1.3 and 1.4"
+        shared.author.name = "Test Author"
+        shared.committed_datetime = datetime.now()
+        shared.stats.files = {"a.py": {}}
+        only_13 = Mock()
+        only_13.hexsha = "def456"
+        only_13.message = "fix(story-1.3): Fix bug"
+        only_13.author.name = "Test Author"
+        only_13.committed_datetime = datetime.now()
+        only_13.stats.files = {}
+
+        with patch('backend.services.git_correlator.Repo') as MockRepo:
+            mock_repo = Mock()
+            mock_repo.iter_commits.return_value = [shared, only_13]
+            MockRepo.return_value = mock_repo
+
+            correlator = GitCorrelator("/fake/repo")
+            results = correlator.get_commits_for_stories(["1.3", "1.4", "2.1"])
+
+            assert mock_repo.iter_commits.call_count == 1
+            assert [c.sha for c in results["1.3"]] == ["abc123", "def456"]
+            assert [c.sha for c in results["1.4"]] == ["abc123"]
+            assert results["2.1"] == []
+            assert results["1.3"][0] is results["1.4"][0]
+
     def test_calculate_status_with_timezone_aware_datetime(self):
         """Test status calculation handles timezone-aware datetimes correctly"""
         from datetime import timezone
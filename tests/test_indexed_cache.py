@@ -0,0 +1,101 @@
+"""
+BMAD Dash - Indexed Cache Layout Tests
+Tests for the offset-indexed SmartCache file layout
+"""
+import json
+import mmap
+
+from backend.utils import cache_codec
+from backend.utils.indexed_cache import INDEX_MAGIC, IndexedStoryMap, encode_indexed, read_indexed
+from backend.services.smart_cache import SmartCache
+
+STORIES = {
+    "1.1": {"status": "done", "evidence": {"commits": 3}},
+    "1.2": {"status": "in-progress", "evidence": {"commits": 1}},
+}
+
+
+def _write(path, stories=STORIES, codec="json"):
+    path.write_bytes(encode_indexed({"cache_version": "2"}, stories, codec))
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "stories.json"
+    _write(path)
+    metadata, stories = read_indexed(str(path))
+    assert metadata == {"cache_version": "2"}
+    assert dict(stories) == STORIES
+    stories.release()
+
+
+def test_single_entry_read_does_not_decode_others(tmp_path, monkeypatch):
+    path = tmp_path / "stories.json"
+    _write(path)
+    _, stories = read_indexed(str(path), use_mmap=False)
+
+    decoded = []
+    real_decode = cache_codec.decode
+    monkeypatch.setattr(cache_codec, "decode", lambda raw: decoded.append(raw) or real_decode(raw))
+
+    assert stories["1.2"]["evidence"] == {"commits": 1}
+    assert len(decoded) == 1
+    assert dict(stories.statuses()) == {"1.1": "done", "1.2": "in-progress"}
+    assert len(decoded) == 1
+
+
+def test_rewrite_copies_untouched_entries_verbatim(tmp_path):
+    path = tmp_path / "stories.json"
+    _write(path, codec="json")
+    _, stories = read_indexed(str(path), use_mmap=False)
+    untouched = stories.raw("1.1")
+
+    stories["1.2"]["status"] = "done"
+    stories["1.3"] = {"status": "backlog"}
+    path.write_bytes(encode_indexed({"cache_version": "2"}, stories, "json"))
+
+    _, reread = read_indexed(str(path), use_mmap=False)
+    assert reread.raw("1.1") == untouched
+    assert reread.status("1.2") == "done"
+    assert reread["1.3"] == {"status": "backlog"}
+
+
+def test_save_remaps_instead_of_copying_the_mapped_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("backend.utils.indexed_cache.os.name", "posix")
+    story = tmp_path / "story.md"
+    story.write_text("# Story")
+    SmartCache(str(tmp_path), write_behind=False, layout="indexed").set_story_evidence(
+        "1.1", str(story), "done", {"commits": 2}, "Story")
+
+    cache = SmartCache(str(tmp_path), write_behind=False, layout="indexed")
+    assert cache.get_done_story_ids() == ["1.1"]
+    stories = cache._cache_data["stories"]
+    old_mapping = stories._buffer
+    assert isinstance(old_mapping, mmap.mmap)
+
+    cache.set_story_evidence("1.2", str(story), "review", {"commits": 1}, "Story 2")
+    # Not copied into memory: the old mapping is closed and the rewritten file mapped
+    assert old_mapping.closed
+    assert isinstance(stories._buffer, mmap.mmap) and stories._buffer is not old_mapping
+    assert cache_codec.decode(stories.raw("1.1"))["status"] == "done"
+    assert SmartCache(str(tmp_path), layout="indexed").get_story_evidence("1.1", str(story)) == ({"commits": 2}, True)
+
+
+def test_smart_cache_indexed_layout_and_legacy_fallback(tmp_path):
+    story = tmp_path / "story.md"
+    story.write_text("# Story")
+
+    legacy = SmartCache(str(tmp_path), write_behind=False, codec="json", layout="json")
+    legacy.set_story_evidence("1.1", str(story), "done", {"commits": 2}, "Story")
+    assert json.loads(legacy.cache_file.read_bytes())["stories"]["1.1"]["status"] == "done"
+
+    # An indexed writer loads the legacy document and rewrites it indexed
+    writer = SmartCache(str(tmp_path), write_behind=False, layout="indexed")
+    writer.set_story_evidence("1.2", str(story), "review", {"commits": 1}, "Story 2")
+    assert writer.cache_file.read_bytes().startswith(INDEX_MAGIC)
+
+    reader = SmartCache(str(tmp_path), layout="json")
+    assert reader.get_done_story_ids() == ["1.1"]
+    assert isinstance(reader._cache_data["stories"], IndexedStoryMap)
+    evidence, hit = reader.get_story_evidence("1.1", str(story))
+    assert hit
+    assert evidence == {"commits": 2}
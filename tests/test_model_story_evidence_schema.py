@@ -27,3 +27,33 @@ def test_story_tasks_structure():
     assert data["tasks"]["done"] == 1
     assert data["tasks"]["total"] == 2
     assert len(data["tasks"]["items"]) == 2
+
+def test_story_lazy_round_trip(tmp_path):
+    story_file = tmp_path / "1-1-lazy.md"
+    story_file.write_text("## Tasks\n\n- [x] Task 1: First\n- [ ] Task 2: Second\n  - [ ] Subtask\n")
+    story = Story(story_id="1.1", story_key="1-1-lazy", title="lazy", status="in-progress",
+                  epic=1, file_path=str(story_file))
+    story.tasks = [TaskModel(task_id="task-1", title="First", status="done"),
+                   TaskModel(task_id="task-2", title="Second", status="done", inferred=True)]
+
+    data = story.to_dict(include_tasks=False)
+    assert "items" not in data["tasks"]
+    assert data["tasks"]["inferred_ids"] == ["task-2"]
+
+    restored = Story.from_dict(data)
+    assert restored.details_loaded is False
+    assert restored.tasks == []
+    assert restored.task_progress()["done"] == 2
+
+    detailed = restored.with_details()
+    assert detailed is not restored
+    assert restored.details_loaded is False and restored.tasks == []  # Reads leave the lazy story untouched
+    assert detailed.with_details() is detailed
+    assert [t.task_id for t in detailed.tasks] == ["task-1", "task-2"]
+
+    restored.load_details()
+    assert restored.details_loaded is True
+    assert [t.task_id for t in restored.tasks] == ["task-1", "task-2"]
+    assert restored.tasks[1].status == "done"
+    assert restored.tasks[1].inferred is True
+    assert len(restored.tasks[1].subtasks) == 1
@@ -8,6 +8,7 @@ import tempfile
 from backend.parsers.yaml_parser import YAMLParser
 from backend.parsers.markdown_parser import MarkdownParser
 from backend.parsers.bmad_parser import BMADParser
+from backend.parsers.story_tokenizer import StoryTokenizer, load_story_document
 
 
 class TestYAMLParser:
@@ -148,6 +149,88 @@ class TestMarkdownParser:
         assert result['headings'] == []
 
 
+class TestStoryTokenizer:
+    """Test single-pass story section tokenizer"""
+    story_id = "1.1"
+    
+    STORY = """---
+story_id: "1.1"
+title: "Tokenized Story"
+---
+# Story 1.1
+
+## Acceptance Criteria
+
+### AC1: First
+**Given** a story
+**Then** it is tokenized
+
+## Tasks / Subtasks
+- [x] Task 1
+  - [ ] Subtask 1.1
+- [ ] Task 2
+
+## Dev Notes
+Tests: 3/4 passing
+All 5 tests passing
+"""
+    
+    def test_section_tree(self):
+        """Test headings are nested with section extents"""
+        sections = StoryTokenizer.tokenize(self.STORY)
+        texts = [h.text for h in sections.headings]
+        
+        assert texts == ["Story 1.1", "Acceptance Criteria", "AC1: First", "Tasks / Subtasks", "Dev Notes"]
+        ac_index = texts.index("Acceptance Criteria")
+        assert sections.children(ac_index) == [ac_index + 1]
+        assert sections.headings[ac_index + 1].parent == ac_index
+        # Frontmatter is excluded from body line numbering
+        assert sections.headings[0].line == 1
+    
+    def test_checkboxes_scoped_to_section(self):
+        """Test checkbox items carry indentation and section membership"""
+        sections = StoryTokenizer.tokenize(self.STORY)
+        tasks_index = sections.find_heading(lambda h: h.text.startswith("Tasks"))
+        items = sections.checkboxes_in(tasks_index)
+        
+        assert [(i.text, i.checked, i.indent > 0) for i in items] == [
+            ("Task 1", True, False),
+            ("Subtask 1.1", False, True),
+            ("Task 2", False, False),
+        ]
+    
+    def test_test_count_priority(self):
+        """Test the highest-priority test count pattern wins regardless of order"""
+        sections = StoryTokenizer.tokenize(self.STORY)
+        best = sections.best_test_count()
+        
+        assert (best.pass_count, best.total) == (3, 4)
+    
+    def test_document_cache_per_revision(self, tmp_path):
+        """Test tokenized documents are reused until the file changes"""
+        story_file = tmp_path / "1-1-tokenized.md"
+        story_file.write_text(self.STORY)
+        
+        first = load_story_document(str(story_file))
+        assert load_story_document(str(story_file)) is first
+        
+        story_file.write_text(self.STORY + "- [ ] Task 3\n")
+        second = load_story_document(str(story_file))
+        assert second is not first
+        assert len(second.sections.checkboxes) == 4
+    
+    def test_invalid_utf8_is_replaced(self, tmp_path):
+        """Test a story with bytes that are not UTF-8 still tokenizes"""
+        story_file = tmp_path / "1-1-latin1.md"
+        story_file.write_bytes(self.STORY.encode("utf-8") + "- [ ] Task 3: Caf\xe9\n".encode("latin-1"))
+        
+        document = load_story_document(str(story_file))
+        assert "Caf\ufffd" in document.content
+        assert len(document.sections.checkboxes) == 4
+        best = document.sections.best_test_count()
+        assert (best.pass_count, best.total) == (3, 4)
+
+
 class TestBMADParser:
     """Test main BMAD parser orchestrator"""
     story_id = "1.1"
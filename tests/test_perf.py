@@ -0,0 +1,72 @@
+"""
+BMAD Dash - Bootstrap/Sync Instrumentation Tests
+Tests for per-phase run timings, the ring buffer and /api/perf/bootstrap
+"""
+import threading
+
+import pytest
+
+from backend.app import create_app
+from backend.utils.perf import MAX_OUTLIERS, PerfLog, PerfRun, perf_log, timed
+
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    perf_log.reset()
+    yield app.test_client()
+    perf_log.reset()
+
+
+def test_run_aggregates_phases_across_threads_and_keeps_slowest_stories():
+    run = PerfRun("bootstrap", "/tmp/project")
+    with run.phase("parse_project"):
+        pass
+
+    def worker(offset):
+        for i in range(20):
+            run.add("git_correlation", (offset + i) / 1000, story_id=f"{offset}.{i}")
+
+    threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    with timed(None, "ignored"):
+        pass
+
+    report = run.finish(stories=60)
+    assert report["kind"] == "bootstrap" and report["stories"] == 60
+    assert report["phases"]["parse_project"]["calls"] == 1
+    assert report["phases"]["git_correlation"]["calls"] == 60
+    assert report["phases"]["git_correlation"]["max_ms"] == pytest.approx(219.0)
+    assert "ignored" not in report["phases"]
+    assert len(report["outliers"]) == MAX_OUTLIERS
+    assert report["outliers"][0] == {"phase": "git_correlation", "story_id": "200.19", "ms": 219.0}
+
+
+def test_log_is_a_ring_buffer_per_kind():
+    log = PerfLog(size=2)
+    for i in range(3):
+        log.record({"kind": "sync", "project_root": "/a", "n": i})
+    log.record({"kind": "bootstrap", "project_root": "/b", "n": 9})
+
+    runs = log.snapshot()
+    assert [r["n"] for r in runs["sync"]] == [2, 1]
+    assert [r["n"] for r in runs["bootstrap"]] == [9]
+    assert log.snapshot(project_root="/b")["sync"] == []
+
+
+def test_bootstrap_perf_endpoint(client):
+    run = PerfRun("bootstrap", ".")
+    with run.phase("state_save"):
+        pass
+    perf_log.record(run.finish())
+
+    data = client.get('/api/perf/bootstrap').get_json()
+    assert data["runs"]["sync"] == []
+    assert list(data["runs"]["bootstrap"][0]["phases"]) == ["state_save"]
+
+    assert client.get('/api/perf/bootstrap?kind=sync').get_json()["runs"] == {"sync": []}
+    assert client.get('/api/perf/bootstrap?kind=nope').status_code == 400
@@ -0,0 +1,156 @@
+"""
+Unit tests for the background evidence refresh scheduler
+"""
+import random
+import threading
+import pytest
+from unittest.mock import patch
+from git import Actor, Repo
+from backend.services.evidence_collector import EvidenceCollector
+from backend.services.project_state_cache import ProjectStateCache
+from backend.services.refresh_scheduler import BUDGET_RETRY_DELAY, RefreshBudget, RefreshScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Git project with one in-progress story"""
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    (artifacts / "1-1-first.md").write_text("# Story 1.1: First\n\nStatus: in-progress\n")
+    repo = Repo.init(tmp_path)
+    author = Actor("Test Author", "test@example.com")
+    repo.index.add([str(artifacts / "1-1-first.md")])
+    repo.index.commit("feat(story-1.1): start", author=author, committer=author)
+    return tmp_path
+
+
+def test_budget_limits_concurrency_and_time_share(clock):
+    budget = RefreshBudget(max_concurrent=1, share=0.25, clock=clock)
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+
+    budget.release(cost=2.0)  # 25% share: 2s of work buys 6s of rest
+    clock.now += 5.9
+    assert not budget.try_acquire()
+    clock.now += 0.1
+    assert budget.try_acquire()
+
+
+def test_tick_writes_stale_evidence_into_the_state_cache(project):
+    cache = ProjectStateCache(str(project / "_bmad-output" / "implementation-artifacts" / "project-state.json"))
+    with cache.lock:
+        cache.bootstrap(str(project), use_smart_cache=False)
+    scheduler = RefreshScheduler(interval=60, jitter=0, budget=RefreshBudget(1, 1.0))
+    scheduler.register(str(project), cache, start=False)
+    assert scheduler.tick(str(project)) == []  # Fresh since the bootstrap
+
+    author = Actor("Test Author", "test@example.com")
+    Repo(project).index.commit("feat(story-1.1): more work", author=author, committer=author)
+    generation = cache.generation
+
+    assert scheduler.tick(str(project)) == ["git"]
+    assert cache.generation > generation
+    assert len(cache.get_story("1.1").evidence["commits"]) == 2
+    assert scheduler.stats()[str(project)]["refreshes"] == 1
+
+
+def test_failures_back_off_and_success_resets(clock):
+    scheduler = RefreshScheduler(interval=10, jitter=0, max_backoff=35,
+                                 budget=RefreshBudget(1, 1.0, clock), clock=clock)
+    scheduler.register("/fake/repo", cache=None, start=False)
+
+    def next_in():
+        return scheduler.stats()["/fake/repo"]["next_in_ms"] / 1000
+
+    with patch.object(scheduler, '_refresh', side_effect=RuntimeError("git exploded")):
+        delays = []
+        for _ in range(3):
+            scheduler.tick("/fake/repo")
+            delays.append(next_in())
+    assert delays == [20, 35, 35]
+    assert scheduler.stats()["/fake/repo"]["last_error"] == "git exploded"
+
+    with patch.object(scheduler, '_refresh', return_value=[]):
+        scheduler.tick("/fake/repo")
+    assert next_in() == 10
+    assert scheduler.stats()["/fake/repo"]["failures"] == 0
+
+
+def test_exhausted_budget_defers_the_tick(clock):
+    budget = RefreshBudget(1, 1.0, clock)
+    scheduler = RefreshScheduler(interval=10, jitter=0, budget=budget, clock=clock)
+    scheduler.register("/fake/repo", cache=None, start=False)
+
+    assert budget.try_acquire()
+    with patch.object(scheduler, '_refresh', side_effect=AssertionError("ran over budget")):
+        assert scheduler.tick("/fake/repo") is None
+    assert scheduler.stats()["/fake/repo"]["next_in_ms"] == BUDGET_RETRY_DELAY * 1000
+
+
+def test_delays_are_jittered_within_bounds(clock):
+    scheduler = RefreshScheduler(interval=100, jitter=0.2, clock=clock, rng=random.Random(7))
+    for i in range(50):
+        scheduler.register(f"/fake/repo{i}", cache=None, start=False)
+
+    delays = [entry["next_in_ms"] / 1000 for entry in scheduler.stats().values()]
+    assert all(80 <= d <= 120 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_budget_acquire_waits_for_a_slot():
+    budget = RefreshBudget(max_concurrent=1, share=1.0)
+    assert budget.acquire(timeout=0.1)
+    assert not budget.ready()
+    assert not budget.acquire(timeout=0.05)
+
+    threading.Timer(0.05, budget.release, args=(0.0,)).start()
+    assert budget.acquire(timeout=2)
+
+
+def test_every_revalidation_takes_a_budget_slot(project):
+    """Revalidations started outside the scheduler (stale-while-revalidate) wait for the budget too"""
+    cache = ProjectStateCache(str(project / "_bmad-output" / "implementation-artifacts" / "project-state.json"))
+    with cache.lock:
+        cache.bootstrap(str(project), use_smart_cache=False)
+    author = Actor("Test Author", "test@example.com")
+    Repo(project).index.commit("feat(story-1.1): more work", author=author, committer=author)
+
+    budget = RefreshBudget(max_concurrent=1, share=1.0)
+    assert budget.try_acquire()  # Another refresh is running
+    collected = threading.Event()
+    collect_git = EvidenceCollector.collect_git
+
+    def tracking_collect_git(self, story, evidence):
+        collected.set()
+        collect_git(self, story, evidence)
+
+    with patch.object(EvidenceCollector, 'collect_git', tracking_collect_git):
+        worker = threading.Thread(target=cache.run_revalidation, args=(str(project), ["git"], budget))
+        worker.start()
+        assert not collected.wait(0.3)
+        with cache.lock:  # Waiting for the budget does not hold the state lock
+            assert len(cache.get_story("1.1").evidence["commits"]) == 1
+
+        budget.release(0.0)
+        worker.join(10)
+    assert collected.is_set()
+    assert len(cache.get_story("1.1").evidence["commits"]) == 2
+    assert budget.ready()
@@ -2,10 +2,12 @@ import pytest
 import os
 import json
 from pathlib import Path
+import threading
 import time
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 from backend.services.project_state_cache import ProjectStateCache
+from backend.services.state_store import SQLiteStateStore
 from backend.models.project_state import ProjectState
 from backend.models.story import Story
 from backend.models.epic import Epic
@@ -121,3 +123,282 @@ def test_bootstrap(cache_service):
         # Check last_commit format
         assert state.stories["1.1"].evidence["last_commit"] == "2026-01-01T00:00:00"
         assert state.stories["1.1"].evidence["tests_passed"] == 10
+
+def test_sync_sprint_status_reparses_only_changed_entries(tmp_path):
+    """sprint-status.yaml diff re-parses changed stories and keeps the rest in place"""
+    from backend.parsers.bmad_parser import BMADParser
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    status_file = artifacts / "sprint-status.yaml"
+    status_file.write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: done\n"
+        "  1-2-second: in-progress\n"
+    )
+
+    service = ProjectStateCache(str(artifacts / "project-state.json"))
+    first = Story(story_id="1.1", story_key="1-1-first", title="First", status="done", epic=1,
+                  evidence={"commit_count": 3})
+    second = Story(story_id="1.2", story_key="1-2-second", title="Second", status="in-progress", epic=1,
+                   evidence={"commit_count": 1})
+    service.cache_data = ProjectState(
+        project={}, current={},
+        epics={"epic-1": Epic(epic_id="1", title="Epic 1", status="in-progress", stories=[first, second])},
+        stories={"1.1": first, "1.2": second},
+        development_status={"epic-1": "in-progress", "1-1-first": "done", "1-2-second": "in-progress"}
+    )
+
+    status_file.write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: done\n"
+        "  1-2-second: review\n"
+        "  epic-2: backlog\n"
+        "  2-1-new: backlog\n"
+    )
+    parser = BMADParser(str(tmp_path))
+    with patch.object(parser, '_parse_story_file', wraps=parser._parse_story_file) as parse_story:
+        reparsed = service._sync_sprint_status(parser)
+
+    assert sorted(s.story_id for s in reparsed) == ["1.2", "2.1"]
+    assert parse_story.call_count == 2
+    state = service.cache_data
+    assert state.stories["1.1"] is first
+    assert state.stories["1.2"].status == "review"
+    assert state.stories["1.2"].evidence == {"commit_count": 1}
+    assert [s.story_id for s in state.epics["epic-2"].stories] == ["2.1"]
+    assert state.epics["epic-1"].progress == {"total": 2, "done": 1}
+    assert state.development_status["1-2-second"] == "review"
+
+def test_sqlite_backend_round_trip_and_incremental_save(tmp_path):
+    """SQLite store persists per-story rows and rewrites only changed stories"""
+    cache_path = tmp_path / "project-state.json"
+    service = ProjectStateCache(str(cache_path), state_backend="sqlite")
+    first = Story(story_id="1.1", story_key="1-1-a", title="A", status="done", epic=1)
+    second = Story(story_id="1.2", story_key="1-2-b", title="B", status="review", epic=1)
+    service.cache_data = ProjectState(
+        project={"name": "Test"}, current={},
+        epics={"epic-1": Epic(epic_id="1", title="Epic 1", status="in-progress", stories=[first, second])},
+        stories={"1.1": first, "1.2": second},
+        development_status={"1-1-a": "done"}
+    )
+    service.save()
+    assert service.cache_file.name == "project-state.db"
+    assert not cache_path.exists()
+
+    reloaded = ProjectStateCache(str(cache_path), state_backend="sqlite")
+    state = reloaded.load()
+    assert state.project["name"] == "Test"
+    assert state.development_status == {"1-1-a": "done"}
+    assert state.epics["epic-1"].stories[1] is state.stories["1.2"]
+
+    state.stories["1.2"].status = "done"
+    statements = []
+    connect = reloaded.store._connect
+
+    def traced_connect():
+        conn = connect()
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    with patch.object(reloaded.store, "_connect", side_effect=traced_connect):
+        reloaded.save()
+    story_writes = [sql for sql in statements if "INTO stories" in sql]
+    assert len(story_writes) == 1
+    assert "'1.2'" in story_writes[0]
+
+    assert ProjectStateCache(str(cache_path), state_backend="sqlite").load().stories["1.2"].status == "done"
+
+
+def test_sqlite_backend_removes_stories_without_prior_load(tmp_path):
+    """A store that never loaded still deletes rows missing from the saved state"""
+    cache_path = tmp_path / "project-state.json"
+    stories = [Story(story_id=f"1.{i}", story_key=f"1-{i}-s", title="S", status="done", epic=1) for i in (1, 2)]
+    SQLiteStateStore(str(cache_path)).save(ProjectState(
+        project={}, current={},
+        epics={"epic-1": Epic(epic_id="1", title="E1", status="done", stories=stories),
+               "epic-2": Epic(epic_id="2", title="E2", status="backlog")},
+        stories={s.story_id: s for s in stories}
+    ))
+
+    fresh = SQLiteStateStore(str(cache_path))
+    fresh.save(ProjectState(
+        project={}, current={},
+        epics={"epic-1": Epic(epic_id="1", title="E1", status="done", stories=stories[:1])},
+        stories={"1.1": stories[0]}
+    ))
+
+    state = SQLiteStateStore(str(cache_path)).load()
+    assert list(state.stories) == ["1.1"]
+    assert list(state.epics) == ["epic-1"]
+
+
+def test_sqlite_backend_imports_json_once(tmp_path):
+    """Existing project-state.json is imported into the SQLite store on first load"""
+    cache_path = tmp_path / "project-state.json"
+    json_service = ProjectStateCache(str(cache_path))
+    json_service.cache_data = ProjectState(
+        project={"name": "Legacy"}, current={}, epics={},
+        stories={"2.1": Story(story_id="2.1", story_key="2-1-x", title="X", status="done", epic=2)}
+    )
+    json_service.save()
+
+    sqlite_service = ProjectStateCache(str(cache_path), state_backend="sqlite")
+    state = sqlite_service.load()
+    assert state.project["name"] == "Legacy"
+    assert "2.1" in state.stories
+    assert sqlite_service.cache_file.exists()
+
+
+def test_for_project_shares_instance_and_reloads_on_external_change(tmp_path):
+    """Registry returns one live cache per root and reloads only when storage changes"""
+    shared = ProjectStateCache.for_project(str(tmp_path))
+    assert ProjectStateCache.for_project(str(tmp_path / ".")) is shared
+    assert shared.smart_cache is not None
+
+    shared.cache_data = ProjectState(project={"name": "Shared"}, current={}, epics={}, stories={})
+    shared.save()
+    state = shared.load_if_changed()
+
+    with patch.object(shared.store, "load", wraps=shared.store.load) as load:
+        assert shared.load_if_changed() is state
+        load.assert_not_called()
+
+        # Another worker rewrites the file
+        other = ProjectStateCache(str(shared.cache_file))
+        other.cache_data = ProjectState(project={"name": "Other"}, current={}, epics={}, stories={})
+        time.sleep(0.01)
+        other.save()
+        assert shared.load_if_changed().project["name"] == "Other"
+        load.assert_called_once()
+
+
+def test_progressive_bootstrap_serves_skeleton_then_streams_evidence(tmp_path):
+    """Skeleton is available at once; evidence arrives on the stream and is saved at the end"""
+    from backend.services.evidence_collector import EvidenceCollector
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: done\n"
+        "  1-2-second: in-progress\n"
+    )
+    service = ProjectStateCache(str(artifacts / "project-state.json"))
+    release = threading.Event()
+
+    def fake_collect(self, story):
+        release.wait(5)
+        return {"commit_count": 2, "story": story.story_id}
+
+    with patch.object(EvidenceCollector, "collect", fake_collect):
+        with service.lock:
+            stream = service.start_progressive_bootstrap(str(tmp_path))
+            assert service.start_progressive_bootstrap(str(tmp_path)) is stream
+            stories = service.cache_data.stories
+            assert sorted(stories) == ["1.1", "1.2"]
+            assert all(s.evidence["pending"] for s in stories.values())
+            assert service.bootstrap_in_progress
+            service.sync(str(tmp_path))  # No-op while the bootstrap owns the state
+            assert service.cache_data.stories is stories
+        release.set()
+        events = [item[1] for item in stream.subscribe(timeout=5) if item is not None]
+
+    assert [e["type"] for e in events] == ["evidence", "evidence", "complete"]
+    assert sorted(e["story_id"] for e in events[:2]) == ["1.1", "1.2"]
+    assert not service.bootstrap_in_progress
+    assert service.cache_data.stories["1.2"].evidence["commit_count"] == 2
+    saved = ProjectStateCache(str(artifacts / "project-state.json")).load()
+    assert saved.stories["1.1"].evidence["story"] == "1.1"
+
+
+def test_sync_records_phase_timings(tmp_path):
+    """A sync that reparses a story leaves a timing report in the perf log"""
+    from backend.utils.perf import perf_log
+
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "1-1-first.md").write_text("# Story 1.1: First\n\nStatus: in-progress\n")
+    service = ProjectStateCache(str(artifacts / "project-state.json"))
+    first = Story(story_id="1.1", story_key="1-1-first", title="First", status="in-progress", epic=1)
+    service.cache_data = ProjectState(
+        project={}, current={},
+        epics={"epic-1": Epic(epic_id="1", title="Epic 1", status="in-progress", stories=[first])},
+        stories={"1.1": first}
+    )
+    service.save()
+
+    perf_log.reset()
+    with patch("backend.services.evidence_collector.EvidenceCollector.collect_git"):
+        service.sync(str(tmp_path))
+
+    report = perf_log.snapshot("sync")["sync"][0]
+    assert report["reparsed"] == 1 and report["updated"]
+    assert report["phases"]["parse_story"]["calls"] == 1
+    assert "state_save" in report["phases"]
+    assert report["outliers"][0]["story_id"] == "1.1"
+
+
+def test_changes_since_unions_log_and_ages_out(tmp_path):
+    """The change log answers deltas until the generation falls out of it"""
+    from backend.services.project_state_cache import ChangeSet
+
+    with patch("backend.services.project_state_cache.Config.CHANGE_LOG_SIZE", 3):
+        service = ProjectStateCache(str(tmp_path / CACHE_FILE))
+    service.cache_data = ProjectState(project={}, current={}, epics={}, stories={})
+    start = service.generation
+
+    service.mark_changed(ChangeSet(story_ids={"1.1"}))
+    service.mark_changed(ChangeSet(story_ids={"1.2"}, epic_keys={"epic-1"}))
+    assert service.changes_since(start - 1) is None  # The load itself changed everything
+    assert service.changes_since(start).story_ids == {"1.1", "1.2"}
+    changes = service.changes_since(start + 1)
+    assert changes.story_ids == {"1.2"} and changes.epic_keys == {"epic-1"}
+    assert service.changes_since(service.generation).story_ids == set()
+    assert service.changes_since(service.generation + 1) is None
+
+    service.mark_changed(ChangeSet(story_ids={"1.3"}))
+    service.mark_changed(ChangeSet(story_ids={"1.4"}))
+    assert service.changes_since(start) is None  # Aged out of a 3-entry log
+    assert service.changes_since(start + 1).story_ids == {"1.2", "1.3", "1.4"}
+
+
+def test_concurrent_refresh_runs_one_bootstrap(tmp_path):
+    """Callers refreshing a cold project together share one bootstrap"""
+    artifacts = tmp_path / "_bmad-output" / "implementation-artifacts"
+    artifacts.mkdir(parents=True)
+    (artifacts / "sprint-status.yaml").write_text(
+        "development_status:\n"
+        "  epic-1: in-progress\n"
+        "  1-1-first: in-progress\n"
+    )
+    service = ProjectStateCache(str(artifacts / "project-state.json"))
+    started = threading.Event()
+    release = threading.Event()
+    real_bootstrap = ProjectStateCache.bootstrap
+    calls = []
+
+    def slow_bootstrap(self, project_root, use_smart_cache=True):
+        calls.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+        return real_bootstrap(self, project_root, use_smart_cache)
+
+    with patch.object(ProjectStateCache, "bootstrap", slow_bootstrap), \
+            patch.object(ProjectStateCache, "sync") as sync:
+        threads = [threading.Thread(target=service.refresh, args=(str(tmp_path),)) for _ in range(4)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.2)  # Followers decide "bootstrap" and wait on the in-flight one
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert len(calls) == 1
+    assert sync.call_count == 0
+    assert "1.1" in service.cache_data.stories
@@ -0,0 +1,82 @@
+"""
+Unit tests for single-flight request coalescing
+"""
+import threading
+import time
+import pytest
+from backend.utils.single_flight import SingleFlight, flight_key
+
+
+def _run_concurrently(flight, key, fn, callers=5):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    key = flight_key("/tmp/project", "bootstrap")
+    threads, results, errors = _run_concurrently(flight, key, compute)
+    time.sleep(0.1)
+    assert flight.in_flight(key)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert not errors and len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"bootstrap": {"executed": 1, "shared": 4}}
+    assert not flight.in_flight(key)
+
+
+def test_followers_receive_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def compute():
+        release.wait(5)
+        raise RuntimeError("git failed")
+
+    threads, results, errors = _run_concurrently(flight, ("root", "sync"), compute, callers=3)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert not results
+    assert len(errors) == 3 and all(str(e) == "git failed" for e in errors)
+
+
+def test_finished_flights_are_not_cached():
+    flight = SingleFlight()
+    calls = []
+    key = flight_key("/tmp/project", "test-evidence", "1.1")
+
+    assert flight.do(key, lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do(key, lambda: calls.append(1) or len(calls)) == 2
+    with pytest.raises(ValueError):
+        flight.do(key, lambda: int("x"))
+    assert flight.do(key, lambda: "ok") == "ok"
+
+
+def test_flight_key_normalizes_project_root(tmp_path):
+    assert flight_key(str(tmp_path / "a" / ".."), "sync") == flight_key(str(tmp_path), "sync")
+    assert flight_key(str(tmp_path), "validation", "1.1") != flight_key(str(tmp_path), "validation", "1.2")
@@ -9,6 +9,7 @@ import os
 import tempfile
 import time
 import unittest
+import unittest.mock
 from pathlib import Path
 
 from backend.services.smart_cache import SmartCache
@@ -353,5 +354,82 @@ class TestSmartCache(unittest.TestCase):
         self.assertIsNone(cached_evidence)
 
 
+class TestSmartCacheWriteBehind(unittest.TestCase):
+    """Test cases for SmartCache write-behind batching"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_root = Path(self.temp_dir)
+        self.story_file = self.project_root / "story.md"
+        self.story_file.write_text("# Story")
+    
+    def tearDown(self):
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+    
+    def _set(self, cache, story_id):
+        cache.set_story_evidence(story_id, str(self.story_file), "done", {"commits": 1}, "Story")
+    
+    def test_batch_writes_once(self):
+        """Mutations inside batch() produce a single save"""
+        cache = SmartCache(str(self.project_root), write_behind=False)
+        with unittest.mock.patch.object(cache, "_save_cache", wraps=cache._save_cache) as save:
+            with cache.batch():
+                for i in range(1, 51):
+                    self._set(cache, f"1.{i}")
+                self.assertEqual(save.call_count, 0)
+            self.assertEqual(save.call_count, 1)
+        
+        reloaded = SmartCache(str(self.project_root))
+        self.assertEqual(reloaded.get_cache_stats()["total_stories"], 50)
+    
+    def test_write_behind_defers_until_flush(self):
+        """Write-behind mode keeps mutations in memory until flush()"""
+        cache = SmartCache(str(self.project_root), write_behind=True, flush_interval=0)
+        self._set(cache, "1.1")
+        self.assertTrue(cache.has_pending_writes)
+        self.assertFalse(cache.cache_file.exists())
+        
+        cache.flush()
+        self.assertFalse(cache.has_pending_writes)
+        self.assertTrue(cache.cache_file.exists())
+    
+    def test_write_behind_debounce(self):
+        """Write-behind mode flushes after the debounce interval"""
+        cache = SmartCache(str(self.project_root), write_behind=True, flush_interval=0.05)
+        self._set(cache, "1.1")
+        self._set(cache, "1.2")
+        
+        deadline = time.time() + 2
+        while cache.has_pending_writes and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(cache.has_pending_writes)
+        self.assertTrue(cache.cache_file.exists())
+    
+    def test_pending_writes_flushed_at_shutdown(self):
+        """The atexit hook flushes write-behind caches with pending changes"""
+        from backend.services.smart_cache import _flush_pending_caches
+        cache = SmartCache(str(self.project_root), write_behind=True, flush_interval=0)
+        self._set(cache, "1.1")
+        
+        _flush_pending_caches()
+        self.assertTrue(cache.cache_file.exists())
+    
+    def test_pending_writes_of_dropped_cache_flushed_at_shutdown(self):
+        """A write-behind cache without a flush timer is kept alive until its changes are flushed"""
+        import gc
+        from backend.services.smart_cache import _flush_pending_caches
+        cache = SmartCache(str(self.project_root), write_behind=True, flush_interval=0)
+        self._set(cache, "1.1")
+        cache_file = cache.cache_file
+        del cache
+        gc.collect()
+        
+        _flush_pending_caches()
+        self.assertEqual(SmartCache(str(self.project_root)).get_cache_stats()["total_stories"], 1)
+        self.assertTrue(cache_file.exists())
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -512,6 +512,20 @@ class TestTestDiscovererEdgeCases:
         assert len(files) == 1
         assert "test_story_2_2" in files[0]
 
+    def test_cache_scans_reads_each_file_once(self, tmp_path):
+        """Test cache_scans memoizes test file contents across stories"""
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_module.py").write_text('"""Story 1.3 and Story 1.4"""\n')
+
+        discoverer = TestDiscoverer(str(tmp_path), cache_scans=True)
+        with patch.object(Path, 'read_text', autospec=True, side_effect=Path.read_text) as read_text:
+            files_13 = discoverer.discover_tests_for_story("1.3")
+            files_14 = discoverer.discover_tests_for_story("1.4")
+
+        assert files_13 == files_14 == [str(tests_dir / "test_module.py")]
+        assert read_text.call_count == 1
+
 
 class TestTestDiscovererLogging:
     """Logging verification tests for TestDiscoverer"""